@@ -0,0 +1,99 @@
+import os
+import time
+import threading
+
+import pytest
+
+from wwise_bankcache import BankCache, RemoteBankCache, RemoteCacheError, STALE_PART_SECONDS, cache_key
+from wwise_bankcache_server import make_server
+
+KEY = cache_key({"soundbank": "Main", "platform": "Windows"})
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = make_server(str(tmp_path / "server"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server):
+    return "http://%s:%d" % server.server_address[:2]
+
+
+def banks(root, files):
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return sorted(files)
+
+
+def part_files(root):
+    return [n for _, _, names in os.walk(root) for n in names if n.endswith(".part")]
+
+
+def test_remote_round_trip(tmp_path, server):
+    files = {"Windows/Main.bnk": b"BKHD" + os.urandom(4096), "Windows/SoundbanksInfo.json": b"{}"}
+    rel = banks(tmp_path / "out", files)
+    writer = BankCache(str(tmp_path / "a"), remote=RemoteBankCache(url(server)))
+    writer.store(KEY, str(tmp_path / "out"), rel)
+    assert writer.stats.get("remote_uploads") == 1
+
+    reader = BankCache(str(tmp_path / "b"), remote=RemoteBankCache(url(server)))
+    assert reader.contains(KEY)
+    restored = reader.restore(KEY, str(tmp_path / "restored"))
+    assert sorted(restored) == rel
+    for name, data in files.items():
+        assert (tmp_path / "restored" / name).read_bytes() == data
+    # now local: a second restore does not need the server
+    reader.remote = None
+    assert reader.restore(KEY, str(tmp_path / "again")) is not None
+
+
+def test_corrupt_download_is_rejected_and_cleaned_up(tmp_path, server):
+    rel = banks(tmp_path / "out", {"Windows/Main.bnk": b"BKHD" + os.urandom(4096)})
+    BankCache(str(tmp_path / "a"), remote=RemoteBankCache(url(server))).store(KEY, str(tmp_path / "out"), rel)
+    objects = tmp_path / "server" / "objects"
+    for root, _, names in os.walk(objects):
+        for name in names:
+            with open(os.path.join(root, name), "r+b") as f:
+                f.write(b"XXXX")
+
+    reader = BankCache(str(tmp_path / "b"), remote=RemoteBankCache(url(server)))
+    assert reader.restore(KEY, str(tmp_path / "restored")) is None
+    assert reader.remote_down
+    assert not (tmp_path / "restored" / "Windows" / "Main.bnk").exists()
+    assert part_files(tmp_path / "b") == []
+
+    entry = RemoteBankCache(url(server)).get_entry(KEY)
+    with pytest.raises(RemoteCacheError, match="integrity"):
+        RemoteBankCache(url(server)).download(entry, lambda d: str(tmp_path / "c" / d))
+    assert part_files(tmp_path / "c") == []
+
+
+def test_unreachable_server_falls_back(tmp_path):
+    cache = BankCache(str(tmp_path / "a"), remote=RemoteBankCache("http://127.0.0.1:9", timeout=0.5))
+    assert not cache.contains(KEY)
+    assert cache.remote_down
+    assert cache.restore(KEY, str(tmp_path / "restored")) is None
+
+
+def test_evict_reaps_stale_part_files(tmp_path):
+    rel = banks(tmp_path / "out", {"Windows/Main.bnk": os.urandom(1024)})
+    cache = BankCache(str(tmp_path / "cache"))
+    cache.store(KEY, str(tmp_path / "out"), rel)
+    folder = tmp_path / "cache" / "objects" / "ab"
+    folder.mkdir(parents=True, exist_ok=True)
+    stale, fresh = folder / "ab12.1.part", folder / "ab34.2.part"
+    stale.write_bytes(b"x")
+    fresh.write_bytes(b"x")
+    old = time.time() - STALE_PART_SECONDS - 60
+    os.utime(stale, (old, old))
+    cache.evict(max_bytes=0)
+    assert not stale.exists()
+    assert fresh.exists()
+    assert len(cache.index) == 0
@@ -0,0 +1,43 @@
+import os
+import wave
+
+from wwise_dedupe import find_duplicates, alias_map
+
+
+def write_wav(path, frames):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(48000)
+        w.writeframes(frames)
+
+
+def test_aliases_are_keyed_on_the_callers_paths(tmp_path, monkeypatch):
+    write_wav(tmp_path / "snd" / "a.wav", b"\x01\x02" * 400)
+    write_wav(tmp_path / "snd" / "b.wav", b"\x01\x02" * 400)
+    write_wav(tmp_path / "snd" / "c.wav", b"\x03\x04" * 400)
+    monkeypatch.chdir(tmp_path)
+    wavs = ["./snd/a.wav", "./snd/b.wav", "./snd/c.wav"]
+
+    groups = find_duplicates(wavs)
+    assert groups == [["./snd/a.wav", "./snd/b.wav"]]
+    aliases = alias_map(groups)
+    assert aliases == {"./snd/b.wav": "./snd/a.wav"}
+    # what the worker imports: every path that is not an alias
+    assert [w for w in wavs if w not in aliases] == ["./snd/a.wav", "./snd/c.wav"]
+
+
+def test_absolute_paths_round_trip(tmp_path):
+    a, b = tmp_path / "x" / "one.wav", tmp_path / "y" / "two.wav"
+    write_wav(a, b"\x05\x06" * 100)
+    write_wav(b, b"\x05\x06" * 100)
+    groups = find_duplicates([str(b), str(a)])
+    assert alias_map(groups) == {max(str(a), str(b)): min(str(a), str(b))}
+    assert all(os.path.isabs(p) for g in groups for p in g)
+
+
+def test_same_size_different_samples_are_not_duplicates(tmp_path):
+    write_wav(tmp_path / "a.wav", b"\x01\x02" * 100)
+    write_wav(tmp_path / "b.wav", b"\x02\x01" * 100)
+    assert find_duplicates([str(tmp_path / "a.wav"), str(tmp_path / "b.wav")]) == []
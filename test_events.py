@@ -0,0 +1,58 @@
+from concurrent.futures import Future
+
+from wwise_events import EventBuilder, EventSpec, WaapiRequestFailed
+
+
+class FakeClient:
+    """object.set that WAAPI rejects when the payload holds a bad object, or fails with `error` outright."""
+
+    def __init__(self, bad=(), error=None):
+        self.bad = set(bad)
+        self.error = error
+        self.calls = []
+
+    def call_async(self, uri, args=None):
+        future = Future()
+        objects = [c for o in args["objects"] for c in o.get("children", [o])]
+        names = [o.get("name") or o.get("object") for o in objects]
+        self.calls.append(names)
+        if self.error is not None:
+            future.set_exception(self.error)
+        elif self.bad & set(names):
+            future.set_exception(WaapiRequestFailed(f"invalid object in {names}"))
+        else:
+            future.set_result({"objects": [{"children": [{"name": n, "id": f"{{{n}}}"} for n in names]}]})
+        return future
+
+
+def specs(n):
+    return [EventSpec(f"w{i}.wav", f"Play_w{i}", f"\\Actor-Mixer Hierarchy\\Auto\\w{i}") for i in range(n)]
+
+
+def test_failing_chunk_is_split_down_to_the_bad_object():
+    client = FakeClient(bad={"Play_w5"})
+    results = EventBuilder(client).create(specs(16))
+    assert len(client.calls[0]) == 16
+    assert [w for w, r in results.items() if r["error"]] == ["w5.wav"]
+    assert results["w4.wav"]["id"] == "{Play_w4}"
+    assert results["w5.wav"]["id"] is None
+    # halving 16 objects down to one: 1 + 2 + 2 + 2 + 2 calls
+    assert len(client.calls) == 9
+
+
+def test_set_properties_isolates_the_bad_object():
+    client = FakeClient(bad={"\\A\\s3"})
+    props = {f"\\A\\s{i}": {"@Volume": -3} for i in range(8)}
+    outcome = EventBuilder(client).set_properties(props)
+    assert {p for p, e in outcome.items() if e} == {"\\A\\s3"}
+
+
+def test_timeout_fails_every_object_without_splitting():
+    client = FakeClient(error=TimeoutError("no WAAPI reply for 600s"))
+    results = EventBuilder(client, max_bytes=400).create(specs(16))
+    chunks = len(client.calls)
+    assert chunks > 1
+    assert all("no WAAPI reply" in r["error"] for r in results.values())
+    healthy = FakeClient()
+    EventBuilder(healthy, max_bytes=400).create(specs(16))
+    assert chunks == len(healthy.calls)
@@ -0,0 +1,74 @@
+import os
+import json
+
+from wwise_journal import RunJournal, inputs_digest
+
+INPUTS = inputs_digest({"files": [["\\Auto\\a", "d1", 0]], "soundbank": "Main"})
+
+
+def test_resume_keeps_completed_units(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal("k", INPUTS, path=path)
+    journal.mark("import")
+    journal.mark("generate:Windows", files=3)
+    journal.close()
+
+    resumed = RunJournal("k", INPUTS, resume=True, path=path)
+    assert resumed.resumed
+    assert resumed.done("import") and resumed.done("generate:Windows")
+    assert resumed.units["generate:Windows"]["files"] == 3
+    assert not resumed.done("generate:Android")
+    resumed.close()
+
+
+def test_torn_last_line_is_dropped_and_truncated(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal("k", INPUTS, path=path)
+    journal.mark("import")
+    journal.close()
+    complete = path.read_bytes()
+    with open(path, "ab") as f:
+        f.write(b'{"unit": "generate:Win')      # crash in the middle of a write
+
+    resumed = RunJournal("k", INPUTS, resume=True, path=path)
+    assert resumed.done("import")
+    assert not any(u.startswith("generate") for u in resumed.units)
+    resumed.mark("generate:Windows")
+    resumed.close()
+    data = path.read_bytes()
+    assert data.startswith(complete)
+    tail = data[len(complete):].splitlines()
+    assert len(tail) == 1 and json.loads(tail[0])["unit"] == "generate:Windows"
+
+    again = RunJournal("k", INPUTS, resume=True, path=path)
+    assert sorted(again.units) == ["generate:Windows", "import"]
+    again.close()
+
+
+def test_changed_inputs_start_over(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal("k", INPUTS, path=path)
+    journal.mark("import")
+    journal.close()
+
+    changed = RunJournal("k", inputs_digest({"files": [], "soundbank": "Main"}), resume=True, path=path)
+    assert not changed.resumed and not changed.done("import")
+    changed.close()
+
+
+def test_without_resume_the_journal_is_reset(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal("k", INPUTS, path=path)
+    journal.mark("import")
+    journal.close()
+    fresh = RunJournal("k", INPUTS, path=path)
+    assert not fresh.done("import")
+    fresh.close()
+
+
+def test_finish_deletes_the_journal(tmp_path):
+    path = tmp_path / "run.jsonl"
+    journal = RunJournal("k", INPUTS, path=path)
+    journal.mark("import")
+    journal.finish()
+    assert not os.path.exists(path)
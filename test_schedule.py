@@ -0,0 +1,62 @@
+import pytest
+
+from wwise_schedule import TimingHistory, RATE_KEY, DEFAULT_RATE, PLATFORM_OVERHEAD, plan
+
+JOB = {"project": "p.wproj", "name": "music", "platforms": ["Windows", "Android"]}
+
+
+@pytest.fixture
+def history(tmp_path):
+    return TimingHistory(str(tmp_path / "history.json"))
+
+
+def test_first_estimate_uses_the_fixed_guess(history):
+    assert history.estimate(JOB, 100) == 2 * (100 * DEFAULT_RATE + PLATFORM_OVERHEAD)
+
+
+def test_cache_hit_run_keeps_the_learned_generation_rates(history):
+    full = {"import": 20.0, "generate:Windows": 200.0, "generate:Android": 170.0, "index": 4.0}
+    history.record(JOB, 100, 400.0, full)
+    before = history.estimate(JOB, 100)
+    assert before == pytest.approx(400.0)
+
+    # banks restored from the cache: nothing generated, only the index was rebuilt
+    history.record(JOB, 100, 6.0, {"index": 2.0})
+    entry = history.store.get(history.key(JOB))
+    assert entry["rates"]["generate:Windows"] == pytest.approx(2.0)
+    assert entry["rates"]["generate:Android"] == pytest.approx(1.7)
+    assert entry["rates"]["import"] == pytest.approx(0.2)
+    assert entry["fixed"]["index"] == pytest.approx(3.0)
+    assert history.estimate(JOB, 100) > 0.9 * before
+
+
+def test_measured_stages_are_averaged(history):
+    history.record(JOB, 100, 300.0, {"generate:Windows": 200.0, "generate:Android": 100.0})
+    history.record(JOB, 100, 500.0, {"generate:Windows": 400.0, "generate:Android": 100.0})
+    rates = history.store.get(history.key(JOB))["rates"]
+    assert rates["generate:Windows"] == pytest.approx(3.0)
+    assert rates["generate:Android"] == pytest.approx(1.0)
+
+
+def test_new_platform_costs_the_mean_of_the_others(history):
+    history.record(JOB, 10, 30.0, {"generate:Windows": 20.0, "generate:Android": 10.0})
+    three = dict(JOB, platforms=["Windows", "Android", "iOS"])
+    assert history.estimate(three, 10) == pytest.approx(30.0 + 15.0)
+
+
+def test_history_persists(tmp_path):
+    path = str(tmp_path / "history.json")
+    history = TimingHistory(path)
+    history.record(JOB, 10, 30.0, {"generate:Windows": 30.0})
+    history.save()
+    again = TimingHistory(path)
+    assert again.estimate(JOB, 10) == pytest.approx(history.estimate(JOB, 10))
+    assert again.store.get(RATE_KEY) is not None
+
+
+def test_plan_orders_by_priority_then_cost():
+    tasks = [{"name": "a", "priority": 0, "cost": 10}, {"name": "b", "priority": 0, "cost": 30},
+             {"name": "c", "priority": 5, "cost": 1}, {"name": "d", "priority": 0, "cost": 20}]
+    ordered, makespan = plan(tasks, 2)
+    assert [t["name"] for t in ordered] == ["c", "b", "d", "a"]
+    assert makespan == 31
@@ -0,0 +1,129 @@
+import time
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from wwise_waapi_batch import WaapiBatch
+
+
+class FakeClient:
+    """call_async() answers from a thread; later requests answer sooner, so replies arrive out of order.
+    Names in `fail` raise, names in `hang` never answer."""
+
+    def __init__(self, fail=(), hang=(), delay=0.002):
+        self.fail = set(fail)
+        self.hang = set(hang)
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def call_async(self, uri, args=None):
+        future = Future()
+        name = args["name"]
+        if name in self.hang:
+            return future
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+        def answer():
+            time.sleep(self.delay * (50 - name % 50))
+            with self.lock:
+                self.in_flight -= 1
+            if name in self.fail:
+                future.set_exception(RuntimeError(f"cannot create {name}"))
+            else:
+                future.set_result({"name": name})
+
+        threading.Thread(target=answer, daemon=True).start()
+        return future
+
+
+def requests(n):
+    return [("ak.wwise.core.object.create", {"name": i}, f"tag{i}") for i in range(n)]
+
+
+def test_results_keep_request_order():
+    client = FakeClient()
+    batch = WaapiBatch(client, window=8)
+    results = batch.run(requests(40))
+    assert [r.tag for r in results] == [f"tag{i}" for i in range(40)]
+    assert [r.result["name"] for r in results] == list(range(40))
+    assert client.peak <= 8
+    assert batch.metrics.submitted == 40 and batch.metrics.succeeded == 40
+
+
+def test_errors_are_reported_per_item():
+    results = WaapiBatch(FakeClient(fail={3, 7}), window=4).run(requests(10))
+    assert [i for i, r in enumerate(results) if not r.ok] == [3, 7]
+    assert "cannot create 3" in str(results[3].error)
+    assert all(r.result["name"] == i for i, r in enumerate(results) if r.ok)
+
+
+def test_stall_fails_pending_calls_with_timeout():
+    batch = WaapiBatch(FakeClient(hang={5}), window=4, timeout=0.3)
+    t0 = time.time()
+    results = batch.run(requests(12))
+    assert time.time() - t0 < 5
+    assert isinstance(results[5].error, TimeoutError)
+    assert all(r.ok for i, r in enumerate(results) if i != 5)
+    assert batch.metrics.failed == 1
+
+
+def test_blocking_client_is_spread_over_threads():
+    class Blocking:
+        def call(self, uri, args):
+            time.sleep(0.05)
+            return {"name": args["name"]}
+
+    batch = WaapiBatch(Blocking(), window=10)
+    t0 = time.time()
+    results = batch.run(requests(20))
+    batch.close()
+    assert [r.result["name"] for r in results] == list(range(20))
+    assert time.time() - t0 < 0.5
+
+
+def test_pipelined_client_against_standin():
+    pytest.importorskip("waapi")
+    import txaio
+    from wwise_waapi_batch import PipelinedWaapiClient
+    from wwise_waapi_standin import StandInProcess
+
+    with StandInProcess(fail_names=["bad"]) as a, StandInProcess() as b:
+        with PipelinedWaapiClient(a.url) as client_a, PipelinedWaapiClient(b.url) as client_b:
+            create = [("ak.wwise.core.object.create", {"parent": "\\Actor-Mixer Hierarchy\\Default Work Unit",
+                                                       "type": "Sound", "name": n}, n) for n in ("s1", "bad", "s2")]
+            results = {}
+            threads = [threading.Thread(target=lambda c=c, k=k: results.__setitem__(k, WaapiBatch(c, 4).run(create)))
+                       for k, c in (("a", client_a), ("b", client_b))]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(30)
+            # two connections in one process, each on its own loop, without touching the global txaio loop
+            assert txaio.config.loop is None
+            assert [r.ok for r in results["a"]] == [True, False, True]
+            assert all(r.ok for r in results["b"])
+            assert "bad" in str(results["a"][1].error)
+
+
+def test_stale_global_loop_of_a_finished_client_is_ignored():
+    pytest.importorskip("waapi")
+    import asyncio
+    import txaio
+    from wwise_waapi_batch import PipelinedWaapiClient
+    from wwise_waapi_standin import StandInProcess
+
+    # what a vendored WaapiClient leaves behind after it disconnected or failed to connect
+    stale = asyncio.new_event_loop()
+    txaio.config.loop = stale
+    try:
+        with StandInProcess() as server, PipelinedWaapiClient(server.url) as client:
+            assert client.call("ak.wwise.core.getInfo", timeout=10)["displayName"]
+            assert txaio.config.loop is None
+    finally:
+        txaio.config.loop = None
+        stale.close()
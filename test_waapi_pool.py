@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+pytest.importorskip("waapi")
+
+from wwise_waapi_pool import ServerPool
+from wwise_waapi_standin import standin_command
+
+
+def make_project(root, name):
+    folder = root / name
+    (folder / "Actor-Mixer Hierarchy").mkdir(parents=True)
+    (folder / "Actor-Mixer Hierarchy" / "Default Work Unit.wwu").write_text("<WorkUnit/>")
+    (folder / "GeneratedSoundBanks").mkdir()
+    project = folder / f"{name}.wproj"
+    project.write_text("<Project/>")
+    return str(project)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    # the stand-in plays WwiseConsole waapi-server: command(project) -> argv factory (port -> argv)
+    pool = ServerPool(size=2, max_jobs=2, workdir=str(tmp_path / "pool"),
+                      command=lambda project: standin_command(), startup_timeout=30.0)
+    yield pool
+    pool.close()
+
+
+def test_lease_reuses_an_idle_instance_of_the_same_project(tmp_path, pool):
+    project = make_project(tmp_path, "A")
+    with pool.lease(project) as first:
+        url = first.url
+        assert first.project != project and os.path.isfile(first.project)
+        assert not os.path.exists(os.path.join(os.path.dirname(first.project), "GeneratedSoundBanks"))
+    with pool.lease(project) as second:
+        assert second is first and second.url == url
+    assert len(pool.instances) == 1
+
+
+def test_concurrent_leases_get_separate_instances(tmp_path, pool):
+    project = make_project(tmp_path, "A")
+    with pool.lease(project) as a, pool.lease(project) as b:
+        assert a is not b and a.url != b.url
+        assert a.project != b.project
+    with pytest.raises(TimeoutError):
+        with pool.lease(project), pool.lease(project), pool.lease(project, timeout=0.2):
+            pass
+
+
+def test_instance_is_recycled_after_max_jobs(tmp_path, pool):
+    project = make_project(tmp_path, "A")
+    for _ in range(2):
+        with pool.lease(project) as inst:
+            pid = inst.server.proc.pid
+    assert pool.recycled == 1
+    with pool.lease(project) as inst:
+        assert inst.server.proc.pid != pid and inst.jobs == 0
+        assert inst.server.probe()
+
+
+def test_dead_instance_is_recycled_on_release(tmp_path, pool):
+    project = make_project(tmp_path, "A")
+    with pool.lease(project) as inst:
+        inst.server.proc.kill()
+        inst.server.proc.wait()
+    assert pool.recycled == 1
+    assert inst.running() and inst.health() is None
+
+
+def test_idle_instance_of_another_project_is_recycled_when_full(tmp_path, pool):
+    a, b, c = (make_project(tmp_path, n) for n in "ABC")
+    with pool.lease(a), pool.lease(b):
+        pass
+    with pool.lease(c) as inst:
+        assert inst.source == os.path.abspath(c)
+    assert len(pool.instances) == 2
+    # the least recently started instance (A's) made room
+    assert sorted(i.source for i in pool.instances) == sorted([os.path.abspath(b), os.path.abspath(c)])
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of generated SoundBanks ("ccache for banks").
+
+A cache key is a fingerprint of everything that decides the generated output: WAV content hashes and
+object paths, project (.wproj) settings, the project's work units (.wwu: ShareSets, conversion settings,
+busses, SoundBank definitions, hierarchy), event pattern, bank name, platform and console version.
+On a hit the .bnk and companion files (SoundbanksInfo, .wem, .txt ...) are restored straight into the
+output folder instead of calling WwiseConsole.
+
+Layout under the cache root:
+  objects/ab/abcdef...   file contents, stored once by SHA-256
+  entries/<key>.json     list of {path, digest, size} produced for a key
+  index.json             key -> {size, last_used, digests} for LRU eviction
+  stats.json             hit / miss / store / eviction counters
+
+Optional remote tier (RemoteBankCache): a plain HTTP protocol shared by a team / CI farm,
+served by wwise_bankcache_server.py:
+  GET|HEAD|PUT /objects/<sha256>   file contents (the server rejects bodies that do not match the hash)
+  GET|HEAD|PUT /entries/<key>      the entry JSON; uploaded last, so an entry implies its objects exist
+Local misses are looked up remotely, fresh builds are uploaded. Any remote error or timeout falls back
+to local generation.
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import fnmatch
+import hashlib
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from wwise_cache import cache_root, JsonStore, file_digest, atomic_write_text
+
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 10 * 1024 ** 3
+# files the batch tool itself writes next to the banks; never part of a cached build
+IGNORE_PATTERNS = ("WwiseBatchLog*", "*Report.json", "*.part", "SoundbanksIndex.db*")
+# project sub-folders that hold no work units and can be large
+NON_UNIT_DIRS = {"originals", ".cache", "generatedsoundbanks", ".backup", ".git"}
+TRANSFER_CHUNK = 1024 * 1024
+STALE_PART_SECONDS = 6 * 3600     # evict() deletes unfinished ".part" copies older than this
+
+
+def console_version(console):
+    """Best-effort version string of a WwiseConsole: version number found in its path + binary size/mtime."""
+    if not console:
+        return ""
+    m = re.search(r"Wwise\s*v?(\d{4}\.\d+\.\d+(?:\.\d+)?)", str(console))
+    try:
+        st = os.stat(console)
+        stamp = f"{st.st_size}:{int(st.st_mtime)}"
+    except OSError:
+        stamp = "?"
+    return f"{m.group(1) if m else ''}:{stamp}"
+
+
+def work_unit_digests(project, digest=file_digest):
+    """[[relative path, digest]] of every .wwu under the project folder, sorted."""
+    base = os.path.dirname(os.path.abspath(project))
+    units = []
+    for root, dirs, files in os.walk(base):
+        dirs[:] = [d for d in dirs if d.lower() not in NON_UNIT_DIRS]
+        for f in files:
+            if f.lower().endswith(".wwu"):
+                full = os.path.join(root, f)
+                units.append([os.path.relpath(full, base).replace(os.sep, "/"), digest(full)])
+    return sorted(units)
+
+
+def cache_key(parts):
+    """Stable SHA-256 over a JSON-serializable description of the build inputs."""
+    blob = json.dumps({"v": CACHE_VERSION, "parts": parts}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def snapshot(directory):
+    """{relative_path: (size, mtime_ns)} of every file below directory."""
+    result = {}
+    if not directory or not os.path.isdir(directory):
+        return result
+    for root, _, files in os.walk(directory):
+        for f in files:
+            if any(fnmatch.fnmatch(f, pat) for pat in IGNORE_PATTERNS):
+                continue
+            full = os.path.join(root, f)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            result[os.path.relpath(full, directory)] = (st.st_size, st.st_mtime_ns)
+    return result
+
+
+def changed_files(before, after):
+    """Relative paths that are new or modified between two snapshots."""
+    return sorted(p for p, stamp in after.items() if before.get(p) != stamp)
+
+
+class RemoteCacheError(Exception):
+    pass
+
+
+class RemoteBankCache:
+    """HTTP client for the shared cache tier. Transfers run concurrently and every object is hash-checked."""
+
+    def __init__(self, url, timeout=5.0, workers=8):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.workers = workers
+
+    def _open(self, method, path, data=None, length=None):
+        req = urllib.request.Request(f"{self.url}/{path}", data=data, method=method)
+        if data is not None:
+            req.add_header("Content-Type", "application/octet-stream")
+            if length is not None:
+                req.add_header("Content-Length", str(length))
+        try:
+            return urllib.request.urlopen(req, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise RemoteCacheError(f"{method} {path}: HTTP {e.code}")
+        except (urllib.error.URLError, OSError) as e:
+            raise RemoteCacheError(f"{method} {path}: {e}")
+
+    def _request(self, method, path, data=None, length=None):
+        resp = self._open(method, path, data, length)
+        if resp is None:
+            return None
+        try:
+            return resp.read() if method == "GET" else b""
+        except OSError as e:
+            raise RemoteCacheError(f"{method} {path}: {e}")
+        finally:
+            resp.close()
+
+    def has_entry(self, key):
+        return self._request("HEAD", f"entries/{key}") is not None
+
+    def get_entry(self, key):
+        body = self._request("GET", f"entries/{key}")
+        return json.loads(body)["files"] if body is not None else None
+
+    def download(self, files, object_path):
+        """Fetch the objects of an entry that are not present locally. Raises RemoteCacheError."""
+        def fetch(digest):
+            dest = object_path(digest)
+            if os.path.exists(dest):
+                return
+            resp = self._open("GET", f"objects/{digest}")
+            if resp is None:
+                raise RemoteCacheError(f"object {digest} missing on server")
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            part = f"{dest}.{threading.get_ident()}.part"
+            h = hashlib.sha256()
+            try:
+                with resp, open(part, "wb") as f:
+                    for chunk in iter(lambda: resp.read(TRANSFER_CHUNK), b""):
+                        h.update(chunk)
+                        f.write(chunk)
+                if h.hexdigest() != digest:
+                    raise RemoteCacheError(f"object {digest} failed integrity check")
+                os.replace(part, dest)
+            except OSError as e:
+                raise RemoteCacheError(f"GET objects/{digest}: {e}")
+            finally:
+                if os.path.exists(part):
+                    os.unlink(part)
+
+        digests = sorted({item["digest"] for item in files})
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(fetch, digests))
+
+    def upload(self, key, files, object_path):
+        """Push objects (skipping ones the server has) and then the entry. Raises RemoteCacheError."""
+        def push(digest):
+            if self._request("HEAD", f"objects/{digest}") is not None:
+                return 0
+            src = object_path(digest)
+            size = os.path.getsize(src)
+            with open(src, "rb") as f:
+                self._request("PUT", f"objects/{digest}", f, size)
+            return size
+
+        digests = sorted({item["digest"] for item in files})
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            sent = sum(pool.map(push, digests))
+        self._request("PUT", f"entries/{key}", json.dumps({"files": files}).encode("utf-8"))
+        return sent
+
+
+class BankCache:
+    """Local content-addressed store of bank outputs with size-based LRU eviction."""
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES, logger=None, remote=None):
+        self.root = str(root or cache_root("banks"))
+        self.max_bytes = max_bytes
+        self.logger = logger
+        self.remote = remote
+        self.remote_down = False   # after one failure the rest of the run stays local
+        self.index = JsonStore(os.path.join(self.root, "index.json"))
+        self.stats = JsonStore(os.path.join(self.root, "stats.json"))
+        self._lock = threading.Lock()
+        # one cache is shared by the manifest's worker threads: eviction holds _gc_lock and keeps pinned
+        # objects (being written, fetched or copied out, maybe not indexed yet) alongside the indexed ones
+        self._gc_lock = threading.Lock()
+        self._pins = {}
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def _entry_path(self, key):
+        return os.path.join(self.root, "entries", key + ".json")
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats.put(name, self.stats.get(name, 0) + amount)
+
+    def _pin(self, digests):
+        with self._gc_lock:
+            for d in digests:
+                self._pins[d] = self._pins.get(d, 0) + 1
+
+    def _unpin(self, digests):
+        with self._gc_lock:
+            for d in digests:
+                if self._pins.get(d, 0) <= 1:
+                    self._pins.pop(d, None)
+                else:
+                    self._pins[d] -= 1
+
+    def _index_put(self, key, meta):
+        with self._gc_lock:
+            self.index.put(key, meta)
+
+    def entry(self, key):
+        """Return the file list stored for key, or None if absent or incomplete."""
+        try:
+            with open(self._entry_path(key), encoding="utf-8") as f:
+                files = json.load(f)["files"]
+        except (OSError, ValueError, KeyError):
+            return None
+        for item in files:
+            if not os.path.exists(self._object_path(item["digest"])):
+                return None
+        return files
+
+    def contains(self, key):
+        if self.entry(key) is not None:
+            return True
+        if self.remote and not self.remote_down:
+            try:
+                return self.remote.has_entry(key)
+            except RemoteCacheError as e:
+                self.remote_down = True
+                self._log(f"Bank cache: remote unavailable ({e})")
+        return False
+
+    def _fetch_remote(self, key):
+        """Pull an entry and its objects from the remote tier into the local store. Returns the file list or None."""
+        digests = []
+        try:
+            files = self.remote.get_entry(key)
+            if files is None:
+                self._count("remote_misses")
+                return None
+            digests = [i["digest"] for i in files]
+            self._pin(digests)
+            self.remote.download(files, self._object_path)
+            atomic_write_text(self._entry_path(key), json.dumps({"files": files}, indent=1))
+            self._index_put(key, {"size": sum(i["size"] for i in files), "last_used": time.time(), "digests": digests})
+        except (RemoteCacheError, ValueError, KeyError, TypeError) as e:
+            self.remote_down = True
+            self._log(f"Bank cache: remote fetch failed, falling back to generation ({e})")
+            self._count("remote_errors")
+            return None
+        finally:
+            self._unpin(digests)
+        self._count("remote_hits")
+        return files
+
+    def restore(self, key, dest_dir):
+        """Copy the cached outputs for key into dest_dir. Returns the restored relative paths, or None on a miss."""
+        with self._gc_lock:
+            files = self.entry(key)
+            digests = [i["digest"] for i in files or []]
+            for d in digests:
+                self._pins[d] = self._pins.get(d, 0) + 1
+        if files is None and self.remote and not self.remote_down:
+            files = self._fetch_remote(key)
+            digests = [i["digest"] for i in files or []]
+            self._pin(digests)
+        if files is None:
+            self._count("misses")
+            return None
+        try:
+            for item in files:
+                target = os.path.join(dest_dir, item["path"])
+                os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+                tmp = target + ".part"
+                shutil.copyfile(self._object_path(item["digest"]), tmp)
+                os.replace(tmp, target)
+        finally:
+            self._unpin(digests)
+        meta = dict(self.index.get(key) or {"size": sum(i["size"] for i in files), "digests": digests})
+        meta["last_used"] = time.time()
+        with self._gc_lock:
+            # evicted while the files were copied: do not bring the index entry back
+            if os.path.exists(self._entry_path(key)):
+                self.index.put(key, meta)
+        self._count("hits")
+        self._count("bytes_restored", meta["size"])
+        return [i["path"] for i in files]
+
+    def store(self, key, base_dir, rel_paths):
+        """Add the given files (relative to base_dir) under key, then evict down to max_bytes."""
+        files = []
+        digests = []
+        try:
+            for rel in rel_paths:
+                src = os.path.join(base_dir, rel)
+                digest = file_digest(src)
+                # pinned before the object exists, so a concurrent evict() cannot delete it before it is indexed
+                self._pin([digest])
+                digests.append(digest)
+                obj = self._object_path(digest)
+                if not os.path.exists(obj):
+                    os.makedirs(os.path.dirname(obj), exist_ok=True)
+                    part = f"{obj}.{threading.get_ident()}.part"     # two jobs may store the same object
+                    shutil.copyfile(src, part)
+                    os.replace(part, obj)
+                files.append({"path": rel.replace(os.sep, "/"), "digest": digest, "size": os.path.getsize(src)})
+            atomic_write_text(self._entry_path(key), json.dumps({"files": files}, indent=1))
+            self._index_put(key, {"size": sum(i["size"] for i in files), "last_used": time.time(), "digests": digests})
+        finally:
+            self._unpin(digests)
+        self._count("stores")
+        if self.remote and not self.remote_down:
+            try:
+                sent = self.remote.upload(key, files, self._object_path)
+                self._count("remote_uploads")
+                self._log(f"Bank cache: uploaded {sent / 1048576.0:.1f} MB to {self.remote.url}")
+            except RemoteCacheError as e:
+                self.remote_down = True
+                self._log(f"Bank cache: upload failed ({e})")
+                self._count("remote_errors")
+        self.evict()
+        return files
+
+    def total_size(self):
+        return sum(meta["size"] for meta in list(self.index.data.values()))
+
+    def evict(self, max_bytes=None):
+        """Drop least recently used entries until the cache fits max_bytes; unreferenced objects are deleted."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._gc_lock:
+            total = self.total_size()
+            if total <= limit:
+                return 0
+            dropped = []
+            for key, meta in sorted(self.index.data.items(), key=lambda kv: kv[1].get("last_used", 0)):
+                if total <= limit:
+                    break
+                total -= meta["size"]
+                dropped.append(key)
+            for key in dropped:
+                self.index.pop(key)
+                try:
+                    os.unlink(self._entry_path(key))
+                except OSError:
+                    pass
+            live = {d for meta in self.index.data.values() for d in meta.get("digests", [])}
+            live.update(self._pins)
+            objects_dir = os.path.join(self.root, "objects")
+            stale = time.time() - STALE_PART_SECONDS
+            for root, _, names in os.walk(objects_dir):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        # a recent ".part" file belongs to a copy in progress; an old one was left by a killed process
+                        if name.endswith(".part") and os.path.getmtime(path) > stale:
+                            continue
+                        if name not in live:
+                            os.unlink(path)
+                    except OSError:
+                        pass
+        self._count("evictions", len(dropped))
+        self._log(f"Bank cache: evicted {len(dropped)} entr{'y' if len(dropped) == 1 else 'ies'}")
+        return len(dropped)
+
+    def summary(self):
+        hits, misses = self.stats.get("hits", 0), self.stats.get("misses", 0)
+        ratio = 100.0 * hits / (hits + misses) if hits + misses else 0.0
+        return (f"{len(self.index)} entries, {self.total_size() / 1048576.0:.1f} MB, "
+                f"hits {hits} / misses {misses} ({ratio:.0f}%), stores {self.stats.get('stores', 0)}, "
+                f"evictions {self.stats.get('evictions', 0)}"
+                + (f", remote hits {self.stats.get('remote_hits', 0)} / errors {self.stats.get('remote_errors', 0)}" if self.remote else ""))
+
+    def save(self):
+        self.index.save()
+        self.stats.save()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or trim the local SoundBank cache")
+    parser.add_argument("command", choices=["stats", "evict", "clear"])
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--max-gb", type=float, default=DEFAULT_MAX_BYTES / 1024 ** 3)
+    parser.add_argument("--remote", default=None, help="Shared cache URL, e.g. http://cache-host:8765")
+    args = parser.parse_args()
+
+    remote = RemoteBankCache(args.remote) if args.remote else None
+    cache = BankCache(args.cache_dir, int(args.max_gb * 1024 ** 3), remote=remote)
+    if args.command == "evict":
+        cache.evict()
+    elif args.command == "clear":
+        cache.evict(0)
+    cache.save()
+    print(cache.summary())
+
+
+if __name__ == "__main__":
+    main()
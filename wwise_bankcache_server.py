@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Reference server for the shared SoundBank cache (see RemoteBankCache in wwise_bankcache.py).
+
+Stores objects and entries as plain files under --root:
+  GET|HEAD|PUT /objects/<sha256>
+  GET|HEAD|PUT /entries/<key>
+Uploaded objects are hashed while streaming to disk and rejected (400) if the body does not match.
+
+Usage: python wwise_bankcache_server.py --root /srv/bankcache --port 8765
+"""
+
+import os
+import re
+import hashlib
+import argparse
+import tempfile
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+CHUNK = 1024 * 1024
+NAME_RE = re.compile(r"^/(objects|entries)/([0-9a-f]{64})$")
+MAX_ENTRY_BYTES = 16 * 1024 * 1024
+
+
+class CacheRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    root = "."
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _target(self):
+        m = NAME_RE.match(self.path)
+        if not m:
+            self._reply(400)
+            return None, None
+        kind, name = m.groups()
+        return kind, os.path.join(self.root, kind, name[:2], name)
+
+    def _reply(self, code, length=0):
+        self.send_response(code)
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+    def _send_file(self, with_body):
+        kind, path = self._target()
+        if path is None:
+            return
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self._reply(404)
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            if with_body:
+                for chunk in iter(lambda: f.read(CHUNK), b""):
+                    self.wfile.write(chunk)
+
+    def do_HEAD(self):
+        self._send_file(False)
+
+    def do_GET(self):
+        self._send_file(True)
+
+    def do_PUT(self):
+        kind, path = self._target()
+        if path is None:
+            return
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._reply(411)
+            return
+        if kind == "entries" and length > MAX_ENTRY_BYTES:
+            self._reply(413)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        h = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                left = length
+                while left > 0:
+                    chunk = self.rfile.read(min(CHUNK, left))
+                    if not chunk:
+                        break
+                    h.update(chunk)
+                    out.write(chunk)
+                    left -= len(chunk)
+            if left > 0 or (kind == "objects" and h.hexdigest() != os.path.basename(path)):
+                os.unlink(tmp)
+                self._reply(400)
+                return
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            self._reply(500)
+            return
+        self._reply(201)
+
+
+def make_server(root, host="127.0.0.1", port=0, verbose=False):
+    """Create (but do not start) a cache server. port=0 picks a free port; see server.server_address."""
+    os.makedirs(root, exist_ok=True)
+    handler = type("BoundCacheRequestHandler", (CacheRequestHandler,), {"root": os.path.abspath(root)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared SoundBank cache server")
+    parser.add_argument("--root", required=True, help="Storage folder")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = make_server(args.root, args.host, args.port, args.verbose)
+    print(f"Bank cache server on http://{server.server_address[0]}:{server.server_address[1]} -> {args.root}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+SQLite index of the SoundbanksInfo files written next to generated banks.
+
+Each platform folder's SoundbanksInfo.json (or .xml) is streamed: ijson when installed, otherwise json,
+and ElementTree.iterparse for XML with every parsed bank cleared from the tree. The index maps
+event name -> event id -> bank -> media -> source WAV with bank and media sizes per platform:
+
+- events(name, platform, bank, id)       primary key on name: "which banks contain Play_X" is one B-tree probe
+- banks(platform, path, id, name, language, size)
+- media(platform, bank, id, language, source, path, size, streamed)
+
+Updates are incremental: a platform whose SoundbanksInfo did not change is skipped, and inside a changed
+one only banks whose file (size, mtime) or Hash changed are re-indexed. In-memory media sizes come from
+the bank's DIDX (memory-mapped), streamed ones from the .wem on disk.
+
+    python wwise_bankinfo.py GeneratedSoundBanks update
+    python wwise_bankinfo.py GeneratedSoundBanks event Play_Footstep
+    python wwise_bankinfo.py GeneratedSoundBanks source Footstep_01.wav
+"""
+
+import os
+import json
+import sqlite3
+import argparse
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+try:
+    import ijson
+except Exception:
+    ijson = None
+
+from wwise_bnk import Bank, BankFormatError
+
+INDEX_NAME = "SoundbanksIndex.db"
+INFO_NAMES = ("SoundbanksInfo.json", "SoundbanksInfo.xml")
+MEDIA_KEYS = ("Media", "IncludedMemoryFiles", "ReferencedStreamedFiles")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS infos (platform TEXT PRIMARY KEY, path TEXT, stamp TEXT);
+CREATE TABLE IF NOT EXISTS banks (platform TEXT, path TEXT, id INTEGER, name TEXT, language TEXT, size INTEGER, stamp TEXT,
+                                  PRIMARY KEY (platform, path)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS events (name TEXT, platform TEXT, bank TEXT, id INTEGER,
+                                   PRIMARY KEY (name, platform, bank)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS events_bank ON events (platform, bank);
+CREATE TABLE IF NOT EXISTS media (platform TEXT, bank TEXT, id INTEGER, language TEXT, source TEXT, path TEXT, size INTEGER,
+                                  streamed INTEGER, PRIMARY KEY (platform, bank, id)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS media_source ON media (source);
+"""
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def find_info(platform_dir):
+    return next((os.path.join(platform_dir, n) for n in INFO_NAMES if os.path.isfile(os.path.join(platform_dir, n))), None)
+
+
+def _media_record(m, streamed):
+    return {"id": int(m["Id"]), "language": m.get("Language"), "source": m.get("ShortName"), "path": m.get("Path"),
+            "streamed": streamed or str(m.get("Streaming", "")).lower() == "true"}
+
+
+def _json_bank(b):
+    media = []
+    for key in MEDIA_KEYS:
+        for m in b.get(key) or []:
+            media.append(_media_record(m, key == "ReferencedStreamedFiles"))
+    return {"id": int(b["Id"]), "name": b.get("ShortName"), "language": b.get("Language"), "path": b.get("Path"),
+            "hash": b.get("Hash"), "events": [(int(e["Id"]), e["Name"]) for e in b.get("IncludedEvents") or []],
+            "media": media}
+
+
+def iter_json_banks(path):
+    with open(path, "rb") as f:
+        if ijson is not None:
+            for b in ijson.items(f, "SoundBanksInfo.SoundBanks.item"):
+                yield _json_bank(b)
+            return
+        for b in json.load(f)["SoundBanksInfo"]["SoundBanks"]:
+            yield _json_bank(b)
+
+
+def iter_xml_banks(path):
+    """Yield one bank dict per <SoundBank>, clearing the parsed elements as it goes."""
+    streamed, stack, bank, container = {}, [], None, None
+    for ev, el in ET.iterparse(path, events=("start", "end")):
+        if ev == "start":
+            stack.append(el.tag)
+            if el.tag == "SoundBanks":
+                container = el
+            elif el.tag == "SoundBank":
+                bank = {"id": int(el.get("Id")), "language": el.get("Language"), "hash": el.get("Hash"), "events": [], "media": []}
+            continue
+        stack.pop()
+        parent = stack[-1] if stack else ""
+        if el.tag == "File":
+            rec = _media_record({"Id": el.get("Id"), "Language": el.get("Language"), "ShortName": el.findtext("ShortName"),
+                                 "Path": el.findtext("Path"), "Streaming": el.get("Streaming")}, parent == "ReferencedStreamedFiles")
+            if bank is None:
+                if parent == "StreamedFiles":
+                    streamed[rec["id"]] = rec
+            else:
+                if rec["source"] is None and rec["id"] in streamed:
+                    rec.update(source=streamed[rec["id"]]["source"], path=streamed[rec["id"]]["path"])
+                bank["media"].append(rec)
+            el.clear()
+        elif el.tag == "Event" and bank is not None:
+            bank["events"].append((int(el.get("Id")), el.get("Name")))
+            el.clear()
+        elif el.tag == "SoundBank":
+            bank.update(name=el.findtext("ShortName"), path=el.findtext("Path"))
+            yield bank
+            bank = None
+            el.clear()
+            if container is not None:
+                container.clear()
+
+
+def iter_banks(path):
+    return iter_xml_banks(path) if str(path).lower().endswith(".xml") else iter_json_banks(path)
+
+
+def media_size(root, m, sizes):
+    """Size of a media record: from the bank's DIDX sizes when in memory, else the .wem under root."""
+    if not m["streamed"] and m["id"] in sizes:
+        return sizes[m["id"]]
+    path = os.path.join(root, m["path"]) if m["path"] else None
+    return os.path.getsize(path) if path and os.path.isfile(path) else None
+
+
+class SoundbanksIndex:
+    def __init__(self, db_path, logger=None):
+        self.db_path = str(db_path)
+        self.logger = logger
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def update(self, bank_dir, platforms=None):
+        """Re-index the platforms under bank_dir. Returns {platform: {"banks", "updated", "removed"} or None if unchanged}."""
+        platforms = platforms or sorted(d for d in os.listdir(bank_dir) if os.path.isdir(os.path.join(bank_dir, d)))
+        results = {}
+        for plat in platforms:
+            info = find_info(os.path.join(bank_dir, plat))
+            if info is None:
+                continue
+            stamp = json.dumps(_stamp(info) + [os.path.basename(info)])
+            row = self.db.execute("SELECT stamp FROM infos WHERE platform = ?", (plat,)).fetchone()
+            if row and row[0] == stamp:
+                results[plat] = None
+                continue
+            with self.db:
+                results[plat] = self._update_platform(plat, os.path.join(bank_dir, plat), info)
+                self.db.execute("INSERT OR REPLACE INTO infos VALUES (?, ?, ?)", (plat, info, stamp))
+        return results
+
+    def _update_platform(self, plat, root, info):
+        known = dict(self.db.execute("SELECT path, stamp FROM banks WHERE platform = ?", (plat,)))
+        seen, updated = set(), 0
+        for b in iter_banks(info):
+            if not b.get("path"):
+                continue
+            seen.add(b["path"])
+            bank_file = os.path.join(root, b["path"])
+            stamp = json.dumps((_stamp(bank_file) if os.path.isfile(bank_file) else None, b["hash"]))
+            if known.get(b["path"]) == stamp:
+                continue
+            self._drop_bank(plat, b["path"])
+            sizes = self._media_sizes(bank_file) if any(not m["streamed"] for m in b["media"]) else {}
+            self.db.execute("INSERT INTO banks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (plat, b["path"], b["id"], b["name"], b["language"],
+                             os.path.getsize(bank_file) if os.path.isfile(bank_file) else None, stamp))
+            self.db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?)",
+                                [(name, plat, b["path"], eid) for eid, name in b["events"]])
+            self.db.executemany("INSERT OR REPLACE INTO media VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                [(plat, b["path"], m["id"], m["language"], m["source"], m["path"],
+                                  media_size(root, m, sizes), int(m["streamed"])) for m in b["media"]])
+            updated += 1
+        removed = [p for p in known if p not in seen]
+        for p in removed:
+            self._drop_bank(plat, p)
+        return {"banks": len(seen), "updated": updated, "removed": len(removed)}
+
+    def _drop_bank(self, plat, path):
+        for table in ("banks", "events", "media"):
+            column = "path" if table == "banks" else "bank"
+            self.db.execute(f"DELETE FROM {table} WHERE platform = ? AND {column} = ?", (plat, path))
+
+    def _media_sizes(self, bank_file):
+        try:
+            with Bank(bank_file) as bank:
+                return {mid: e.size for mid, e in bank.media.items()}
+        except (OSError, BankFormatError) as e:
+            self._log(f"Bank index: cannot read {bank_file}: {e}")
+            return {}
+
+    def banks_for_event(self, name, platform=None):
+        sql = ("SELECT e.platform, e.bank, e.id, b.id, b.size FROM events e JOIN banks b ON b.platform = e.platform AND b.path = e.bank "
+               "WHERE e.name = ?" + (" AND e.platform = ?" if platform else ""))
+        rows = self.db.execute(sql, (name, platform) if platform else (name,))
+        return [{"platform": p, "bank": bank, "event_id": eid, "bank_id": bid, "bank_size": size} for p, bank, eid, bid, size in rows]
+
+    def media_for_bank(self, bank, platform):
+        rows = self.db.execute("SELECT id, language, source, path, size, streamed FROM media WHERE platform = ? AND bank = ?", (platform, bank))
+        return [{"id": mid, "language": lang, "source": src, "path": path, "size": size, "streamed": bool(s)}
+                for mid, lang, src, path, size, s in rows]
+
+    def banks_for_source(self, source):
+        """Where a source WAV (by file name) ended up: [{platform, bank, media id, size, streamed}]."""
+        rows = self.db.execute("SELECT platform, bank, id, size, streamed FROM media WHERE source = ?", (os.path.basename(source),))
+        return [{"platform": p, "bank": bank, "media_id": mid, "size": size, "streamed": bool(s)} for p, bank, mid, size, s in rows]
+
+    def known_names(self):
+        """{name: "event" | "bank"} over every indexed platform, for ID clash checks."""
+        names = {name: "bank" for (name,) in self.db.execute("SELECT DISTINCT name FROM banks WHERE name IS NOT NULL")}
+        names.update((name, "event") for (name,) in self.db.execute("SELECT DISTINCT name FROM events"))
+        return names
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index SoundbanksInfo files and query events, banks and media")
+    parser.add_argument("bank_dir", help="GeneratedSoundBanks folder (one sub-folder per platform)")
+    parser.add_argument("--db", default=None, help=f"Default: <bank_dir>/{INDEX_NAME}")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    up = sub.add_parser("update")
+    up.add_argument("--platforms", nargs="+", default=None)
+    ev = sub.add_parser("event", help="Banks (and their media) containing an event")
+    ev.add_argument("name")
+    ev.add_argument("--platform", default=None)
+    src = sub.add_parser("source", help="Banks containing a source WAV")
+    src.add_argument("name")
+    args = parser.parse_args()
+
+    with SoundbanksIndex(args.db or Path(args.bank_dir, INDEX_NAME)) as index:
+        if args.cmd == "update":
+            for plat, r in index.update(args.bank_dir, args.platforms).items():
+                print(f"{plat}: unchanged" if r is None else f"{plat}: {r['banks']} bank(s), {r['updated']} re-indexed, {r['removed']} removed")
+        elif args.cmd == "event":
+            for hit in index.banks_for_event(args.name, args.platform):
+                media = index.media_for_bank(hit["bank"], hit["platform"])
+                print(f"{hit['platform']}/{hit['bank']} ({hit['bank_size']} bytes): event id {hit['event_id']}, "
+                      f"{len(media)} media, {sum(m['size'] or 0 for m in media)} bytes")
+        else:
+            for hit in index.banks_for_source(args.name):
+                print(f"{hit['platform']}/{hit['bank']}: media {hit['media_id']} ({hit['size']} bytes{', streamed' if hit['streamed'] else ''})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped SoundBank (.bnk) reader.
+
+A bank is a sequence of chunks: 4-byte tag, uint32 little-endian size, payload. Only chunk headers and
+the small index sections are decoded; media and other payloads are exposed as memoryviews into the map,
+so multi-GB banks are never read into memory.
+
+- BKHD: bank version and id
+- DIDX: media index, 12 bytes per entry (media id, offset inside DATA, size)
+- DATA: media payloads
+- HIRC: hierarchy objects (uint8 type, uint32 size, uint32 id, ...), decoded on first use
+- STID: bank id -> name table, decoded on first use
+"""
+
+import os
+import mmap
+import struct
+
+CHUNK_HEADER = struct.Struct("<4sI")
+DIDX_ENTRY = struct.Struct("<III")
+HIRC_HEADER = struct.Struct("<BII")
+COMPARE_BLOCK = 1024 * 1024
+
+HIRC_TYPES = {
+    1: "State", 2: "Sound", 3: "Action", 4: "Event", 5: "RandomSequenceContainer", 6: "SwitchContainer",
+    7: "ActorMixer", 8: "Bus", 9: "BlendContainer", 10: "MusicSegment", 11: "MusicTrack", 12: "MusicSwitchContainer",
+    13: "MusicPlaylistContainer", 14: "Attenuation", 15: "DialogueEvent", 16: "EffectShareSet", 17: "EffectCustom",
+    18: "AuxBus", 19: "LFO", 20: "Envelope", 21: "AudioDevice", 22: "TimeModulator",
+}
+
+
+class BankFormatError(Exception):
+    pass
+
+
+class Chunk:
+    __slots__ = ("tag", "offset", "size")
+
+    def __init__(self, tag, offset, size):
+        self.tag = tag          # e.g. "BKHD"
+        self.offset = offset    # absolute offset of the payload
+        self.size = size
+
+    @property
+    def header_offset(self):
+        return self.offset - CHUNK_HEADER.size
+
+    @property
+    def end(self):
+        return self.offset + self.size
+
+    def __repr__(self):
+        return f"Chunk({self.tag}, offset={self.offset}, size={self.size})"
+
+
+class MediaEntry:
+    __slots__ = ("id", "offset", "size")
+
+    def __init__(self, media_id, offset, size):
+        self.id = media_id
+        self.offset = offset    # absolute offset in the bank file
+        self.size = size
+
+
+class HircObject:
+    __slots__ = ("id", "type", "offset", "size")
+
+    def __init__(self, object_id, object_type, offset, size):
+        self.id = object_id
+        self.type = object_type
+        self.offset = offset    # absolute offset of the object body (after type + size)
+        self.size = size
+
+    @property
+    def type_name(self):
+        return HIRC_TYPES.get(self.type, f"Type{self.type}")
+
+
+def is_bank(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(4) == b"BKHD"
+    except OSError:
+        return False
+
+
+class Bank:
+    """Parsed view of one .bnk file. Use as a context manager or call close()."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.size = os.path.getsize(self.path)
+        self._file = open(self.path, "rb")
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.chunks = []
+        self.version = None
+        self.bank_id = None
+        self.media = {}
+        self._hirc = None
+        self._names = None
+        self._parse()
+
+    def _parse(self):
+        pos = 0
+        while pos + CHUNK_HEADER.size <= self.size:
+            tag, size = CHUNK_HEADER.unpack_from(self.map, pos)
+            start = pos + CHUNK_HEADER.size
+            if start + size > self.size:
+                raise BankFormatError(f"{self.path}: chunk {tag!r} at {pos} runs past the end of the file")
+            self.chunks.append(Chunk(tag.decode("latin-1"), start, size))
+            pos = start + size
+        if not self.chunks or self.chunks[0].tag != "BKHD":
+            raise BankFormatError(f"{self.path}: not a SoundBank (no BKHD chunk)")
+        bkhd = self.chunks[0]
+        if bkhd.size >= 8:
+            self.version, self.bank_id = struct.unpack_from("<II", self.map, bkhd.offset)
+        didx, data = self.chunk("DIDX"), self.chunk("DATA")
+        if didx is not None:
+            base = data.offset if data is not None else 0
+            for i in range(didx.size // DIDX_ENTRY.size):
+                media_id, offset, size = DIDX_ENTRY.unpack_from(self.map, didx.offset + i * DIDX_ENTRY.size)
+                self.media[media_id] = MediaEntry(media_id, base + offset, size)
+
+    def chunk(self, tag):
+        return next((c for c in self.chunks if c.tag == tag), None)
+
+    def hirc(self):
+        """{object id: HircObject}. Objects sharing an id (rare) keep the last one."""
+        if self._hirc is None:
+            self._hirc = {}
+            c = self.chunk("HIRC")
+            if c is not None and c.size >= 4:
+                count = struct.unpack_from("<I", self.map, c.offset)[0]
+                pos = c.offset + 4
+                for _ in range(count):
+                    if pos + HIRC_HEADER.size > c.end:
+                        break
+                    object_type, size, object_id = HIRC_HEADER.unpack_from(self.map, pos)
+                    body = pos + 5
+                    if body + size > c.end:
+                        raise BankFormatError(f"{self.path}: HIRC object {object_id} runs past the chunk")
+                    self._hirc[object_id] = HircObject(object_id, object_type, body, size)
+                    pos = body + size
+        return self._hirc
+
+    def names(self):
+        """{bank id: name} from STID."""
+        if self._names is None:
+            self._names = {}
+            c = self.chunk("STID")
+            if c is not None and c.size >= 8:
+                count = struct.unpack_from("<I", self.map, c.offset + 4)[0]
+                pos = c.offset + 8
+                for _ in range(count):
+                    if pos + 5 > c.end:
+                        break
+                    bank_id, length = struct.unpack_from("<IB", self.map, pos)
+                    self._names[bank_id] = bytes(self.map[pos + 5:pos + 5 + length]).decode("utf-8", "replace")
+                    pos += 5 + length
+        return self._names
+
+    def view(self, offset, size):
+        """Zero-copy view of a byte range."""
+        return memoryview(self.map)[offset:offset + size]
+
+    def payload(self, chunk):
+        return self.view(chunk.offset, chunk.size)
+
+    def fileno(self):
+        """Descriptor of the bank file, for kernel-side copies (sendfile/copy_file_range)."""
+        return self._file.fileno()
+
+    def close(self):
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def same_bytes(a, b):
+    """Compare two equally sized memoryviews block by block (no full copies)."""
+    if len(a) != len(b):
+        return False
+    for pos in range(0, len(a), COMPARE_BLOCK):
+        if a[pos:pos + COMPARE_BLOCK] != b[pos:pos + COMPARE_BLOCK]:
+            return False
+    return True
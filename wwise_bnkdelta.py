@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Binary delta patches between two SoundBank builds.
+
+A patch rebuilds the new file as a list of operations: copy a range of the old file, or append literal
+bytes stored in the patch. For .bnk files the operations follow the bank structure (wwise_bnk.py):
+- every chunk identical in the old bank (same tag, same bytes) is one copy;
+- inside DATA, media are matched by their DIDX media id, so an unchanged media entry is copied from
+  wherever it sat in the old bank, even if other media moved around it;
+- everything else (changed chunks, new or changed media, padding) is literal.
+Other files are compared in fixed blocks at the same offsets.
+
+Patches record the SHA-256 of the old and the new file; apply refuses a wrong base and verifies the result.
+Both sides work through memory maps and bounded block copies, so multi-GB banks are never loaded whole.
+
+    python wwise_bnkdelta.py make  OLD_DIR NEW_DIR --out PATCH_DIR
+    python wwise_bnkdelta.py apply OLD_DIR PATCH_DIR [--out NEW_DIR]     (default: update OLD_DIR in place)
+"""
+
+import os
+import json
+import mmap
+import shutil
+import struct
+import fnmatch
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from wwise_bnk import Bank, BankFormatError, is_bank, same_bytes
+from wwise_cache import file_digest, atomic_write_text
+from wwise_bankcache import IGNORE_PATTERNS
+
+MAGIC = b"WBDP"
+PATCH_VERSION = 1
+HEADER = struct.Struct("<4sHH32s32sQI")
+OP = struct.Struct("<BQQ")
+OP_COPY, OP_LITERAL = 0, 1
+BLOCK = 64 * 1024
+IO_BLOCK = 1024 * 1024
+PATCH_SUFFIX = ".wbdp"
+INDEX_NAME = "patch_index.json"
+
+
+class PatchError(Exception):
+    pass
+
+
+class _OpList:
+    """Collects (kind, offset, length) and merges ranges that continue the previous one."""
+
+    def __init__(self):
+        self.ops = []
+
+    def add(self, kind, offset, length):
+        if length <= 0:
+            return
+        if self.ops:
+            k, o, n = self.ops[-1]
+            if k == kind and o + n == offset:
+                self.ops[-1] = (k, o, n + length)
+                return
+        self.ops.append((kind, offset, length))
+
+
+def bank_ops(old, new):
+    """Ops rebuilding bank `new` from bank `old`. Literal offsets point into the new file."""
+    ops = _OpList()
+    for c in new.chunks:
+        if c.tag != "DATA":
+            o = old.chunk(c.tag)
+            if o is not None and o.size == c.size and same_bytes(old.payload(o), new.payload(c)):
+                ops.add(OP_COPY, o.header_offset, c.size + 8)
+            else:
+                ops.add(OP_LITERAL, c.header_offset, c.size + 8)
+            continue
+        ops.add(OP_LITERAL, c.header_offset, 8)
+        pos = c.offset
+        for entry in sorted(new.media.values(), key=lambda e: e.offset):
+            if entry.offset < pos or entry.offset + entry.size > c.end:
+                break   # overlapping or out-of-range index: the rest of DATA goes in as literal
+            ops.add(OP_LITERAL, pos, entry.offset - pos)
+            prev = old.media.get(entry.id)
+            if prev is not None and prev.size == entry.size and \
+                    same_bytes(old.view(prev.offset, prev.size), new.view(entry.offset, entry.size)):
+                ops.add(OP_COPY, prev.offset, entry.size)
+            else:
+                ops.add(OP_LITERAL, entry.offset, entry.size)
+            pos = entry.offset + entry.size
+        ops.add(OP_LITERAL, pos, c.end - pos)
+    return ops.ops
+
+
+def block_ops(old_map, new_map):
+    """Ops for any file: equal BLOCK-sized blocks at the same offset are copied."""
+    ops = _OpList()
+    old_view, new_view = memoryview(old_map), memoryview(new_map)
+    for pos in range(0, len(new_view), BLOCK):
+        end = min(pos + BLOCK, len(new_view))
+        if end <= len(old_view) and old_view[pos:end] == new_view[pos:end]:
+            ops.add(OP_COPY, pos, end - pos)
+        else:
+            ops.add(OP_LITERAL, pos, end - pos)
+    return ops.ops
+
+
+def _map(f, size):
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+
+def make_patch(old_path, new_path, patch_path):
+    """Write a patch turning old_path into new_path. Returns the patch size in bytes."""
+    new_size = os.path.getsize(new_path)
+    if is_bank(old_path) and is_bank(new_path):
+        try:
+            with Bank(old_path) as old, Bank(new_path) as new:
+                ops = bank_ops(old, new)
+        except BankFormatError:
+            ops = None
+    else:
+        ops = None
+    with open(old_path, "rb") as fo, open(new_path, "rb") as fn:
+        old_map, new_map = _map(fo, os.path.getsize(old_path)), _map(fn, new_size)
+        try:
+            if ops is None:
+                ops = block_ops(old_map, new_map)
+            header = HEADER.pack(MAGIC, PATCH_VERSION, 0, bytes.fromhex(file_digest(old_path)),
+                                 bytes.fromhex(file_digest(new_path)), new_size, len(ops))
+            tmp = str(patch_path) + ".part"
+            os.makedirs(os.path.dirname(os.path.abspath(patch_path)), exist_ok=True)
+            with open(tmp, "wb") as out:
+                out.write(header)
+                literal = 0
+                for kind, offset, length in ops:
+                    out.write(OP.pack(kind, literal if kind == OP_LITERAL else offset, length))
+                    if kind == OP_LITERAL:
+                        literal += length
+                with memoryview(new_map) as view:
+                    for kind, offset, length in ops:
+                        if kind == OP_LITERAL:
+                            for pos in range(offset, offset + length, IO_BLOCK):
+                                out.write(view[pos:min(pos + IO_BLOCK, offset + length)])
+            os.replace(tmp, patch_path)
+        finally:
+            for m in (old_map, new_map):
+                if isinstance(m, mmap.mmap):
+                    m.close()
+    return os.path.getsize(patch_path)
+
+
+def _copy_range(view, offset, length, out, h):
+    for pos in range(offset, offset + length, IO_BLOCK):
+        block = view[pos:min(pos + IO_BLOCK, offset + length)]
+        h.update(block)
+        out.write(block)
+
+
+def apply_patch(old_path, patch_path, out_path):
+    """Rebuild the new file from old_path + patch into out_path (verified against the recorded hash)."""
+    with open(patch_path, "rb") as pf:
+        magic, version, _, old_hash, new_hash, new_size, count = HEADER.unpack(pf.read(HEADER.size))
+        if magic != MAGIC or version != PATCH_VERSION:
+            raise PatchError(f"{patch_path}: not a bank delta patch")
+        if file_digest(old_path) != old_hash.hex():
+            raise PatchError(f"{old_path}: base file does not match the patch")
+        ops = [OP.unpack(pf.read(OP.size)) for _ in range(count)]
+        literal_base = pf.tell()
+        tmp = str(out_path) + ".part"
+        h = hashlib.sha256()
+        with open(old_path, "rb") as fo, open(tmp, "wb") as out:
+            old_map = _map(fo, os.path.getsize(old_path))
+            try:
+                with memoryview(old_map) as view:
+                    for kind, offset, length in ops:
+                        if kind == OP_COPY:
+                            _copy_range(view, offset, length, out, h)
+                        else:
+                            pf.seek(literal_base + offset)
+                            left = length
+                            while left > 0:
+                                block = pf.read(min(IO_BLOCK, left))
+                                if not block:
+                                    raise PatchError(f"{patch_path}: truncated")
+                                h.update(block)
+                                out.write(block)
+                                left -= len(block)
+            finally:
+                if isinstance(old_map, mmap.mmap):
+                    old_map.close()
+    if h.hexdigest() != new_hash.hex() or os.path.getsize(tmp) != new_size:
+        os.unlink(tmp)
+        raise PatchError(f"{patch_path}: result does not match the expected file")
+    os.replace(tmp, out_path)
+
+
+def _files(root):
+    result = {}
+    for r, _, fs in os.walk(root):
+        for f in fs:
+            if not any(fnmatch.fnmatch(f, p) for p in IGNORE_PATTERNS):
+                full = os.path.join(r, f)
+                result[Path(os.path.relpath(full, root)).as_posix()] = full
+    return result
+
+
+def make_patches(old_dir, new_dir, out_dir, workers=None, logger=None):
+    """Patch set for a whole output folder (all platforms). Returns the index written to patch_index.json."""
+    old_files, new_files = _files(old_dir), _files(new_dir)
+    index = {"v": PATCH_VERSION, "patched": [], "full": [], "removed": sorted(set(old_files) - set(new_files)), "unchanged": []}
+
+    def one(rel):
+        new_path = new_files[rel]
+        new_size = os.path.getsize(new_path)
+        old_path = old_files.get(rel)
+        if old_path and os.path.getsize(old_path) == new_size and file_digest(old_path) == file_digest(new_path):
+            return "unchanged", {"path": rel}
+        entry = {"path": rel, "size": new_size, "sha256": file_digest(new_path)}
+        if old_path:
+            patch = os.path.join(out_dir, "patches", rel + PATCH_SUFFIX)
+            entry["patch_bytes"] = make_patch(old_path, new_path, patch)
+            if entry["patch_bytes"] < new_size:
+                return "patched", entry
+            os.unlink(patch)
+        dest = os.path.join(out_dir, "files", rel)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copyfile(new_path, dest)
+        return "full", entry
+
+    with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+        for kind, entry in pool.map(one, sorted(new_files)):
+            index[kind].append(entry)
+    index["unchanged"] = [e["path"] for e in index["unchanged"]]
+    patched_new = sum(e["size"] for e in index["patched"])
+    patched_bytes = sum(e["patch_bytes"] for e in index["patched"])
+    index["summary"] = {"patched_files": len(index["patched"]), "new_bytes": patched_new, "patch_bytes": patched_bytes,
+                        "full_files": len(index["full"]), "full_bytes": sum(e["size"] for e in index["full"]),
+                        "removed_files": len(index["removed"]), "unchanged_files": len(index["unchanged"])}
+    atomic_write_text(os.path.join(out_dir, INDEX_NAME), json.dumps(index, indent=2))
+    if logger:
+        s = index["summary"]
+        logger.write(f"Delta: {s['patched_files']} patched ({s['new_bytes'] / 1048576.0:.1f} MB -> {s['patch_bytes'] / 1048576.0:.1f} MB), "
+                     f"{s['full_files']} full, {s['removed_files']} removed, {s['unchanged_files']} unchanged")
+    return index
+
+
+def apply_patches(old_dir, patch_dir, out_dir=None):
+    """Apply a patch set to old_dir, writing to out_dir (default: old_dir in place)."""
+    with open(os.path.join(patch_dir, INDEX_NAME), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    out_dir = out_dir or old_dir
+    in_place = os.path.abspath(out_dir) == os.path.abspath(old_dir)
+    for entry in index["patched"]:
+        dest = os.path.join(out_dir, entry["path"])
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        apply_patch(os.path.join(old_dir, entry["path"]), os.path.join(patch_dir, "patches", entry["path"] + PATCH_SUFFIX), dest)
+    for entry in index["full"]:
+        dest = os.path.join(out_dir, entry["path"])
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copyfile(os.path.join(patch_dir, "files", entry["path"]), dest + ".part")
+        if file_digest(dest + ".part") != entry["sha256"]:
+            os.unlink(dest + ".part")
+            raise PatchError(f"{entry['path']}: corrupt file in patch set")
+        os.replace(dest + ".part", dest)
+    if in_place:
+        for rel in index["removed"]:
+            try:
+                os.unlink(os.path.join(old_dir, rel))
+            except FileNotFoundError:
+                pass
+    else:
+        for rel in index["unchanged"]:
+            dest = os.path.join(out_dir, rel)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copy2(os.path.join(old_dir, rel), dest)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delta patches between two SoundBank output folders")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("make")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--out", required=True)
+    p = sub.add_parser("apply")
+    p.add_argument("old")
+    p.add_argument("patch_dir")
+    p.add_argument("--out", default=None, help="Default: update OLD in place")
+    args = parser.parse_args()
+
+    class _Print:
+        def write(self, msg):
+            print(msg)
+
+    if args.cmd == "make":
+        if os.path.isfile(args.new):
+            size = make_patch(args.old, args.new, args.out)
+            print(f"{args.out}: {size} bytes for {os.path.getsize(args.new)} bytes")
+        else:
+            make_patches(args.old, args.new, args.out, logger=_Print())
+    else:
+        if os.path.isfile(args.patch_dir):
+            apply_patch(args.old, args.patch_dir, args.out or args.old)
+        else:
+            index = apply_patches(args.old, args.patch_dir, args.out)
+            print(f"Applied {len(index['patched'])} patch(es), {len(index['full'])} full file(s)")
+
+
+if __name__ == "__main__":
+    main()
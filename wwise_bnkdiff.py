@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Section-level SoundBank diff (bnk-diff).
+
+Compares two generated banks chunk by chunk instead of byte by byte:
+- BKHD: bank version and id
+- chunk sizes
+- DIDX: media added / removed / resized / changed in place
+- HIRC: objects added / removed / changed, by id and type
+- STID: bank names added / removed / renamed
+
+Both banks are memory-mapped (wwise_bnk.Bank); only the index sections are decoded and payloads are
+compared as memoryviews, so typical banks are diffed in a few milliseconds.
+
+    python wwise_bnkdiff.py OLD.bnk NEW.bnk [--json]
+    python wwise_bnkdiff.py OLD_DIR NEW_DIR          # every .bnk present in either folder
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+from wwise_bnk import Bank, BankFormatError, same_bytes
+
+LIST_LIMIT = 20     # items per section listed by format_diff()
+
+
+def _same(old, new, a, b):
+    return a.size == b.size and same_bytes(old.view(a.offset, a.size), new.view(b.offset, b.size))
+
+
+def diff_banks(old_path, new_path):
+    """Report dict for two banks. Empty sections mean no change."""
+    start = time.perf_counter()
+    with Bank(old_path) as old, Bank(new_path) as new:
+        report = {"old": str(old_path), "new": str(new_path), "old_bytes": old.size, "new_bytes": new.size}
+        if old.version != new.version:
+            report["version"] = [old.version, new.version]
+        if old.bank_id != new.bank_id:
+            report["bank_id"] = [old.bank_id, new.bank_id]
+
+        old_chunks = {c.tag: c.size for c in old.chunks}
+        new_chunks = {c.tag: c.size for c in new.chunks}
+        report["chunks"] = {tag: [old_chunks.get(tag), new_chunks.get(tag)]
+                            for tag in sorted(set(old_chunks) | set(new_chunks))
+                            if old_chunks.get(tag) != new_chunks.get(tag)}
+
+        media = {"added": [], "removed": [], "resized": [], "changed": []}
+        for mid in sorted(set(old.media) | set(new.media)):
+            a, b = old.media.get(mid), new.media.get(mid)
+            if a is None:
+                media["added"].append({"id": mid, "size": b.size})
+            elif b is None:
+                media["removed"].append({"id": mid, "size": a.size})
+            elif a.size != b.size:
+                media["resized"].append({"id": mid, "old_size": a.size, "new_size": b.size})
+            elif not _same(old, new, a, b):
+                media["changed"].append({"id": mid, "size": a.size})
+        report["media"] = media
+
+        old_hirc, new_hirc = old.hirc(), new.hirc()
+        hirc = {"added": [], "removed": [], "changed": []}
+        for oid in sorted(set(old_hirc) | set(new_hirc)):
+            a, b = old_hirc.get(oid), new_hirc.get(oid)
+            if a is None:
+                hirc["added"].append({"id": oid, "type": b.type_name, "size": b.size})
+            elif b is None:
+                hirc["removed"].append({"id": oid, "type": a.type_name, "size": a.size})
+            elif a.type != b.type or not _same(old, new, a, b):
+                hirc["changed"].append({"id": oid, "type": b.type_name, "old_type": a.type_name,
+                                        "old_size": a.size, "new_size": b.size})
+        report["hirc"] = hirc
+
+        old_names, new_names = old.names(), new.names()
+        names = {"added": [], "removed": [], "renamed": []}
+        for bid in sorted(set(old_names) | set(new_names)):
+            a, b = old_names.get(bid), new_names.get(bid)
+            if a is None:
+                names["added"].append({"id": bid, "name": b})
+            elif b is None:
+                names["removed"].append({"id": bid, "name": a})
+            elif a != b:
+                names["renamed"].append({"id": bid, "old": a, "new": b})
+        report["names"] = names
+    report["identical"] = not (report.get("version") or report.get("bank_id") or report["chunks"]
+                               or any(media.values()) or any(hirc.values()) or any(names.values()))
+    report["seconds"] = round(time.perf_counter() - start, 4)
+    return report
+
+
+def diff_dirs(old_dir, new_dir):
+    """{relative path: report} for every .bnk in either folder; banks missing on one side or unreadable are reported as such."""
+    def banks(root):
+        root = Path(root)
+        return {p.relative_to(root).as_posix(): p for p in root.rglob("*.bnk")} if root.is_dir() else {}
+    old, new = banks(old_dir), banks(new_dir)
+    reports = {}
+    for rel in sorted(set(old) | set(new)):
+        if rel not in new:
+            reports[rel] = {"removed": True, "old_bytes": os.path.getsize(old[rel])}
+        elif rel not in old:
+            reports[rel] = {"added": True, "new_bytes": os.path.getsize(new[rel])}
+        else:
+            try:
+                reports[rel] = diff_banks(old[rel], new[rel])
+            except BankFormatError as e:
+                reports[rel] = {"error": str(e)}
+    return reports
+
+
+def summary(report):
+    """One line per bank, for logs."""
+    if report.get("added"):
+        return f"new bank ({report['new_bytes']} bytes)"
+    if report.get("removed"):
+        return "bank removed"
+    if report.get("error"):
+        return f"not compared: {report['error']}"
+    if report["identical"]:
+        return "identical"
+    m, h, n = report["media"], report["hirc"], report["names"]
+    parts = [f"{report['new_bytes'] - report['old_bytes']:+d} bytes"]
+    if report.get("version"):
+        parts.append("version {} -> {}".format(*report["version"]))
+    if any(m.values()):
+        parts.append(f"media +{len(m['added'])} -{len(m['removed'])} ~{len(m['resized']) + len(m['changed'])}")
+    if any(h.values()):
+        parts.append(f"HIRC +{len(h['added'])} -{len(h['removed'])} ~{len(h['changed'])}")
+    if any(n.values()):
+        parts.append(f"names +{len(n['added'])} -{len(n['removed'])} ~{len(n['renamed'])}")
+    return ", ".join(parts)
+
+
+def format_diff(report, limit=LIST_LIMIT):
+    lines = [f"{report.get('old', '')} -> {report.get('new', '')}: {summary(report)}"]
+    if report.get("added") or report.get("removed") or report.get("error") or report.get("identical"):
+        return "\n".join(lines)
+    if report.get("bank_id"):
+        lines.append("  bank id {} -> {}".format(*report["bank_id"]))
+    for tag, (a, b) in report["chunks"].items():
+        lines.append(f"  chunk {tag}: {a if a is not None else '-'} -> {b if b is not None else '-'} bytes")
+
+    def section(title, items, fmt):
+        if not items:
+            return
+        lines.append(f"  {title} ({len(items)}):")
+        lines.extend("    " + fmt(i) for i in items[:limit])
+        if len(items) > limit:
+            lines.append(f"    ... {len(items) - limit} more")
+
+    m, h, n = report["media"], report["hirc"], report["names"]
+    section("media added", m["added"], lambda i: f"{i['id']} ({i['size']} bytes)")
+    section("media removed", m["removed"], lambda i: f"{i['id']} ({i['size']} bytes)")
+    section("media resized", m["resized"], lambda i: f"{i['id']} {i['old_size']} -> {i['new_size']} bytes")
+    section("media changed", m["changed"], lambda i: f"{i['id']} ({i['size']} bytes)")
+    section("HIRC added", h["added"], lambda i: f"{i['type']} {i['id']} ({i['size']} bytes)")
+    section("HIRC removed", h["removed"], lambda i: f"{i['type']} {i['id']} ({i['size']} bytes)")
+    section("HIRC changed", h["changed"], lambda i: (f"{i['type']} {i['id']} {i['old_size']} -> {i['new_size']} bytes"
+                                                      + (f" (was {i['old_type']})" if i["old_type"] != i["type"] else "")))
+    section("names added", n["added"], lambda i: f"{i['id']} {i['name']}")
+    section("names removed", n["removed"], lambda i: f"{i['id']} {i['name']}")
+    section("names renamed", n["renamed"], lambda i: f"{i['id']} {i['old']} -> {i['new']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="bnk-diff", description="Section-level diff of two SoundBanks (or two bank folders)")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    parser.add_argument("--limit", type=int, default=LIST_LIMIT, help="Items listed per section")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.old) or os.path.isdir(args.new):
+        reports = diff_dirs(args.old, args.new)
+    else:
+        reports = {os.path.basename(args.new): diff_banks(args.old, args.new)}
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for rel, report in reports.items():
+            print(format_diff(report, args.limit) if "media" in report else f"{rel}: {summary(report)}")
+    sys.exit(0 if all(r.get("identical") for r in reports.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Shared cache helpers for the Wwise batch tools.
+
+- cache_root(): per-user cache folder (override with WWISE_BATCH_CACHE)
+- JsonStore: small JSON dict persisted atomically
+- DigestCache: content hashes of files, memoized by (size, mtime) so unchanged files are never re-read
+"""
+
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def cache_root(*parts):
+    """Return (and create) the tool cache folder, optionally a sub-folder of it."""
+    base = os.environ.get("WWISE_BATCH_CACHE")
+    if not base:
+        if sys.platform == "darwin":
+            base = Path.home() / "Library/Caches/WwiseBatchTool"
+        elif sys.platform.startswith("win"):
+            base = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "WwiseBatchTool" / "Cache"
+        else:
+            base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "wwise_batch"
+    path = Path(base, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def atomic_write_text(path, text):
+    """Write text to path through a temp file + rename so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def file_digest(path, algo="sha256"):
+    """Hash a whole file in 1 MB chunks and return the hex digest."""
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class JsonStore:
+    """Dict-like JSON file. Call save() to persist; writes are atomic and thread-safe."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.data = {}
+        self._dirty = False
+        try:
+            if self.path.exists():
+                self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            # a corrupt cache is just an empty cache
+            self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def put(self, key, value):
+        with self._lock:
+            self.data[key] = value
+            self._dirty = True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key in self.data:
+                self._dirty = True
+            return self.data.pop(key, default)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_text(self.path, json.dumps(self.data, separators=(",", ":")))
+            self._dirty = False
+
+
+class DigestCache:
+    """Content hashes keyed by absolute path and validated by size + mtime.
+
+    Only files whose size or mtime changed since the last run are hashed again.
+    """
+
+    def __init__(self, path=None, algo="sha256"):
+        self.algo = algo
+        self.store = JsonStore(path or cache_root() / f"digests_{algo}.json")
+
+    def digest(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        hit = self.store.get(path)
+        if hit and hit[:2] == stamp:
+            return hit[2]
+        value = file_digest(path, self.algo)
+        self.store.put(path, stamp + [value])
+        return value
+
+    def save(self):
+        self.store.save()
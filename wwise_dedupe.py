@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Exact-duplicate WAV detection.
+
+Files are first grouped by sample format + data chunk size (read from the header only), so most files
+are never hashed. Candidates sharing a group get their data chunk hashed in a thread pool; files with the
+same format and the same sample bytes are duplicates even if their names or metadata chunks differ.
+"""
+
+import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from wwise_wavio import read_info, data_view
+
+
+def data_digest(info):
+    """SHA-256 of the format key and the raw data chunk of a WAV (hashed straight from the mapped file)."""
+    h = hashlib.sha256(repr(info.fmt_key()).encode())
+    with data_view(info) as view:
+        h.update(view)
+    return h.hexdigest()
+
+
+def find_duplicates(wavs, workers=None, logger=None):
+    """Return a list of duplicate groups, each a sorted list of paths (first entry = canonical file).
+
+    Paths are returned exactly as passed in, so callers can look their own strings up in alias_map().
+    """
+    by_size = {}
+    for w in wavs:
+        try:
+            info = read_info(w)
+        except Exception as e:
+            if logger:
+                logger.write(f"Dedupe: skipping {w}: {e}")
+            continue
+        by_size.setdefault((info.fmt_key(), info.data_size), []).append((w, info))
+
+    candidates = [entry for group in by_size.values() if len(group) > 1 for entry in group]
+    if not candidates:
+        return []
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        digests = list(pool.map(data_digest, [info for _, info in candidates]))
+
+    by_digest = {}
+    for (w, _), digest in zip(candidates, digests):
+        by_digest.setdefault(digest, []).append(w)
+    return sorted(sorted(paths) for paths in by_digest.values() if len(paths) > 1)
+
+
+def alias_map(groups):
+    """{duplicate_path: canonical_path} for every non-canonical member of each group."""
+    return {dup: group[0] for group in groups for dup in group[1:]}
+
+
+def write_report(groups, path):
+    wasted = 0
+    for group in groups:
+        try:
+            wasted += os.path.getsize(group[0]) * (len(group) - 1)
+        except OSError:
+            pass
+    report = {"groups": [{"canonical": g[0], "duplicates": g[1:]} for g in groups],
+              "duplicate_files": sum(len(g) - 1 for g in groups),
+              "wasted_bytes": wasted}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find byte/sample-identical WAV files")
+    parser.add_argument("input", help="WAV folder")
+    parser.add_argument("--report", help="Write the duplicate groups as JSON")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    wavs = [os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith(".wav")]
+    groups = find_duplicates(wavs, args.workers)
+    for g in groups:
+        print(g[0])
+        for dup in g[1:]:
+            print(f"  = {dup}")
+    if args.report:
+        report = write_report(groups, args.report)
+        print(f"{report['duplicate_files']} duplicate file(s), {report['wasted_bytes'] / 1048576.0:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
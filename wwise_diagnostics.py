@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Structured diagnostics from WwiseConsole output.
+
+ConsoleDiagnostics is fed the console's output line by line:
+
+- every line goes, unchanged, to a gzip-compressed raw log (one "$ command" header per console call)
+- a case-sensitive gate pattern passes only lines that can carry a severity ("rror", "arning", "atal"); the
+  rest are info and are only counted
+- gated lines are classified into a Diagnostic: severity (fatal / error / warning), code (the message ID
+  when the line has one, e.g. "[SourceFileNotFound]", else the category), category (license, missing_file,
+  conversion, plugin, soundbank, other), Wwise object path and file
+- warnings and errors go to the human log, up to max_per_code lines per code; the rest are counted and kept
+  in the report (summary()) and in the raw log
+
+    python wwise_diagnostics.py WwiseBatchLog_20250101_120000_console.log.gz
+    python wwise_diagnostics.py console.txt --json
+"""
+
+import re
+import gzip
+import json
+import argparse
+
+GATE = re.compile(r"rror|RROR|arning|ARNING|atal|ATAL")
+SEVERITY = re.compile(r"^\W*(?:\[[^\]]*\]\W*)?(fatal error|error|warning)\b|\b(fatal error|error|warning)\s*:", re.IGNORECASE)
+CODE = re.compile(r"[\[(]([A-Z][a-z0-9]+(?:[A-Z][A-Za-z0-9]*)+|[A-Za-z][A-Za-z0-9]*_[A-Za-z0-9_]+)[\])]")
+CATEGORIES = (
+    ("license", re.compile(r"licen[cs]e", re.IGNORECASE)),
+    ("plugin", re.compile(r"plug-?in", re.IGNORECASE)),
+    ("missing_file", re.compile(r"not ?found|missing|can(?:not|'t) (?:find|open)|could not (?:find|open)|does not exist|no such file", re.IGNORECASE)),
+    ("conversion", re.compile(r"conver[st]|encod|decod|sample rate", re.IGNORECASE)),
+    ("soundbank", re.compile(r"sound ?bank|generat", re.IGNORECASE)),
+)
+ROOTS = ("Actor-Mixer Hierarchy|Master-Mixer Hierarchy|Interactive Music Hierarchy|Containers|Events|SoundBanks|"
+         "Busses|Switches|States|Game Parameters|Effects|Attenuations")
+# Wwise names contain spaces: an unquoted path runs to a ':' (or quote, bracket, ',', ';') or the end of the line
+OBJECT_PATH = re.compile(r"['\"](\\(?:%s)[^'\"]*)['\"]|(\\(?:%s)(?:\\[^\\:'\"(),;\r\n]+)*)" % (ROOTS, ROOTS))
+EXTENSIONS = r"wav|wem|bnk|wwu|wproj|wsources"
+FILE = re.compile(r"['\"]([^'\"]+\.(?:%s))['\"]|((?:[A-Za-z]:)?(?:[^\s'\"]*[\\/])?[^\s'\"\\/]+\.(?:%s))\b" % (EXTENSIONS, EXTENSIONS),
+                  re.IGNORECASE)
+SEVERITIES = ("fatal", "error", "warning")
+RAW_BUFFER = 2048      # lines per write to the compressed raw log
+
+
+class Diagnostic:
+    __slots__ = ("severity", "code", "category", "object_path", "file", "message")
+
+    def __init__(self, severity, code, category, object_path, file, message):
+        self.severity = severity
+        self.code = code
+        self.category = category
+        self.object_path = object_path
+        self.file = file
+        self.message = message
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+def _first_group(pattern, line):
+    m = pattern.search(line)
+    return (m.group(1) or m.group(2)).rstrip(" \t.") if m else None
+
+
+def classify(line):
+    """Diagnostic for a warning/error line, None for info."""
+    if not GATE.search(line):
+        return None
+    m = SEVERITY.search(line)
+    if not m:
+        return None
+    severity = (m.group(1) or m.group(2)).lower()
+    severity = "fatal" if severity.startswith("fatal") else severity
+    category = next((name for name, pattern in CATEGORIES if pattern.search(line)), "other")
+    code = CODE.search(line)
+    return Diagnostic(severity, code.group(1) if code else category, category, _first_group(OBJECT_PATH, line),
+                      _first_group(FILE, line), line.strip())
+
+
+class ConsoleDiagnostics:
+    """Streaming classifier for the console calls of one run. verbose=True also logs every info line."""
+
+    def __init__(self, raw_path=None, logger=None, verbose=False, max_per_code=20, samples=100):
+        self.raw_path = raw_path
+        self.logger = logger
+        self.verbose = verbose
+        self.max_per_code = max_per_code
+        self.samples = samples
+        self.lines = 0
+        self.info = 0
+        self.severity = {}
+        self.codes = {}
+        self.categories = {}
+        self.examples = {}
+        self._call = None
+        self._buffer = []
+        # level 1: the raw log is written once and rarely read; higher levels cost more than the classification
+        self._raw = gzip.open(raw_path, "wt", encoding="utf-8", compresslevel=1) if raw_path else None
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _flush(self):
+        if self._buffer:
+            self._raw.write("".join(self._buffer))
+            self._buffer.clear()
+
+    def begin(self, cmd):
+        if self._raw:
+            self._buffer.append("$ " + " ".join(str(c) for c in cmd) + "\n")
+        self._call = {"lines": 0, "info": 0, **{s: 0 for s in SEVERITIES}}
+
+    def feed(self, line):
+        """Record one console output line. Returns its Diagnostic, or None for info."""
+        if self._raw:
+            self._buffer.append(line if line.endswith("\n") else line + "\n")
+            if len(self._buffer) >= RAW_BUFFER:
+                self._flush()
+        self.lines += 1
+        call = self._call
+        if call is not None:
+            call["lines"] += 1
+        d = classify(line) if GATE.search(line) else None
+        if d is None:
+            self.info += 1
+            if call is not None:
+                call["info"] += 1
+            if self.verbose:
+                self._log(line.strip())
+            return None
+        self.severity[d.severity] = self.severity.get(d.severity, 0) + 1
+        self.categories[d.category] = self.categories.get(d.category, 0) + 1
+        count = self.codes[d.code] = self.codes.get(d.code, 0) + 1
+        if call is not None:
+            call[d.severity] += 1
+        examples = self.examples.setdefault(d.code, [])
+        if len(examples) < self.samples:
+            examples.append(d.to_dict())
+        if self.verbose or count <= self.max_per_code:
+            self._log(d.message)
+        elif count == self.max_per_code + 1:
+            self._log(f"(more '{d.code}' {d.severity}s are only counted; see DiagnosticsReport.json and the raw console log)")
+        return d
+
+    def end(self, rc=None):
+        """Log the one-line summary of the current console call."""
+        call, self._call = self._call, None
+        if self._raw:
+            self._flush()
+        if call is None:
+            return
+        problems = ", ".join(f"{call[s]} {s}(s)" for s in SEVERITIES if call[s]) or "no warnings or errors"
+        collapsed = f", {call['info']} info line(s) collapsed" if call["info"] and not self.verbose else ""
+        self._log(f"WwiseConsole: {call['lines']} line(s), {problems}{collapsed}" + (f" (exit code {rc})" if rc else ""))
+
+    def summary(self):
+        return {"lines": self.lines, "info": self.info, "severity": self.severity,
+                "categories": dict(sorted(self.categories.items(), key=lambda kv: -kv[1])),
+                "codes": dict(sorted(self.codes.items(), key=lambda kv: -kv[1])),
+                "examples": self.examples, "raw_log": self.raw_path}
+
+    def write_report(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
+
+    def close(self):
+        if self._raw:
+            self._flush()
+            self._raw.close()
+            self._raw = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify the warnings and errors of a saved WwiseConsole log (.gz or text)")
+    parser.add_argument("log")
+    parser.add_argument("--json", action="store_true", help="Print the full summary as JSON")
+    parser.add_argument("--limit", type=int, default=5, help="Example lines per code")
+    args = parser.parse_args()
+
+    diagnostics = ConsoleDiagnostics(samples=args.limit)
+    opener = gzip.open if args.log.endswith(".gz") else open
+    with opener(args.log, "rt", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if not line.startswith("$ "):
+                diagnostics.feed(line)
+    result = diagnostics.summary()
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"{result['lines']} line(s), {result['info']} info; " +
+          (", ".join(f"{result['severity'][s]} {s}(s)" for s in SEVERITIES if s in result["severity"]) or "no warnings or errors"))
+    for code, count in result["codes"].items():
+        print(f"{count:>7}  {code}")
+        for e in result["examples"][code]:
+            print(f"         {e['message']}")
+    raise SystemExit(1 if result["severity"].get("error") or result["severity"].get("fatal") else 0)
+
+
+if __name__ == "__main__":
+    main()
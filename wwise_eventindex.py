@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Compact binary event index for the game client, one file per platform (<platform>/EventIndex.bin).
+
+Built from the platform's SoundbanksInfo and banks, optionally restricted to the events this tool created.
+SoundbanksInfo does not say which media an event plays, so the media bytes column is only filled when the
+caller passes {event: source file} (the worker does, for the events it created); an index of every event
+(events=None, the command line) has 0 media bytes throughout.
+Everything is little-endian and 4-byte aligned so the runtime can map the file and binary-search it in place:
+
+    header      4s magic "WEVX", u16 version, u16 reserved, u32 event count, u32 bank count, 32s set digest
+    u32[n]      event short IDs, sorted
+    u32[n]      media bytes of each event (its source in the bank; 0 when unknown, see above)
+    u16[n]      bank index of each event (+ padding to 4 bytes)
+    u32[b]      bank short IDs
+    u32[b]      bank file sizes
+    u32[b + 1]  offsets of the bank names in the name blob
+    bytes       UTF-8 bank names
+
+An event present in several banks points to the first one listed in SoundbanksInfo. The set digest covers
+the banks' and SoundbanksInfo's (size, mtime) and the event list; the file is rebuilt only when it changes.
+
+    python wwise_eventindex.py GeneratedSoundBanks/Windows
+    python wwise_eventindex.py GeneratedSoundBanks/Windows --lookup Play_Footstep
+"""
+
+import os
+import sys
+import mmap
+import json
+import struct
+import bisect
+import hashlib
+import argparse
+from array import array
+from pathlib import Path
+
+from wwise_bnk import Bank, BankFormatError
+from wwise_bankinfo import find_info, iter_banks, media_size
+from wwise_ids import short_id
+
+INDEX_FILE = "EventIndex.bin"
+MAGIC = b"WEVX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII32s")
+
+
+def set_digest(platform_dir, events=None):
+    """Digest of the bank set (.bnk + SoundbanksInfo stamps) and of the event list."""
+    stamps = []
+    for p in sorted(Path(platform_dir).rglob("*")):
+        if p.suffix.lower() == ".bnk" or p.name.startswith("SoundbanksInfo."):
+            st = p.stat()
+            stamps.append([p.relative_to(platform_dir).as_posix(), st.st_size, st.st_mtime_ns])
+    payload = json.dumps([stamps, sorted((events or {}).items())])
+    return hashlib.sha256(payload.encode()).digest()
+
+
+def _packed(typecode, values):
+    a = array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+
+def read_digest(path):
+    try:
+        with open(path, "rb") as f:
+            magic, version, _, _, _, digest = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    return digest if magic == MAGIC and version == VERSION else None
+
+
+def build_index(platform_dir, out_path=None, events=None):
+    """Write the index for platform_dir. events: {event name: source file name} or None for every event.
+
+    Returns (path, rebuilt).
+    """
+    out_path = str(out_path or os.path.join(platform_dir, INDEX_FILE))
+    digest = set_digest(platform_dir, events)
+    if read_digest(out_path) == digest:
+        return out_path, False
+    info = find_info(platform_dir)
+    if info is None:
+        raise FileNotFoundError(f"no SoundbanksInfo in {platform_dir}")
+    wanted = {name.lower(): source for name, source in events.items()} if events is not None else None
+
+    banks, entries = [], {}         # entries: event id -> (bank index, media bytes)
+    for b in iter_banks(info):
+        bank_file = os.path.join(platform_dir, b.get("path") or "")
+        hits = [(eid, name) for eid, name in b["events"] if wanted is None or name.lower() in wanted]
+        if not hits:
+            continue
+        by_source = {}
+        if wanted:
+            # event -> media only comes from the caller's event -> source map
+            sizes = {}
+            if any(not m["streamed"] for m in b["media"]):
+                try:
+                    with Bank(bank_file) as bank:
+                        sizes = {mid: e.size for mid, e in bank.media.items()}
+                except (OSError, BankFormatError):
+                    pass
+            by_source = {(m["source"] or "").lower(): media_size(platform_dir, m, sizes) or 0 for m in b["media"]}
+        index = len(banks)
+        banks.append((b["id"], os.path.getsize(bank_file) if os.path.isfile(bank_file) else 0, b.get("name") or ""))
+        for eid, name in hits:
+            source = (wanted or {}).get(name.lower())
+            entries.setdefault(eid or short_id(name), (index, by_source.get(source.lower(), 0) if source else 0))
+
+    ids = sorted(entries)
+    names = [n.encode("utf-8") for _, _, n in banks]
+    offsets = [0]
+    for n in names:
+        offsets.append(offsets[-1] + len(n))
+    bank_idx = _packed("H", [entries[i][0] for i in ids])
+    body = b"".join([
+        HEADER.pack(MAGIC, VERSION, 0, len(ids), len(banks), digest),
+        _packed("I", ids),
+        _packed("I", [min(entries[i][1], 0xFFFFFFFF) for i in ids]),
+        bank_idx, b"\0" * (-len(bank_idx) % 4),
+        _packed("I", [b[0] for b in banks]),
+        _packed("I", [min(b[1], 0xFFFFFFFF) for b in banks]),
+        _packed("I", offsets),
+        b"".join(names),
+    ])
+    tmp = out_path + ".part"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, out_path)
+    return out_path, True
+
+
+class EventIndex:
+    """Memory-mapped reader: lookup() is a binary search over the mapped ID array."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, self.bank_count, self.digest = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not an event index (version {VERSION})")
+        view = memoryview(self.map)
+        pos = HEADER.size
+
+        def section(typecode, count, size):
+            nonlocal pos
+            part = view[pos:pos + count * size].cast(typecode)
+            pos += count * size
+            return part
+
+        n, b = self.count, self.bank_count
+        self.ids = section("I", n, 4)
+        self.media_bytes = section("I", n, 4)
+        self.bank_of = section("H", n, 2)
+        pos += -pos % 4
+        self.bank_ids = section("I", b, 4)
+        self.bank_sizes = section("I", b, 4)
+        self.name_offsets = section("I", b + 1, 4)
+        self._names = view[pos:]
+        self._views = [self.ids, self.media_bytes, self.bank_of, self.bank_ids, self.bank_sizes, self.name_offsets, self._names, view]
+
+    def bank_name(self, index):
+        return bytes(self._names[self.name_offsets[index]:self.name_offsets[index + 1]]).decode("utf-8")
+
+    def lookup(self, event):
+        """event: name or short ID. Returns {"event_id", "bank", "bank_id", "bank_size", "media_bytes"} or None."""
+        eid = short_id(event) if isinstance(event, str) else event
+        i = bisect.bisect_left(self.ids, eid)
+        if i == self.count or self.ids[i] != eid:
+            return None
+        b = self.bank_of[i]
+        return {"event_id": eid, "bank": self.bank_name(b), "bank_id": self.bank_ids[b], "bank_size": self.bank_sizes[b],
+                "media_bytes": self.media_bytes[i]}
+
+    def close(self):
+        for v in getattr(self, "_views", []):
+            v.release()
+        self.map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the binary event index of a platform folder")
+    parser.add_argument("platform_dir")
+    parser.add_argument("--out", default=None, help=f"Default: <platform_dir>/{INDEX_FILE}")
+    parser.add_argument("--lookup", nargs="*", default=None, help="Event names or IDs to look up instead of building")
+    args = parser.parse_args()
+
+    path = args.out or os.path.join(args.platform_dir, INDEX_FILE)
+    if args.lookup is None:
+        path, rebuilt = build_index(args.platform_dir, path)
+        with EventIndex(path) as index:
+            print(f"{path}: {index.count} event(s), {index.bank_count} bank(s), {os.path.getsize(path)} bytes"
+                  + ("" if rebuilt else " (unchanged)") + "; media bytes are not known for an index of all events")
+        return
+    with EventIndex(path) as index:
+        for key in args.lookup:
+            hit = index.lookup(int(key) if key.isdigit() else key)
+            print(f"{key}: " + (f"{hit['bank']} (bank {hit['bank_id']}, {hit['bank_size']} bytes), event {hit['event_id']}, "
+                                f"{hit['media_bytes']} media bytes" if hit else "not found"))
+
+
+if __name__ == "__main__":
+    main()
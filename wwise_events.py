@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Bulk Event hierarchy creation with ak.wwise.core.object.set.
+
+Every Event is built together with its Play action (@Target = the Sound), and optionally the Sound objects
+themselves (with their @ properties, e.g. @Volume), as a few large object.set payloads instead of one
+object.create per WAV. Payloads are capped in size; chunks go through WaapiBatch so several can be in
+flight. A chunk that WAAPI rejects is split in halves and retried until the failing objects are isolated, so
+every result - event id or error - maps back to its source WAV. A timeout or a dropped connection is not
+retried: every object not yet sent fails with that error at once.
+
+set_properties() uses the same chunked object.set calls to set properties on objects that already exist
+(e.g. the sidecar settings of imported Sounds); get_properties() reads them back with batched object.get.
+"""
+
+import json
+
+from wwise_waapi_batch import WaapiBatch, DEFAULT_WINDOW
+
+try:
+    from waapi.wamp.interface import WaapiRequestFailed
+except Exception:
+    class WaapiRequestFailed(Exception):
+        pass
+
+EVENTS_PARENT = "\\Events\\Default Work Unit"
+ACTION_PLAY = 1
+MAX_PAYLOAD_BYTES = 1024 * 1024
+GET_CHUNK = 500           # object paths per object.get
+
+
+class EventSpec:
+    """One source WAV: the Event to create and the Sound its Play action targets."""
+    __slots__ = ("wav", "event", "target", "sound_props")
+
+    def __init__(self, wav, event, target, sound_props=None):
+        self.wav = wav
+        self.event = event
+        self.target = target
+        self.sound_props = sound_props or {}
+
+
+def event_object(spec):
+    return {"type": "Event", "name": spec.event,
+            "children": [{"type": "Action", "name": "", "@ActionType": ACTION_PLAY, "@Target": spec.target}]}
+
+
+def sound_object(spec):
+    obj = {"type": "Sound", "name": spec.target.rsplit("\\", 1)[-1]}
+    obj.update(spec.sound_props)
+    return obj
+
+
+def chunk_objects(items, max_bytes=MAX_PAYLOAD_BYTES):
+    """Split [(key, obj)] into lists whose JSON size stays under max_bytes (an oversized object goes alone)."""
+    chunk, size = [], 0
+    for key, obj in items:
+        n = len(json.dumps(obj)) + 2
+        if chunk and size + n > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append((key, obj))
+        size += n
+    if chunk:
+        yield chunk
+
+
+def set_payload(parent, objects, on_conflict="merge"):
+    return {"objects": [{"object": parent, "children": objects}], "onNameConflict": on_conflict}
+
+
+def _created_ids(result):
+    """{name: id} of the children object.set reports for the first (only) parent entry."""
+    try:
+        children = (result.get("objects") or [{}])[0].get("children") or []
+    except (AttributeError, IndexError):
+        return {}
+    return {c.get("name"): c.get("id") for c in children if isinstance(c, dict)}
+
+
+class EventBuilder:
+    """Create Events (+ Play actions, + optionally Sounds) for many WAVs in a handful of object.set calls."""
+
+    def __init__(self, client, parent=EVENTS_PARENT, max_bytes=MAX_PAYLOAD_BYTES, window=DEFAULT_WINDOW,
+                 on_conflict="merge", logger=None):
+        self.client = client
+        self.parent = parent
+        self.max_bytes = max_bytes
+        self.window = window
+        self.on_conflict = on_conflict
+        self.logger = logger
+        self.calls = 0
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _send(self, items, payload):
+        """object.set [(key, obj)] in size-capped chunks, payload(objects) building the arguments.
+
+        Yields (chunk, result, error) for every settled chunk.
+        """
+        pending = list(chunk_objects(items, self.max_bytes))
+        batch = WaapiBatch(self.client, self.window)
+        try:
+            while pending:
+                requests = [("ak.wwise.core.object.set", payload([o for _, o in c]), c) for c in pending]
+                self.calls += len(requests)
+                pending, fatal = [], None
+                for item in batch.run(requests):
+                    chunk = item.tag
+                    if item.ok:
+                        yield chunk, item.result, None
+                    elif len(chunk) > 1 and isinstance(item.error, WaapiRequestFailed):
+                        # isolate the failing objects instead of failing the whole chunk
+                        half = len(chunk) // 2
+                        pending += [chunk[:half], chunk[half:]]
+                    else:
+                        if not isinstance(item.error, WaapiRequestFailed):
+                            fatal = item.error
+                        yield chunk, None, str(item.error)
+                if fatal is not None:
+                    # timeout or lost connection: splitting again would only wait for the same failure
+                    for chunk in pending:
+                        yield chunk, None, str(fatal)
+                    pending = []
+        finally:
+            batch.close()
+
+    def _apply(self, parent, items):
+        """Send [(key, obj)] under parent. Returns {key: (id, error)}."""
+        outcome = {}
+        for chunk, result, error in self._send(items, lambda objects: set_payload(parent, objects, self.on_conflict)):
+            ids = _created_ids(result) if error is None else {}
+            for key, obj in chunk:
+                outcome[key] = (ids.get(obj["name"]), error)
+        return outcome
+
+    def set_properties(self, props):
+        """Set @properties on existing objects: {object path: {"@Name": value}}. Returns {object path: error or None}."""
+        items = [(path, dict(values, object=path)) for path, values in props.items() if values]
+        outcome = {}
+        calls = self.calls
+        for chunk, _, error in self._send(items, lambda objects: {"objects": objects, "onNameConflict": self.on_conflict}):
+            for path, _ in chunk:
+                outcome[path] = error
+        self._log(f"Properties: {len(items)} object(s) in {self.calls - calls} object.set call(s)")
+        return outcome
+
+    def get_properties(self, paths, names):
+        """{object path: {"@Name": value}} read back with object.get; objects that cannot be read are left out."""
+        paths = list(paths)
+        returns = ["path"] + list(names)
+        requests = [("ak.wwise.core.object.get", {"from": {"path": paths[i:i + GET_CHUNK]}, "options": {"return": returns}}, i)
+                    for i in range(0, len(paths), GET_CHUNK)]
+        values = {}
+        batch = WaapiBatch(self.client, self.window)
+        try:
+            for item in batch.run(requests):
+                if not item.ok:
+                    self._log(f"Properties: object.get failed ({item.error})")
+                    continue
+                for obj in (item.result or {}).get("return") or []:
+                    values[obj.get("path")] = {k: obj[k] for k in names if k in obj}
+        finally:
+            batch.close()
+        return values
+
+    def create(self, specs, include_sounds=False):
+        """Returns {wav: {"event", "target", "id", "error"}} for every spec."""
+        specs = list(specs)
+        results = {s.wav: {"event": s.event, "target": s.target, "id": None, "error": None} for s in specs}
+
+        if include_sounds:
+            sounds = {}
+            for s in specs:
+                sounds.setdefault(s.target, s)
+            by_parent = {}
+            for target, s in sounds.items():
+                by_parent.setdefault(target.rsplit("\\", 1)[0], []).append((target, sound_object(s)))
+            failed = {}
+            for parent, items in by_parent.items():
+                for target, (_, error) in self._apply(parent, items).items():
+                    if error:
+                        failed[target] = error
+            for s in specs:
+                if s.target in failed:
+                    results[s.wav]["error"] = f"Sound {s.target}: {failed[s.target]}"
+
+        events, wavs_of = {}, {}
+        for s in specs:
+            if results[s.wav]["error"] is None:
+                events.setdefault(s.event, s)
+                wavs_of.setdefault(s.event, []).append(s.wav)
+        for event, (oid, error) in self._apply(self.parent, [(e, event_object(s)) for e, s in events.items()]).items():
+            for wav in wavs_of[event]:
+                results[wav]["id"] = oid
+                results[wav]["error"] = error
+        self._log(f"Events: {len(events)} event(s) for {len(specs)} file(s) in {self.calls} object.set call(s)")
+        return results
+
+
+def write_report(results, path):
+    report = {"events": results, "failed": sorted(w for w, r in results.items() if r["error"])}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
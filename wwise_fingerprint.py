@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate sound detection with compact spectral fingerprints.
+
+- Fingerprint: mono log-band spectrogram (32 log-spaced bands x 16 time slots, level-normalized so gain
+  changes and dither do not matter), projected onto 64 fixed random hyperplanes -> one 64-bit SimHash.
+- Index: fingerprints are cached by file content hash, so only new/changed files are analysed.
+- Search: LSH over 4 bands of 16 bits. Any two fingerprints within 3 bits of each other share at least one
+  band exactly, so bucket lookups find every such pair without an all-pairs comparison; with 65536 buckets
+  per band a 100k-file library averages ~2 files per bucket.
+- Verification: the fingerprint is coarse (a 440 Hz and a 450 Hz tone, or two noise takes with the same
+  envelope, get the same one), so a fingerprint match is only a candidate. Each candidate pair is confirmed
+  by the normalized cross-correlation of the waveforms (mono, first VERIFY_SECONDS, lag up to MAX_LAG_SEC).
+
+Clusters are stars, not transitive chains: the first path of a cluster is its canonical file and every
+other member was confirmed directly against it. The result is a report of clusters and an optional merge
+plan {duplicate: canonical}.
+"""
+
+import os
+import json
+import argparse
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+from wwise_cache import cache_root, JsonStore, DigestCache
+from wwise_wavio import read_info, map_raw, to_float, np
+
+FINGERPRINT_VERSION = 1
+BANDS = 32
+SLOTS = 16
+BITS = 64
+LSH_BANDS = 4
+FFT_SIZE = 2048
+MAX_FRAMES = 256          # long files are sampled, not fully transformed
+MIN_HZ, MAX_HZ = 50.0, 16000.0
+FLOOR_RATIO = 1e-6
+MAX_BUCKET = 2000         # ignore degenerate buckets (e.g. silence) to stay sub-quadratic
+MIN_CORRELATION = 0.95
+VERIFY_SECONDS = 10.0
+MAX_LAG_SEC = 0.05
+
+
+def _hyperplanes():
+    return np.random.default_rng(0x5EED).standard_normal((BANDS * SLOTS, BITS)).astype(np.float32)
+
+
+def spectral_profile(path):
+    """Return (profile vector of BANDS*SLOTS floats, duration_sec) for one WAV."""
+    info = read_info(path)
+    raw = map_raw(info)
+    frames = len(raw)
+    if frames == 0:
+        return np.zeros(BANDS * SLOTS, dtype=np.float32), 0.0
+    n = min(FFT_SIZE, frames)
+    starts = np.linspace(0, frames - n, num=min(MAX_FRAMES, max(1, frames // n)), dtype=np.int64)
+    block = np.stack([to_float(raw[s:s + n], info).mean(axis=1) for s in starts])
+    spec = np.abs(np.fft.rfft(block * np.hanning(n), axis=1)) ** 2
+    freqs = np.fft.rfftfreq(n, 1.0 / info.sample_rate)
+    edges = np.geomspace(MIN_HZ, min(MAX_HZ, info.sample_rate / 2.0), BANDS + 1)
+    band_of_bin = np.clip(np.searchsorted(edges, freqs) - 1, -1, BANDS)
+    valid = (band_of_bin >= 0) & (band_of_bin < BANDS)
+    energy = np.zeros((len(starts), BANDS), dtype=np.float64)
+    for b in range(BANDS):
+        sel = valid & (band_of_bin == b)
+        if sel.any():
+            energy[:, b] = spec[:, sel].sum(axis=1)
+    # group frames into SLOTS time slots so the profile is independent of the file length
+    slot_of_frame = (np.arange(len(starts)) * SLOTS) // len(starts)
+    slots = np.zeros((SLOTS, BANDS), dtype=np.float64)
+    np.add.at(slots, slot_of_frame, energy)
+    counts = np.bincount(slot_of_frame, minlength=SLOTS)[:, None]
+    slots = np.where(counts > 0, slots / np.maximum(counts, 1), slots[counts[:, 0] > 0].mean(axis=0))
+    # floor 60 dB below the loudest cell so dither / noise in empty bands does not change the profile
+    profile = np.log10(np.maximum(slots, slots.max() * FLOOR_RATIO + 1e-20))
+    profile -= profile.mean()
+    return profile.astype(np.float32).ravel(), info.duration
+
+
+def fingerprint_file(path):
+    """64-bit SimHash of the spectral profile, as a hex string, plus the duration."""
+    profile, duration = spectral_profile(path)
+    bits = (profile @ _hyperplanes()) > 0
+    value = 0
+    for i in np.flatnonzero(bits):
+        value |= 1 << int(i)
+    return {"v": FINGERPRINT_VERSION, "fp": f"{value:016x}", "dur": duration}
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+@lru_cache(maxsize=16)
+def _waveform(path):
+    """(mono float64 of the first VERIFY_SECONDS, sample rate) for verification."""
+    info = read_info(path)
+    raw = map_raw(info)
+    x = to_float(raw[:int(VERIFY_SECONDS * info.sample_rate)], info).mean(axis=1).astype(np.float64)
+    return x - x.mean() if len(x) else x, info.sample_rate
+
+
+def waveform_correlation(a, b, max_lag_sec=MAX_LAG_SEC):
+    """Peak normalized cross-correlation (0..1) of two WAVs within +-max_lag_sec; gain-independent."""
+    x, rx = _waveform(a)
+    y, ry = _waveform(b)
+    if rx != ry:
+        # compare at the lower rate
+        if rx > ry:
+            x, y, rx, ry = y, x, ry, rx
+        y = np.interp(np.arange(int(len(y) * rx / ry)) * (ry / rx), np.arange(len(y)), y)
+    norm = np.sqrt(np.dot(x, x) * np.dot(y, y))
+    if not norm:
+        return 0.0
+    n = len(x) + len(y) - 1
+    size = 1 << (n - 1).bit_length()
+    corr = np.fft.irfft(np.fft.rfft(x, size) * np.conj(np.fft.rfft(y, size)), size)
+    lag = int(max_lag_sec * rx)
+    window = np.concatenate([corr[:lag + 1], corr[size - lag:]]) if lag else corr[:1]
+    return float(np.max(np.abs(window)) / norm)
+
+
+class FingerprintIndex:
+    """Fingerprint cache + LSH near-duplicate search."""
+
+    def __init__(self, cache_path=None, workers=None, logger=None):
+        self.cache = JsonStore(cache_path or cache_root("fingerprints") / "index.json")
+        self.digests = DigestCache()
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = logger
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def fingerprints(self, wavs):
+        """Return {wav: (fingerprint_int, duration)} for every file that could be analysed."""
+        if np is None:
+            raise RuntimeError("numpy is required for fingerprinting (pip install numpy)")
+        result, todo = {}, {}
+        for w in wavs:
+            try:
+                key = self.digests.digest(w)
+            except OSError as e:
+                self._log(f"Fingerprint: cannot read {w}: {e}")
+                continue
+            hit = self.cache.get(key)
+            if hit and hit.get("v") == FINGERPRINT_VERSION:
+                result[w] = (int(hit["fp"], 16), hit["dur"])
+            else:
+                todo.setdefault(key, []).append(w)
+        if todo:
+            self._log(f"Fingerprint: analysing {len(todo)} file(s), {len(result)} cached")
+            keys = list(todo)
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(keys))) as pool:
+                futures = [pool.submit(fingerprint_file, todo[k][0]) for k in keys]
+                for key, fut in zip(keys, futures):
+                    try:
+                        entry = fut.result()
+                    except Exception as e:
+                        self._log(f"Fingerprint failed for {todo[key][0]}: {e}")
+                        continue
+                    self.cache.put(key, entry)
+                    for w in todo[key]:
+                        result[w] = (int(entry["fp"], 16), entry["dur"])
+        self.cache.save()
+        self.digests.save()
+        return result
+
+    def candidates(self, paths, prints, max_distance=3, duration_tolerance=0.05):
+        """{index: set of indexes} of the fingerprint matches among paths (unconfirmed)."""
+        values = [prints[p][0] for p in paths]
+        durations = [prints[p][1] for p in paths]
+        width = BITS // LSH_BANDS
+        mask = (1 << width) - 1
+        pairs = {}
+        for band in range(LSH_BANDS):
+            buckets = {}
+            for i, v in enumerate(values):
+                buckets.setdefault((v >> (band * width)) & mask, []).append(i)
+            for members in buckets.values():
+                if len(members) < 2 or len(members) > MAX_BUCKET:
+                    continue
+                for x in range(len(members)):
+                    i = members[x]
+                    for j in members[x + 1:]:
+                        if j in pairs.get(i, ()):
+                            continue
+                        longest = max(durations[i], durations[j]) or 1.0
+                        if abs(durations[i] - durations[j]) / longest > duration_tolerance:
+                            continue
+                        if hamming(values[i], values[j]) <= max_distance:
+                            pairs.setdefault(i, set()).add(j)
+                            pairs.setdefault(j, set()).add(i)
+        return pairs
+
+    def clusters(self, wavs, max_distance=3, duration_tolerance=0.05, min_correlation=MIN_CORRELATION):
+        """Group near-identical sounds. Returns a list of path lists (clusters of 2+ files), canonical file first.
+
+        Every member is confirmed against the canonical file by waveform correlation; there is no chaining.
+        """
+        prints = self.fingerprints(wavs)
+        paths = sorted(prints)
+        pairs = self.candidates(paths, prints, max_distance, duration_tolerance)
+        assigned = set()
+        clusters = []
+        checked = rejected = 0
+        for i in sorted(pairs):
+            if i in assigned:
+                continue
+            group = []
+            for j in sorted(pairs[i]):
+                # a pair with an earlier unassigned file was already checked from its side
+                if j < i or j in assigned:
+                    continue
+                checked += 1
+                try:
+                    score = waveform_correlation(paths[i], paths[j])
+                except Exception as e:
+                    self._log(f"Near-duplicate check failed for {paths[j]}: {e}")
+                    continue
+                if score >= min_correlation:
+                    group.append(j)
+                else:
+                    rejected += 1
+            if group:
+                assigned.update(group)
+                assigned.add(i)
+                clusters.append([paths[i]] + [paths[j] for j in group])
+        _waveform.cache_clear()
+        if checked:
+            self._log(f"Near-duplicates: {checked} fingerprint match(es) checked, {rejected} rejected by waveform correlation")
+        return clusters
+
+
+def merge_plan(clusters):
+    """{near_duplicate: canonical} using the first path of each cluster as canonical."""
+    return {dup: group[0] for group in clusters for dup in group[1:]}
+
+
+def write_report(clusters, path, include_plan=False):
+    report = {"clusters": clusters, "near_duplicate_files": sum(len(c) - 1 for c in clusters)}
+    if include_plan:
+        report["merge_plan"] = merge_plan(clusters)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate sounds with spectral fingerprints")
+    parser.add_argument("input", help="WAV folder")
+    parser.add_argument("--report", help="Write clusters (and merge plan) as JSON")
+    parser.add_argument("--merge-plan", action="store_true")
+    parser.add_argument("--max-distance", type=int, default=3, help="Max differing fingerprint bits (recall is exact up to 3)")
+    parser.add_argument("--min-correlation", type=float, default=MIN_CORRELATION,
+                        help="Waveform correlation needed to confirm a fingerprint match")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    wavs = [os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith(".wav")]
+    clusters = FingerprintIndex(workers=args.workers).clusters(wavs, args.max_distance, min_correlation=args.min_correlation)
+    for c in clusters:
+        print(c[0])
+        for dup in c[1:]:
+            print(f"  ~ {dup}")
+    if args.report:
+        write_report(clusters, args.report, args.merge_plan)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Offline Wwise short IDs and a pre-flight for name clashes.
+
+Events, banks, busses, states, switches and game parameters are addressed at runtime by the FNV-1 32-bit
+hash of their lower-cased name (AK::SoundEngine::GetIDFromString). Two names with the same hash, or one
+name planned twice (same WAV stem in two sub-folders), only show up after import and generation; this
+module finds them up front.
+
+- short_id(name): single hash
+- short_ids(names): batched; with numpy the names become one length-sorted byte matrix hashed a column at
+  a time over the prefix of names still that long, so 100k names take a few tens of milliseconds
+- preflight(): duplicate names among the planned Sounds, events and bank, and hash collisions between
+  them and the names already known from an earlier build
+- write_header(): Wwise_IDs.h-style C++ header, or a JSON table for a .json path
+
+    python wwise_ids.py Play_Footstep Main
+    python wwise_ids.py --input Sounds --event-pattern "Play_{name}" --soundbank Main --header Wwise_IDs.h
+"""
+
+import os
+import re
+import json
+import argparse
+from pathlib import Path
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+from wwise_cache import atomic_write_text
+
+FNV_OFFSET = 2166136261
+FNV_PRIME = 16777619
+BATCH_MIN = 64      # below this the pure Python loop is faster than building the matrix
+
+
+def short_id(name):
+    h = FNV_OFFSET
+    for b in name.encode("utf-8").lower():
+        h = ((h * FNV_PRIME) & 0xFFFFFFFF) ^ b
+    return h
+
+
+def short_ids(names):
+    """Short IDs of a list of names, in order."""
+    if np is None or len(names) < BATCH_MIN:
+        return [short_id(n) for n in names]
+    encoded = [n.encode("utf-8").lower() for n in names]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    order = np.argsort(-lengths, kind="stable")
+    matrix = np.array(encoded)      # fixed-width bytes, NUL padded
+    matrix = matrix.view(np.uint8).reshape(len(encoded), matrix.dtype.itemsize)
+    columns = np.ascontiguousarray(matrix[order].T)
+    # rows are sorted longest first, so the names still longer than column j are a prefix of length active[j]
+    active = np.searchsorted(-lengths[order], -np.arange(len(columns)), side="left").tolist()
+    h = np.full(len(encoded), FNV_OFFSET, dtype=np.uint32)
+    prime = np.uint32(FNV_PRIME)
+    for column, k in zip(columns, active):
+        head = h[:k]
+        np.multiply(head, prime, out=head)
+        np.bitwise_xor(head, column[:k], out=head)
+    result = np.empty_like(h)
+    result[order] = h
+    return result.tolist()
+
+
+def planned_names(wavs, event_pattern=None, soundbank=None, sounds=True, aliases=None):
+    """[(kind, name, source)] for the Sounds, events (one per WAV) and bank a run would create.
+
+    WAVs in aliases are merged onto another file and get no Sound of their own.
+    """
+    aliases = aliases or {}
+    planned = []
+    if sounds:
+        planned += [("sound", Path(w).stem, w) for w in wavs if w not in aliases]
+    if event_pattern:
+        planned += [("event", event_pattern.replace("{name}", Path(w).stem), w) for w in wavs]
+    if soundbank:
+        planned.append(("bank", soundbank, None))
+    return planned
+
+
+def preflight(planned, known=None):
+    """Check planned names. known: {name: kind} from an earlier build (e.g. the SoundbanksInfo index).
+
+    A duplicate is one name planned by several sources for the same kind (two WAVs with the same stem end up
+    as one Sound / one event). A collision is two different names (case-insensitively) with the same short
+    ID; Sounds are left out of it since their runtime IDs come from GUIDs, not names.
+    Returns {"ids": {name: id}, "kinds": {name: kind}, "duplicates": [...], "collisions": [...]}.
+    """
+    known = known or {}
+    by_name = {}
+    for kind, name, source in planned:
+        by_name.setdefault((kind, name.lower()), []).append((kind, name, source))
+    duplicates = [{"name": items[0][1], "kind": items[0][0], "sources": [s for _, _, s in items]}
+                  for items in by_name.values() if len(items) > 1]
+
+    names = [items[0][1] for items in by_name.values()]
+    kinds = [items[0][0] for items in by_name.values()]
+    n = len(names)
+    planned_lower = {name.lower() for name in names}
+    for name, kind in known.items():
+        if name.lower() not in planned_lower:
+            names.append(name)
+            kinds.append(f"existing {kind}")
+    ids = short_ids(names)
+    by_id = {}
+    for name, kind, sid in zip(names, kinds, ids):
+        if kind != "sound":
+            by_id.setdefault(sid, []).append((kind, name))
+    collisions = [{"id": sid, "names": [{"kind": k, "name": name} for k, name in items]}
+                  for sid, items in by_id.items()
+                  if len({name.lower() for _, name in items}) > 1 and any(not k.startswith("existing") for k, _ in items)]
+    return {"ids": dict(zip(names[:n], ids[:n])), "kinds": dict(zip(names[:n], kinds[:n])),
+            "duplicates": duplicates, "collisions": collisions}
+
+
+def _identifier(name):
+    ident = re.sub(r"\W", "_", name).upper()
+    return "_" + ident if ident[:1].isdigit() else ident
+
+
+def write_header(result, path):
+    """Wwise_IDs.h-style header (namespaces EVENTS / BANKS), or a JSON {kind: {name: id}} table for .json."""
+    groups = {}
+    for name, sid in sorted(result["ids"].items(), key=lambda kv: kv[0].lower()):
+        if result["kinds"][name] != "sound":
+            groups.setdefault(result["kinds"][name], {})[name] = sid
+    if str(path).lower().endswith(".json"):
+        atomic_write_text(path, json.dumps(groups, indent=2))
+        return
+    lines = ["// Generated by wwise_ids.py; do not edit.", "#ifndef __WWISE_IDS_H__", "#define __WWISE_IDS_H__", "",
+             "#include <AK/SoundEngine/Common/AkTypes.h>", "", "namespace AK", "{"]
+    for kind in sorted(groups):
+        ns = kind.upper() + "S"
+        lines += [f"    namespace {ns}", "    {"]
+        lines += [f"        static const AkUniqueID {_identifier(n)} = {sid}U;" for n, sid in groups[kind].items()]
+        lines += [f"    }} // namespace {ns}", ""]
+    lines += ["} // namespace AK", "", "#endif // __WWISE_IDS_H__", ""]
+    atomic_write_text(path, "\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wwise short IDs (FNV-1 32-bit of the lower-cased name) and a name pre-flight")
+    parser.add_argument("names", nargs="*", help="Names to hash")
+    parser.add_argument("--input", default=None, help="WAV folder: plan one event per file")
+    parser.add_argument("--event-pattern", default="Play_{name}", help="Empty: no events")
+    parser.add_argument("--soundbank", default=None)
+    parser.add_argument("--header", default=None, help="Write a C++ header (or a JSON table for .json)")
+    args = parser.parse_args()
+
+    if not args.input:
+        for name, sid in zip(args.names, short_ids(args.names)):
+            print(f"{sid:>10}  {name}")
+        return
+    wavs = sorted(os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith(".wav"))
+    result = preflight(planned_names(wavs, args.event_pattern, args.soundbank))
+    for d in result["duplicates"]:
+        print(f"duplicate {d['kind']} {d['name']}: {', '.join(d['sources'])}")
+    for c in result["collisions"]:
+        print(f"collision {c['id']}: {', '.join(n['name'] for n in c['names'])}")
+    print(f"{len(result['ids'])} name(s), {len(result['duplicates'])} duplicate(s), {len(result['collisions'])} collision(s)")
+    if args.header:
+        write_header(result, args.header)
+    raise SystemExit(1 if result["collisions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for resumable runs.
+
+One append-only JSON-lines file per run identity (project + bank + output) in the tool cache: a header
+line with the digest of the run's inputs, then one line per completed unit (import chunk, event batch,
+platform), flushed and fsynced before the next unit starts. A line cut short by a crash is dropped
+(and truncated away) on load, so the journal never holds a unit that did not finish.
+
+With resume=True the completed units are kept if the inputs digest still matches; otherwise, or without
+resume, the run starts a fresh journal. finish() deletes it after a successful run.
+"""
+
+import os
+import json
+import time
+import hashlib
+
+from wwise_cache import cache_root, atomic_write_text
+
+JOURNAL_VERSION = 1
+
+
+def journal_key(*parts):
+    """Stable file name for a run identity."""
+    return hashlib.sha256(json.dumps([str(p) for p in parts]).encode("utf-8")).hexdigest()[:24]
+
+
+def inputs_digest(inputs):
+    """Digest of any JSON-serializable description of the run inputs."""
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class RunJournal:
+    def __init__(self, key, inputs, resume=False, path=None, logger=None):
+        self.path = str(path or cache_root("journals") / f"{key}.jsonl")
+        self.inputs = inputs
+        self.logger = logger
+        self.units = {}
+        self.resumed = bool(resume) and self._load()
+        if not self.resumed:
+            atomic_write_text(self.path, json.dumps({"v": JOURNAL_VERSION, "inputs": inputs, "started": time.time()}) + "\n")
+        self._fh = open(self.path, "a", encoding="utf-8")
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8", newline="") as f:
+                text = f.read()
+        except OSError:
+            self._log("Resume: no checkpoint journal for this run; starting from the beginning")
+            return False
+        complete = text[:text.rfind("\n") + 1]      # drop a line torn by a crash
+        lines = complete.splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if header.get("v") != JOURNAL_VERSION or header.get("inputs") != self.inputs:
+            self._log("Resume: inputs changed since the checkpoint; starting from the beginning")
+            return False
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self.units[entry["unit"]] = entry
+        if len(complete) != len(text):
+            with open(self.path, "r+", encoding="utf-8") as f:
+                f.truncate(len(complete.encode("utf-8")))
+        self._log(f"Resume: {len(self.units)} completed unit(s) from {self.path}")
+        return True
+
+    def done(self, unit):
+        return unit in self.units
+
+    def mark(self, unit, **info):
+        entry = dict(info, unit=unit, at=time.time())
+        self._fh.write(json.dumps(entry) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self.units[unit] = entry
+
+    def close(self):
+        if not self._fh.closed:
+            self._fh.close()
+
+    def finish(self):
+        """Run completed: the journal is no longer needed."""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Persistent SQLite index of the WAV library (WAL mode, so readers never wait for a scan).
+
+scan(root) walks the tree with os.scandir and compares every file's (size, mtime) with its row: only new or
+changed files get their header parsed (wwise_wavio.read_info reads the chunk headers only) and their
+content hashed, in a thread pool; rows of deleted files are dropped. Rescanning an unchanged tree costs
+one stat per file and no reads.
+
+One row per WAV: path, folder, name, size, mtime, container, format, channels, sample rate, bits, frames,
+duration, data chunk size, SHA-256, the parse error if any, and the last import time and target bank
+recorded by the batch tool.
+
+select() turns a small query into SQL over the rows under a root; terms are AND-ed:
+
+    channels=2 duration>10 under=ambience
+    rate>=48000 name~Foot* imported=no bank=Weapons
+
+    python wwise_library.py Sounds scan
+    python wwise_library.py Sounds select "channels=2 duration>10 under=ambience"
+"""
+
+import os
+import re
+import time
+import sqlite3
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from wwise_cache import cache_root, file_digest
+from wwise_wavio import read_info, WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wavs (path TEXT PRIMARY KEY, dir TEXT, name TEXT, size INTEGER, mtime_ns INTEGER,
+                                 container TEXT, format TEXT, channels INTEGER, sample_rate INTEGER, bits INTEGER,
+                                 frames INTEGER, duration REAL, data_size INTEGER, digest TEXT, error TEXT,
+                                 last_import REAL, bank TEXT);
+CREATE INDEX IF NOT EXISTS wavs_digest ON wavs (digest);
+"""
+COLUMNS = ("path", "dir", "name", "size", "mtime_ns", "container", "format", "channels", "sample_rate", "bits",
+           "frames", "duration", "data_size", "digest", "error", "last_import", "bank")
+FORMATS = {WAVE_FORMAT_PCM: "pcm", WAVE_FORMAT_IEEE_FLOAT: "float"}
+# query field -> column; the numeric ones compare as numbers
+FIELDS = {"channels": "channels", "rate": "sample_rate", "sample_rate": "sample_rate", "bits": "bits",
+          "duration": "duration", "frames": "frames", "size": "size", "format": "format", "container": "container",
+          "name": "name", "path": "path", "dir": "dir", "bank": "bank", "digest": "digest"}
+NUMERIC = {"channels", "sample_rate", "bits", "duration", "frames", "size"}
+TERM = re.compile(r"^(\w+)\s*(>=|<=|!=|=|>|<|~)\s*(.*)$")
+OPERATOR_CHARS = "=<>!~"
+
+
+class QueryError(ValueError):
+    pass
+
+
+def _prefix_range(prefix):
+    """(lo, hi) with lo <= path < hi exactly for the paths starting with prefix (a primary key range scan)."""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def split_terms(query):
+    """Whitespace-separated terms; "..." or '...' quote a term or a value (name="Door Open").
+
+    Backslashes are kept as they are (Windows paths), and a quote inside a word is literal (name=Don't).
+    """
+    terms, current, quote, quoted = [], [], None, False
+    for ch in query or "":
+        if quote:
+            if ch == quote:
+                quote = None
+            else:
+                current.append(ch)
+        elif ch in "\"'" and (not current or current[-1] in OPERATOR_CHARS):
+            quote, quoted = ch, True
+        elif ch.isspace():
+            if current or quoted:
+                terms.append("".join(current))
+            current, quoted = [], False
+        else:
+            current.append(ch)
+    if quote:
+        raise QueryError(f"unbalanced {quote} in query")
+    if current or quoted:
+        terms.append("".join(current))
+    return terms
+
+
+def _describe(path, st):
+    """Row values of one WAV from its header and content; a parse error is recorded, not raised."""
+    row = dict.fromkeys(COLUMNS)
+    row.update(path=path, dir=os.path.dirname(path), name=os.path.basename(path), size=st.st_size, mtime_ns=st.st_mtime_ns)
+    try:
+        info = read_info(path)
+        row.update(container=info.container, format=FORMATS.get(info.format_tag, str(info.format_tag)),
+                   channels=info.channels, sample_rate=info.sample_rate, bits=info.bits, frames=info.frames,
+                   duration=info.duration, data_size=info.data_size)
+    except Exception as e:
+        row["error"] = str(e)
+    try:
+        row["digest"] = file_digest(path)
+    except OSError as e:
+        row["error"] = row["error"] or str(e)
+    return row
+
+
+def parse_query(query, root=None):
+    """(SQL condition, params) for a query string. Raises QueryError."""
+    conditions, params = [], []
+    for term in split_terms(query):
+        m = TERM.match(term)
+        if not m:
+            raise QueryError(f"cannot parse '{term}' (expected field<op>value, e.g. duration>10)")
+        field, op, value = m.group(1).lower(), m.group(2), m.group(3)
+        if field == "under":
+            if op != "=":
+                raise QueryError("under only supports '='")
+            base = os.path.abspath(os.path.join(root or os.getcwd(), value))
+            conditions.append("path >= ? AND path < ?")
+            params += _prefix_range(base + os.sep)
+            continue
+        if field == "imported":
+            if op not in ("=", "!="):
+                raise QueryError("imported only supports '=' and '!='")
+            yes = value.lower() in ("1", "yes", "true", "y")
+            conditions.append("last_import IS NOT NULL" if yes == (op == "=") else "last_import IS NULL")
+            continue
+        column = FIELDS.get(field)
+        if column is None:
+            raise QueryError(f"unknown field '{field}' (known: {', '.join(sorted(FIELDS) + ['imported', 'under'])})")
+        if op == "~":
+            conditions.append(f"lower({column}) GLOB ?")
+            params.append(value.lower())
+            continue
+        if column in NUMERIC:
+            try:
+                value = float(value)
+            except ValueError:
+                raise QueryError(f"{field} needs a number, got '{value}'")
+        conditions.append(f"{column} {'<>' if op == '!=' else op} ?")
+        params.append(value)
+    return " AND ".join(conditions) or "1", params
+
+
+class AudioLibrary:
+    def __init__(self, db_path=None, logger=None, workers=None):
+        self.db_path = str(db_path or cache_root("library") / "library.db")
+        self.logger = logger
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _walk(self, root):
+        """{path: stat} of every .wav under root."""
+        found, stack = {}, [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(".wav") and entry.is_file():
+                            found[entry.path] = entry.stat()
+            except OSError as e:
+                self._log(f"Library: cannot list {e.filename}: {e.strerror}")
+        return found
+
+    def scan(self, root):
+        """Bring the rows under root up to date. Returns {"files", "added", "updated", "removed", "errors", "seconds"}."""
+        t0 = time.time()
+        root = os.path.abspath(root)
+        found = self._walk(root)
+        known = {path: (size, mtime) for path, size, mtime in
+                 self.db.execute("SELECT path, size, mtime_ns FROM wavs WHERE path >= ? AND path < ?", _prefix_range(root + os.sep))}
+        todo = [p for p, st in found.items() if known.get(p) != (st.st_size, st.st_mtime_ns)]
+        removed = [p for p in known if p not in found]
+        rows = []
+        if todo:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(todo))) as pool:
+                rows = list(pool.map(lambda p: _describe(p, found[p]), todo))
+        with self.db:
+            # a changed file keeps its import history
+            self.db.executemany(f"INSERT INTO wavs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+                                f"ON CONFLICT(path) DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in COLUMNS[1:15]),
+                                [tuple(r[c] for c in COLUMNS) for r in rows])
+            self.db.executemany("DELETE FROM wavs WHERE path = ?", [(p,) for p in removed])
+        errors = self.db.execute("SELECT count(*) FROM wavs WHERE path >= ? AND path < ? AND error IS NOT NULL",
+                                 _prefix_range(root + os.sep)).fetchone()[0]
+        result = {"files": len(found), "added": sum(1 for p in todo if p not in known), "updated": sum(1 for p in todo if p in known),
+                  "removed": len(removed), "errors": errors, "seconds": round(time.time() - t0, 2)}
+        self._log(f"Library: {result['files']} WAV(s) under {root}, {result['added']} new, {result['updated']} changed, "
+                  f"{result['removed']} removed ({result['seconds']}s)")
+        return result
+
+    def select(self, query=None, root=None):
+        """Sorted paths under root matching query (all of them without one)."""
+        condition, params = parse_query(query, root)
+        if root:
+            condition = f"path >= ? AND path < ? AND ({condition})"
+            params = list(_prefix_range(os.path.abspath(root) + os.sep)) + params
+        return [p for (p,) in self.db.execute(f"SELECT path FROM wavs WHERE {condition} ORDER BY path", params)]
+
+    def rows(self, paths):
+        """{path: row dict} for the given paths (unknown paths are left out)."""
+        result = {}
+        paths = [os.path.abspath(p) for p in paths]
+        for i in range(0, len(paths), 500):
+            chunk = paths[i:i + 500]
+            sql = f"SELECT {', '.join(COLUMNS)} FROM wavs WHERE path IN ({', '.join('?' * len(chunk))})"
+            result.update((row[0], dict(zip(COLUMNS, row))) for row in self.db.execute(sql, chunk))
+        return result
+
+    def mark_imported(self, paths, bank, when=None):
+        """Record an import of paths into bank."""
+        when = when or time.time()
+        with self.db:
+            self.db.executemany("UPDATE wavs SET last_import = ?, bank = ? WHERE path = ?",
+                                [(when, bank, os.path.abspath(p)) for p in paths])
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def discover(root, query=None, db_path=None, logger=None):
+    """Scan root into the library and return the sorted WAV paths under it matching query."""
+    with AudioLibrary(db_path, logger) as library:
+        library.scan(root)
+        return library.select(query, root)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index a WAV library (header metadata + hashes) and select files by query")
+    parser.add_argument("root", help="Library folder")
+    parser.add_argument("--db", default=None, help="Default: library.db in the tool cache")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("scan")
+    sel = sub.add_parser("select", help='e.g. "channels=2 duration>10 under=ambience"')
+    sel.add_argument("query", nargs="?", default="")
+    sel.add_argument("--long", action="store_true", help="Print the metadata of each file")
+    args = parser.parse_args()
+
+    with AudioLibrary(args.db) as library:
+        if args.cmd == "scan":
+            r = library.scan(args.root)
+            print(f"{r['files']} file(s): {r['added']} new, {r['updated']} changed, {r['removed']} removed, {r['errors']} unreadable ({r['seconds']}s)")
+            return
+        library.scan(args.root)
+        try:
+            paths = library.select(args.query, args.root)
+        except QueryError as e:
+            raise SystemExit(f"error: {e}")
+        rows = library.rows(paths) if args.long else {}
+        for p in paths:
+            r = rows.get(p)
+            print(p if not r else f"{p}  {r['channels']}ch {r['sample_rate']}Hz {r['bits']}bit {r['duration'] or 0:.2f}s"
+                                  + (f"  bank {r['bank']}" if r["bank"] else "") + (f"  ERROR {r['error']}" if r["error"] else ""))
+        print(f"{len(paths)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
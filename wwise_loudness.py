@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Batch loudness analysis (integrated loudness, true peak, RMS) for WAV inputs.
+
+- Integrated loudness follows ITU-R BS.1770 gating (400 ms blocks, 75% overlap, -70 LUFS / -10 LU gates).
+  K-weighting is applied in the frequency domain on 100 ms segments so every file is one batch of
+  vectorized FFTs instead of a sample-by-sample IIR filter.
+- True peak uses 4x windowed-sinc oversampling.
+- The sample data is read from the memory-mapped data chunk and converted a block at a time, so a long
+  ambience never exists as one float array.
+- Results are cached by file content hash; only new or modified WAVs are analysed, in a process pool.
+
+The normalization gain is meant to be written as the Wwise Volume property of the imported object,
+the audio files themselves are never rewritten.
+"""
+
+import os
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from wwise_cache import cache_root, JsonStore, DigestCache
+from wwise_wavio import read_info, map_raw, to_float, iter_blocks, np
+
+ANALYSIS_VERSION = 1
+SEGMENT_SEC = 0.1          # gating step (block = 4 segments = 400 ms)
+ABS_GATE_LUFS = -70.0
+REL_GATE_LU = -10.0
+OVERSAMPLE = 4
+TRUE_PEAK_CHUNK = 1 << 16  # frames per oversampled chunk
+BLOCK_SEGMENTS = 100       # 100 ms segments per analysis block (10 s)
+WWISE_VOLUME_MIN = -96.0
+WWISE_VOLUME_MAX = 12.0
+
+
+def _biquad_power(b, a, w):
+    """|H(e^jw)|^2 of a biquad for an array of angular frequencies."""
+    z = np.exp(-1j * w)
+    num = b[0] + b[1] * z + b[2] * z * z
+    den = a[0] + a[1] * z + a[2] * z * z
+    return np.abs(num / den) ** 2
+
+
+def k_weighting_power(n, rate):
+    """Power response of the BS.1770 K-weighting (shelf + RLB high-pass) at the rfft bins of length n."""
+    w = 2.0 * math.pi * np.fft.rfftfreq(n, 1.0 / rate) / rate
+    # stage 1: high shelf, +4 dB above ~1.5 kHz
+    gain_db, q, fc = 4.0, 1.0 / math.sqrt(2.0), 1500.0
+    A = 10 ** (gain_db / 40.0)
+    w0 = 2.0 * math.pi * fc / rate
+    alpha = math.sin(w0) / (2.0 * q)
+    cw, sa = math.cos(w0), 2.0 * math.sqrt(A) * alpha
+    b = (A * ((A + 1) + (A - 1) * cw + sa), -2 * A * ((A - 1) + (A + 1) * cw), A * ((A + 1) + (A - 1) * cw - sa))
+    a = ((A + 1) - (A - 1) * cw + sa, 2 * ((A - 1) - (A + 1) * cw), (A + 1) - (A - 1) * cw - sa)
+    shelf = _biquad_power(b, a, w)
+    # stage 2: RLB high-pass at ~38 Hz
+    q, fc = 0.5, 38.0
+    w0 = 2.0 * math.pi * fc / rate
+    alpha = math.sin(w0) / (2.0 * q)
+    cw = math.cos(w0)
+    b = ((1 + cw) / 2, -(1 + cw), (1 + cw) / 2)
+    a = (1 + alpha, -2 * cw, 1 - alpha)
+    return shelf * _biquad_power(b, a, w)
+
+
+def channel_weights(channels):
+    if channels == 6:      # L R C LFE Ls Rs
+        return np.array([1.0, 1.0, 1.0, 0.0, 1.41, 1.41])
+    if channels == 5:      # L R C Ls Rs
+        return np.array([1.0, 1.0, 1.0, 1.41, 1.41])
+    return np.ones(channels)
+
+
+def _segment_energy(x, rate):
+    """Mean square of the K-weighted signal per 100 ms segment and channel -> array (segments, channels)."""
+    seg = max(1, int(round(SEGMENT_SEC * rate)))
+    count = len(x) // seg
+    if count == 0:
+        seg, count = len(x), 1
+    frames = x[:count * seg].reshape(count, seg, x.shape[1])
+    spec = np.fft.rfft(frames, axis=1)
+    power = (spec.real ** 2 + spec.imag ** 2) * k_weighting_power(seg, rate)[None, :, None]
+    # Parseval on a one-sided spectrum: double every bin except DC (and Nyquist for even lengths)
+    power[:, 1:(seg + 1) // 2] *= 2.0
+    return power.sum(axis=1) / (seg * seg)
+
+
+def integrated_loudness(x, rate):
+    """Gated integrated loudness in LUFS of float samples shaped (frames, channels)."""
+    if len(x) == 0:
+        return float("-inf")
+    return gated_loudness(_segment_energy(x, rate), x.shape[1])
+
+
+def gated_loudness(energy, channels):
+    """Integrated loudness in LUFS from the per-segment energies (segments, channels) of _segment_energy()."""
+    if len(energy) == 0:
+        return float("-inf")
+    if len(energy) >= 4:
+        kernel = np.ones(4) / 4.0
+        blocks = np.stack([np.convolve(energy[:, c], kernel, mode="valid") for c in range(energy.shape[1])], axis=1)
+    else:
+        blocks = energy.mean(axis=0, keepdims=True)
+    z = blocks @ channel_weights(channels)
+    with np.errstate(divide="ignore"):
+        lk = -0.691 + 10.0 * np.log10(z)
+    z = z[lk > ABS_GATE_LUFS]
+    if len(z) == 0:
+        return float("-inf")
+    rel = -0.691 + 10.0 * math.log10(z.mean()) + REL_GATE_LU
+    with np.errstate(divide="ignore"):
+        z = z[-0.691 + 10.0 * np.log10(z) > rel]
+    if len(z) == 0:
+        return float("-inf")
+    return -0.691 + 10.0 * math.log10(z.mean())
+
+
+def _oversampling_kernel(taps_per_phase=12):
+    """Kaiser-windowed sinc low-pass for zero-stuffed 4x interpolation (odd length, centred)."""
+    half = taps_per_phase * OVERSAMPLE // 2
+    n = np.arange(-half, half + 1)
+    return np.sinc(n / OVERSAMPLE) * np.kaiser(len(n), 8.0)
+
+
+def true_peak(x, info=None):
+    """Maximum absolute value after 4x oversampling (windowed-sinc interpolation), as linear amplitude.
+
+    x: float samples shaped (frames, channels), or map_raw() output with its info (converted a chunk at a time).
+    """
+    if len(x) == 0:
+        return 0.0
+    peak = 0.0
+    h = _oversampling_kernel()
+    pad = len(h) // OVERSAMPLE + 1
+    for start in range(0, len(x), TRUE_PEAK_CHUNK):
+        lo = max(0, start - pad)
+        chunk = x[lo:start + TRUE_PEAK_CHUNK + pad]
+        chunk = to_float(chunk, info) if info is not None else np.asarray(chunk, dtype=np.float32)
+        core = chunk[start - lo:start - lo + TRUE_PEAK_CHUNK]
+        peak = max(peak, float(np.abs(core).max()))
+        up = np.zeros(len(chunk) * OVERSAMPLE, dtype=np.float32)
+        skip = (start - lo) * OVERSAMPLE
+        for c in range(chunk.shape[1]):
+            up[::OVERSAMPLE] = chunk[:, c]
+            y = np.convolve(up, h, mode="same")[skip:skip + TRUE_PEAK_CHUNK * OVERSAMPLE]
+            if len(y):
+                peak = max(peak, float(np.abs(y).max()))
+    return peak
+
+
+def _db(value):
+    return 20.0 * math.log10(value) if value > 0 else float("-inf")
+
+
+def analyze_file(path):
+    """Measure one WAV. Returns a JSON-friendly dict (loudness in LUFS, peaks/RMS in dBFS)."""
+    info = read_info(path)
+    raw = map_raw(info)
+    seg = max(1, int(round(SEGMENT_SEC * info.sample_rate)))
+    usable = len(raw) // seg * seg or len(raw)      # a file shorter than one segment is one segment
+    energy, sumsq = [], 0.0
+    for start, x in iter_blocks(info, seg * BLOCK_SEGMENTS, raw):
+        sumsq += float(np.square(x, dtype=np.float64).sum())
+        if start < usable:
+            energy.append(_segment_energy(x[:usable - start], info.sample_rate))
+    samples = len(raw) * info.channels
+    rms = math.sqrt(sumsq / samples) if samples else 0.0
+    return {
+        "v": ANALYSIS_VERSION,
+        "integrated": gated_loudness(np.concatenate(energy) if energy else [], info.channels),
+        "true_peak": _db(true_peak(raw, info)),
+        "rms": _db(rms),
+        "duration": info.duration,
+    }
+
+
+def normalization_gain(stats, target_lufs, peak_ceiling=-1.0):
+    """Gain in dB bringing a file to target_lufs without pushing its true peak above peak_ceiling."""
+    if stats is None or not math.isfinite(stats["integrated"]):
+        return 0.0
+    gain = target_lufs - stats["integrated"]
+    if math.isfinite(stats["true_peak"]):
+        gain = min(gain, peak_ceiling - stats["true_peak"])
+    return round(max(WWISE_VOLUME_MIN, min(WWISE_VOLUME_MAX, gain)), 2)
+
+
+class LoudnessAnalyzer:
+    """Analyse many WAVs, reusing cached results for files whose content hash is already known."""
+
+    def __init__(self, cache_path=None, workers=None, logger=None):
+        root = cache_root("loudness")
+        self.cache = JsonStore(cache_path or root / "loudness.json")
+        self.digests = DigestCache()
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = logger
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def analyze(self, wavs):
+        """Return {wav_path: stats or None}. Files that fail to parse map to None."""
+        if np is None:
+            raise RuntimeError("numpy is required for loudness analysis (pip install numpy)")
+        results, todo = {}, {}
+        for w in wavs:
+            try:
+                key = self.digests.digest(w)
+            except OSError as e:
+                self._log(f"Loudness: cannot read {w}: {e}")
+                results[w] = None
+                continue
+            hit = self.cache.get(key)
+            if hit and hit.get("v") == ANALYSIS_VERSION:
+                results[w] = hit
+            else:
+                todo.setdefault(key, []).append(w)
+
+        if todo:
+            self._log(f"Loudness: analysing {len(todo)} file(s), {len(results)} cached")
+            keys = list(todo)
+            paths = [todo[k][0] for k in keys]
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(paths))) as pool:
+                futures = [pool.submit(analyze_file, p) for p in paths]
+                for key, fut in zip(keys, futures):
+                    try:
+                        stats = fut.result()
+                        self.cache.put(key, stats)
+                    except Exception as e:
+                        self._log(f"Loudness: analysis failed for {todo[key][0]}: {e}")
+                        stats = None
+                    for w in todo[key]:
+                        results[w] = stats
+        self.cache.save()
+        self.digests.save()
+        return results
+
+    def gains(self, wavs, target_lufs, peak_ceiling=-1.0):
+        """Return {wav_path: gain_db} for every input."""
+        stats = self.analyze(wavs)
+        return {w: normalization_gain(s, target_lufs, peak_ceiling) for w, s in stats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure loudness of WAV files")
+    parser.add_argument("input", help="WAV file or folder")
+    parser.add_argument("--target", type=float, default=None, help="Print the normalization gain towards this LUFS")
+    parser.add_argument("--peak-ceiling", type=float, default=-1.0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if os.path.isdir(args.input):
+        wavs = [os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith(".wav")]
+    else:
+        wavs = [args.input]
+    analyzer = LoudnessAnalyzer(workers=args.workers)
+    for w, s in sorted(analyzer.analyze(wavs).items()):
+        if s is None:
+            print(f"{w}\tERROR")
+            continue
+        line = f"{w}\tI={s['integrated']:.2f} LUFS\tTP={s['true_peak']:.2f} dBTP\tRMS={s['rms']:.2f} dBFS"
+        if args.target is not None:
+            line += f"\tgain={normalization_gain(s, args.target, args.peak_ceiling):+.2f} dB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Multi-project batch builds from one manifest.
+
+    {
+      "console": "C:/Program Files/Audiokinetic/Wwise2024.1.0/Authoring/x64/Release/bin/WwiseConsole.exe",
+      "max_parallel": 2,
+      "bank_cache": true,
+      "waapi_pool": false,
+      "priorities": {"UI*": 10, "VO*": 10},
+      "defaults": {"platforms": ["Windows", "Android"], "create_events": true, "normalize_lufs": -23},
+      "jobs": [
+        {"name": "GameA", "project": "GameA/GameA.wproj", "input": "GameA/Audio", "soundbank": "Main"},
+        {"name": "GameA_UI", "project": "GameA/GameA.wproj", "input": "GameA/Audio/UI", "soundbank": "UI"},
+        {"name": "DLC1", "project": "DLC1/DLC1.wproj", "input": "DLC1/Audio", "platforms": ["Windows"]}
+      ]
+    }
+
+Relative paths are resolved against the manifest folder; job keys override "defaults". The console is
+resolved once, WAV discovery is shared (a sub-folder of an already scanned root is not walked again) and
+one bank cache serves every job. Jobs of different projects run concurrently up to max_parallel; jobs of
+the same project run one after another unless waapi_pool is on, in which case every job gets a warm
+WAAPI server with its own project copy from a shared ServerPool. A combined BatchReport.json is written.
+
+waapi_pool builds banks only: jobs import, create Events and apply sidecar settings in the pool's project
+copies, and those edits are discarded with the copies. They are not written back to the source projects
+(jobs of one project edit the same work units in different copies). Use it for CI bank builds, not to
+update a project.
+
+Jobs are started by priority (job "priority", or the "priorities" rules on bank names), then longest
+first, with costs estimated from earlier runs (wwise_schedule.py). The report compares the predicted and
+actual start/finish of every job.
+
+    python wwise_manifest.py builds.json [--max-parallel N] [--only GameA DLC1] [--report out.json]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from wwise_wav2bnk_window import (WwiseBatchWorker, Logger, discover_windows_console, DEFAULT_PLATFORMS, DEFAULT_LANGUAGE,
+                                  DEFAULT_OBJECT_ROOT, DEFAULT_EVENT_PATTERN)
+from wwise_bankcache import BankCache, RemoteBankCache, DEFAULT_MAX_BYTES
+from wwise_waapi_pool import ServerPool, default_pool_size
+from wwise_schedule import TimingHistory, job_bank, job_priority, order, plan
+from wwise_library import discover as discover_library
+
+# manifest keys passed straight to WwiseBatchWorker as keyword arguments
+WORKER_OPTIONS = ("normalize_lufs", "peak_ceiling", "trim_silence", "trim_threshold_db", "trim_tail_ms", "dedupe", "near_dupes",
+                  "waapi_window", "events_with_sounds", "waapi_max_payload", "waapi_url", "waapi_server",
+                  "package_dir", "package_format", "bnk_diff", "bank_index",
+                  "id_preflight", "id_header", "event_index", "raw_console", "library", "library_db", "sidecars")
+PATH_KEYS = ("project", "input", "output", "console", "package_dir", "id_header", "library_db")
+
+
+class ManifestError(Exception):
+    pass
+
+
+def load_manifest(path):
+    """Read a manifest and return (settings, jobs) with defaults merged and paths made absolute."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    base = Path(path).resolve().parent
+
+    def resolve(value):
+        return str((base / value).resolve()) if value and not os.path.isabs(value) else value
+
+    defaults = data.get("defaults", {})
+    jobs, names = [], set()
+    for i, raw in enumerate(data.get("jobs", [])):
+        job = dict(defaults, **raw)
+        for key in PATH_KEYS:
+            if job.get(key):
+                job[key] = resolve(job[key])
+        job.setdefault("name", f"job{i + 1}")
+        if job["name"] in names:
+            raise ManifestError(f"duplicate job name '{job['name']}'")
+        names.add(job["name"])
+        for key in ("project", "input"):
+            if not job.get(key):
+                raise ManifestError(f"job '{job['name']}' has no {key}")
+        jobs.append(job)
+    if not jobs:
+        raise ManifestError("manifest has no jobs")
+    settings = {k: v for k, v in data.items() if k not in ("defaults", "jobs")}
+    if settings.get("console"):
+        settings["console"] = resolve(settings["console"])
+    if isinstance(settings.get("bank_cache"), dict) and settings["bank_cache"].get("dir"):
+        settings["bank_cache"]["dir"] = resolve(settings["bank_cache"]["dir"])
+    return settings, jobs
+
+
+class WavDiscovery:
+    """Shared, thread-safe WAV discovery: each root is walked once, sub-folders reuse a parent's scan."""
+
+    def __init__(self):
+        self._scans = {}
+        self._lock = threading.Lock()
+        self.walks = 0
+
+    def wavs(self, root):
+        root = os.path.abspath(root)
+        with self._lock:
+            for scanned, files in self._scans.items():
+                if root == scanned or root.startswith(scanned + os.sep):
+                    return [f for f in files if f.startswith(root + os.sep)]
+            self.walks += 1
+            files = sorted(os.path.join(r, f) for r, _, fs in os.walk(root) for f in fs if f.lower().endswith(".wav"))
+            self._scans[root] = files
+            return files
+
+
+class ManifestRunner:
+    """Runs every job of a manifest with shared console, discovery, bank cache and (optional) server pool."""
+
+    def __init__(self, settings, jobs, max_parallel=None, logger=None):
+        self.settings = settings
+        self.jobs = jobs
+        self.logger = logger
+        self.console = self._resolve_console(settings.get("console"))
+        self.discovery = WavDiscovery()
+        self.bank_cache = self._make_bank_cache(settings.get("bank_cache"))
+        self.use_pool = bool(settings.get("waapi_pool"))
+        projects = {j["project"] for j in jobs}
+        tasks = len(jobs) if self.use_pool else len(projects)
+        limit = max_parallel or settings.get("max_parallel") or min(os.cpu_count() or 1, default_pool_size())
+        self.max_parallel = max(1, min(int(limit), tasks))
+        self.pool = ServerPool(self.console, size=self.max_parallel, logger=logger) if self.use_pool else None
+        self.history = TimingHistory()
+        self.results = {}
+        self.schedule = {}
+        self._lock = threading.Lock()
+        self._t0 = None
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _resolve_console(self, console):
+        if not console and sys.platform.startswith("win"):
+            console = discover_windows_console()
+        if not console or not os.path.isfile(console):
+            raise ManifestError("Cannot find a valid WwiseConsole; set \"console\" in the manifest")
+        return console
+
+    def _make_bank_cache(self, conf):
+        if not conf:
+            return None
+        conf = conf if isinstance(conf, dict) else {}
+        remote = RemoteBankCache(conf["url"], conf.get("timeout", 5.0)) if conf.get("url") else None
+        max_bytes = int(conf["gb"] * 1024 ** 3) if conf.get("gb") else DEFAULT_MAX_BYTES
+        return BankCache(conf.get("dir"), max_bytes, None, remote)
+
+    @staticmethod
+    def _job_output(job):
+        return os.path.normcase(os.path.abspath(job.get("output") or os.path.join(Path(job["project"]).parent, "GeneratedSoundBanks")))
+
+    def _job_log_path(self, job):
+        out = self._job_output(job)
+        os.makedirs(out, exist_ok=True)
+        return os.path.join(out, f"WwiseBatchLog_{job['name']}.txt")
+
+    def _run_job(self, job, server=None):
+        t0 = time.time()
+        result = {"name": job["name"], "project": job["project"], "input": job["input"], "ok": False, "files": 0,
+                  "started": round(t0 - self._t0, 2)}
+        worker = None
+        try:
+            use_library = job.get("select") is not None or bool(job.get("library"))
+            if use_library:
+                # library jobs: incremental scan of the SQLite index, then the job's query
+                wavs = discover_library(job["input"], job.get("select"), job.get("library_db"))
+            else:
+                wavs = self.discovery.wavs(job["input"])
+            result["files"] = len(wavs)
+            if not wavs:
+                raise ManifestError("no WAV files found in input")
+            log_path = self._job_log_path(job)
+            result["log"] = log_path
+            options = {k: job[k] for k in WORKER_OPTIONS if k in job}
+            options["library"] = use_library
+            options["input_root"] = job["input"]
+            project = job["project"]
+            output = job.get("output")
+            if server is not None:
+                # the leased server works on its own project copy and generates there; the banks are copied to the
+                # job's folder, and the bank cache and resume journal are keyed on the job's own project
+                options["waapi_server"] = server
+                options["source_project"] = job["project"]
+                project = server.project
+                output = output or os.path.join(Path(job["project"]).parent, "GeneratedSoundBanks")
+            worker = WwiseBatchWorker(self.console, project, job.get("language", DEFAULT_LANGUAGE),
+                                      job_bank(job), job.get("object_root", DEFAULT_OBJECT_ROOT),
+                                      wavs, job.get("platforms", DEFAULT_PLATFORMS), output, job.get("create_events", False),
+                                      job.get("event_pattern", DEFAULT_EVENT_PATTERN), False, True, Logger(None, log_path),
+                                      bank_cache=self.bank_cache, **options)
+            result["soundbank"] = worker.soundbank
+            result["platforms"] = worker.platforms
+            result["ok"] = bool(worker.run())
+        except Exception as e:
+            result["error"] = str(e)
+        result["elapsed"] = round(time.time() - t0, 2)
+        result["finished"] = round(time.time() - self._t0, 2)
+        with self._lock:
+            self.results[job["name"]] = result
+            if result["ok"]:
+                self.history.record(job, result["files"], result["elapsed"], worker.timings)
+        self._log(f"{'✔' if result['ok'] else '✖'} {job['name']} ({result['elapsed']:.1f}s)"
+                  + (f": {result['error']}" if result.get("error") else ""))
+        return result
+
+    def _run_leased(self, job):
+        with self.pool.lease(job["project"]) as server:
+            return self._run_job(job, server)
+
+    def _run_leased_group(self, jobs):
+        return [self._run_leased(job) for job in jobs]
+
+    def _run_project(self, jobs):
+        return [self._run_job(job) for job in jobs]
+
+    def _groups(self, entries):
+        """Entries that must run one after the other: same output folder (the bank cache diffs it to find a
+        job's banks), and without the pool also the same project. Returns lists of entries."""
+        parent = list(range(len(entries)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        seen = {}
+        for i, e in enumerate(entries):
+            job = e["jobs"][0]
+            keys = [("output", self._job_output(job))] + ([] if self.use_pool else [("project", job["project"])])
+            for key in keys:
+                if key in seen:
+                    parent[find(i)] = find(seen[key])
+                else:
+                    seen[key] = i
+        groups = {}
+        for i, e in enumerate(entries):
+            groups.setdefault(find(i), []).append(e)
+        return list(groups.values())
+
+    def _plan(self):
+        """Tasks in start order. A task is a set of jobs run in order: the jobs sharing an output folder, and
+        without the pool also those sharing a project."""
+        rules = self.settings.get("priorities")
+        for job in self.jobs:
+            try:
+                files = len(self.discovery.wavs(job["input"]))
+            except OSError:
+                files = 0
+            self.schedule[job["name"]] = {"priority": job_priority(job, rules), "cost": round(self.history.estimate(job, files), 2)}
+        entries = []
+        for group in self._groups([dict(self.schedule[j["name"]], jobs=[j]) for j in self.jobs]):
+            group = order(group)
+            entries.append({"priority": group[0]["priority"], "cost": sum(e["cost"] for e in group),
+                            "jobs": [j for e in group for j in e["jobs"]]})
+        tasks, self.predicted_makespan = plan(entries, self.max_parallel)
+        for task in tasks:
+            start = task["predicted_start"]
+            for job in task["jobs"]:
+                entry = self.schedule[job["name"]]
+                entry["predicted_start"] = round(start, 2)
+                start += entry["cost"]
+                entry["predicted_finish"] = round(start, 2)
+        return tasks
+
+    def run(self):
+        self._t0 = time.time()
+        tasks = self._plan()
+        self._log(f"Manifest: {len(self.jobs)} job(s), up to {self.max_parallel} in parallel, "
+                  f"predicted {self.predicted_makespan:.0f}s; order: {', '.join(j['name'] for t in tasks for j in t['jobs'])}")
+        if self.use_pool:
+            self._log("WAAPI pool: jobs work on project copies; imported Sounds, Events and settings are not written back to the projects")
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+                if self.use_pool:
+                    futures = [pool.submit(self._run_leased_group, t["jobs"]) for t in tasks]
+                else:
+                    futures = [pool.submit(self._run_project, t["jobs"]) for t in tasks]
+                for f in futures:
+                    f.result()
+        finally:
+            if self.pool:
+                self.pool.close()
+            if self.bank_cache:
+                self.bank_cache.save()
+            self.history.save()
+        self.elapsed = time.time() - self._t0
+        return all(r["ok"] for r in self.results.values())
+
+    def report(self):
+        jobs = [self.results[j["name"]] for j in self.jobs if j["name"] in self.results]
+        schedule = [dict(self.schedule[j["name"]], name=j["name"], actual_start=j.get("started"), actual_finish=j.get("finished"))
+                    for j in sorted(jobs, key=lambda r: r.get("started", 0))]
+        return {"finished": datetime.datetime.now().isoformat(timespec="seconds"), "elapsed": round(self.elapsed, 2),
+                "max_parallel": self.max_parallel, "ok": all(j["ok"] for j in jobs),
+                "failed": [j["name"] for j in jobs if not j["ok"]], "wav_scans": self.discovery.walks, "jobs": jobs,
+                "bank_cache": self.bank_cache.summary() if self.bank_cache else None,
+                "schedule": {"predicted_makespan": self.predicted_makespan, "actual_makespan": round(self.elapsed, 2), "jobs": schedule}}
+
+    def write_report(self, path):
+        report = self.report()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return report
+
+
+def run_manifest(path, max_parallel=None, only=None, report_path=None):
+    """Run a manifest from the command line; returns the process exit code."""
+    class _Print:
+        def write(self, msg):
+            print(msg)
+
+    try:
+        settings, jobs = load_manifest(path)
+        if only:
+            jobs = [j for j in jobs if j["name"] in set(only)]
+        runner = ManifestRunner(settings, jobs, max_parallel, _Print())
+    except (ManifestError, OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        return 2
+    ok = runner.run()
+    report_path = report_path or os.path.join(Path(path).resolve().parent, "BatchReport.json")
+    report = runner.write_report(report_path)
+    print(f"{len(report['jobs']) - len(report['failed'])}/{len(report['jobs'])} job(s) ok in {report['elapsed']:.1f}s -> {report_path}")
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build several Wwise projects from one manifest")
+    parser.add_argument("manifest")
+    parser.add_argument("--max-parallel", type=int, default=None)
+    parser.add_argument("--only", nargs="+", default=None, help="Run only these job names")
+    parser.add_argument("--report", default=None, help="Combined report path (default: BatchReport.json next to the manifest)")
+    args = parser.parse_args()
+    sys.exit(run_manifest(args.manifest, args.max_parallel, args.only, args.report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Per-platform packaging of generated SoundBanks.
+
+For every platform folder of a bank output directory:
+- a manifest (<platform>.manifest.json) with the size and SHA-256 of every file, hashed in a thread pool
+  and memoized by size + mtime (DigestCache), so unchanged files are not read again;
+- one archive streamed straight from the source files (no staging copy): tar + zstd when the
+  `zstandard` module is installed, otherwise tar + xz, or zip.
+
+The manifest also holds a digest of the whole file set; a platform whose set did not change since the
+last package (and whose archive still exists) is skipped.
+
+    python wwise_package.py GeneratedSoundBanks --out Packages --platforms Windows Android
+"""
+
+import os
+import json
+import lzma
+import fnmatch
+import hashlib
+import tarfile
+import zipfile
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except Exception:
+    zstandard = None
+
+from wwise_cache import DigestCache, atomic_write_text
+from wwise_bankcache import IGNORE_PATTERNS
+
+FORMATS = ("auto", "zst", "xz", "zip")
+EXTENSIONS = {"zst": ".tar.zst", "xz": ".tar.xz", "zip": ".zip"}
+ZSTD_LEVEL = 10
+XZ_PRESET = 6
+MANIFEST_VERSION = 1
+
+
+def resolve_format(fmt):
+    if fmt == "auto":
+        return "zst" if zstandard is not None else "xz"
+    if fmt == "zst" and zstandard is None:
+        raise RuntimeError("zstd packaging needs the zstandard module (pip install zstandard)")
+    return fmt
+
+
+def list_files(root):
+    """Relative paths (POSIX separators) of the files to package, sorted."""
+    files = []
+    for r, dirs, fs in os.walk(root):
+        dirs.sort()
+        for f in fs:
+            if any(fnmatch.fnmatch(f, p) for p in IGNORE_PATTERNS):
+                continue
+            files.append(Path(os.path.relpath(os.path.join(r, f), root)).as_posix())
+    return sorted(files)
+
+
+def build_manifest(root, platform, digests=None, workers=None):
+    """Manifest dict for the files under root; hashes are computed in parallel."""
+    rels = list_files(root)
+    digests = digests or DigestCache()
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 2)) as pool:
+        hashes = list(pool.map(lambda rel: digests.digest(os.path.join(root, rel)), rels))
+    files = [{"path": rel, "size": os.path.getsize(os.path.join(root, rel)), "sha256": h} for rel, h in zip(rels, hashes)]
+    set_digest = hashlib.sha256(json.dumps([[f["path"], f["size"], f["sha256"]] for f in files]).encode()).hexdigest()
+    return {"v": MANIFEST_VERSION, "platform": platform, "files": files, "total_bytes": sum(f["size"] for f in files),
+            "set_digest": set_digest}
+
+
+def _write_tar(root, rels, out, fmt):
+    with open(out, "wb") as raw:
+        if fmt == "zst":
+            writer = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).stream_writer(raw)
+        else:
+            writer = lzma.LZMAFile(raw, "wb", preset=XZ_PRESET)
+        with writer:
+            # "w|" streams members straight from the source files into the compressor
+            with tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                for rel in rels:
+                    tar.add(os.path.join(root, rel), arcname=rel, recursive=False)
+
+
+def _write_zip(root, rels, out):
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+        for rel in rels:
+            zf.write(os.path.join(root, rel), rel)
+
+
+def write_archive(root, rels, out, fmt):
+    """Stream the files into out through a .part file that is renamed when complete."""
+    tmp = str(out) + ".part"
+    try:
+        if fmt == "zip":
+            _write_zip(root, rels, tmp)
+        else:
+            _write_tar(root, rels, tmp, fmt)
+        os.replace(tmp, out)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class Packager:
+    def __init__(self, out_dir, fmt="auto", workers=None, logger=None):
+        self.out_dir = str(out_dir)
+        self.fmt = resolve_format(fmt)
+        self.workers = workers
+        self.logger = logger
+        self.digests = DigestCache()
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def package(self, bank_dir, platform):
+        """Package bank_dir/<platform>. Returns (archive path, manifest, skipped)."""
+        root = os.path.join(bank_dir, platform)
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"no output folder for {platform}: {root}")
+        os.makedirs(self.out_dir, exist_ok=True)
+        manifest_path = os.path.join(self.out_dir, f"{platform}.manifest.json")
+        archive = os.path.join(self.out_dir, platform + EXTENSIONS[self.fmt])
+        manifest = build_manifest(root, platform, self.digests, self.workers)
+        manifest["archive"] = os.path.basename(archive)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = None
+        if previous and previous.get("set_digest") == manifest["set_digest"] \
+                and previous.get("archive") == manifest["archive"] and os.path.exists(archive):
+            return archive, previous, True
+        write_archive(root, [f["path"] for f in manifest["files"]], archive, self.fmt)
+        manifest["archive_bytes"] = os.path.getsize(archive)
+        atomic_write_text(manifest_path, json.dumps(manifest, indent=2))
+        return archive, manifest, False
+
+    def package_all(self, bank_dir, platforms):
+        results = {}
+        try:
+            for plat in platforms:
+                try:
+                    archive, manifest, skipped = self.package(bank_dir, plat)
+                except Exception as e:
+                    self._log(f"Package {plat} failed: {e}")
+                    continue
+                results[plat] = archive
+                if skipped:
+                    self._log(f"Package {plat}: unchanged, kept {os.path.basename(archive)}")
+                else:
+                    ratio = manifest["archive_bytes"] / manifest["total_bytes"] if manifest["total_bytes"] else 1.0
+                    self._log(f"Package {plat}: {len(manifest['files'])} file(s), {manifest['total_bytes'] / 1048576.0:.1f} MB "
+                              f"-> {os.path.basename(archive)} ({ratio:.0%})")
+        finally:
+            self.digests.save()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package generated SoundBanks per platform")
+    parser.add_argument("bank_dir", help="GeneratedSoundBanks folder (one sub-folder per platform)")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--platforms", nargs="+", default=None, help="Default: every sub-folder")
+    parser.add_argument("--format", choices=FORMATS, default="auto")
+    args = parser.parse_args()
+
+    class _Print:
+        def write(self, msg):
+            print(msg)
+
+    platforms = args.platforms or sorted(d for d in os.listdir(args.bank_dir) if os.path.isdir(os.path.join(args.bank_dir, d)))
+    Packager(args.out, args.format, logger=_Print()).package_all(args.bank_dir, platforms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Progress and ETA from WwiseConsole output.
+
+ProgressTracker is fed the console's output line by line. A single precompiled gate pattern rejects the
+bulk of the lines (banners, warnings, paths) with one search; only lines that pass it are matched
+against the per-file conversion / import messages, the bank generation messages and explicit
+percentages. Each recognized line becomes a ProgressEvent (stage, platform, done/total, ETA from the
+throughput so far) for a Tk progress bar or for throttled CLI progress lines (ProgressPrinter).
+
+Stages driven by the tool itself (WAAPI chunks, event batches, per-event console calls) call advance().
+"""
+
+import re
+import time
+
+# one search decides whether a line can be a progress line at all; the fragments are case-sensitive
+# (they are lower-case in "Converting" and "converting" alike) so the engine keeps its literal fast path
+GATE = re.compile(r"onvert|mport|enerat|riting|%")
+FILE_LINE = re.compile(r"\b(?:convert|import)(?:ing|ed)?\b.*?([^\\/'\"\s]+\.(?:wav|wem))\b", re.IGNORECASE)
+BANK_LINE = re.compile(r"\b(?:generat|writ)(?:ing|ed)\b.*?([^\\/'\"\s]+\.bnk)\b", re.IGNORECASE)
+PERCENT = re.compile(r"(?<![\d.])(\d{1,3}(?:\.\d+)?)\s?%")
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+
+class ProgressEvent:
+    __slots__ = ("stage", "platform", "done", "total", "item", "elapsed", "eta")
+
+    def __init__(self, stage, platform, done, total, item, elapsed, eta):
+        self.stage = stage
+        self.platform = platform
+        self.done = done
+        self.total = total
+        self.item = item
+        self.elapsed = elapsed
+        self.eta = eta
+
+    @property
+    def fraction(self):
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    @property
+    def label(self):
+        return f"{self.stage} {self.platform}" if self.platform else self.stage
+
+    def __str__(self):
+        return f"{self.label}: {self.done}/{self.total} ({self.fraction:.0%}), ETA {format_eta(self.eta)}"
+
+
+class ProgressTracker:
+    """done/total of one stage. callback(ProgressEvent) is called at most every min_interval seconds, and always at the end."""
+
+    def __init__(self, stage, total, platform=None, callback=None, min_interval=0.1):
+        self.stage = stage
+        self.total = max(0, int(total))
+        self.platform = platform
+        self.callback = callback
+        self.min_interval = min_interval
+        self.done = 0
+        self.start = time.time()
+        self._seen = set()
+        self._last = 0.0
+
+    def eta(self):
+        if not self.done or self.done >= self.total:
+            return 0.0 if self.done >= self.total else None
+        elapsed = time.time() - self.start
+        return elapsed * (self.total - self.done) / self.done
+
+    def _emit(self, item=None, force=False):
+        if self.callback is None:
+            return
+        now = time.time()
+        if not force and self.done < self.total and now - self._last < self.min_interval:
+            return
+        self._last = now
+        self.callback(ProgressEvent(self.stage, self.platform, min(self.done, self.total), self.total, item,
+                                    now - self.start, self.eta()))
+
+    def feed(self, line):
+        """Update from one console output line. Returns True when the line was a progress line."""
+        if not GATE.search(line):
+            return False
+        m = FILE_LINE.search(line)
+        if m:
+            # "Converting x.wav" and "Converted x.wav" are the same file
+            key = m.group(1).lower()
+            if key not in self._seen:
+                self._seen.add(key)
+                self.done += 1
+                self._emit(m.group(1))
+            return True
+        m = BANK_LINE.search(line)
+        if m:
+            self._emit(m.group(1), force=True)
+            return True
+        m = PERCENT.search(line)
+        if m and self.total:
+            done = int(self.total * min(float(m.group(1)), 100.0) / 100.0)
+            if done > self.done:
+                self.done = done
+                self._emit()
+            return True
+        return False
+
+    def advance(self, n=1, item=None):
+        self.done += n
+        self._emit(item)
+
+    def finish(self):
+        self.done = max(self.done, self.total)
+        self._emit(force=True)
+
+
+class ProgressPrinter:
+    """Callback writing one progress line per stage every `interval` seconds (and when a stage completes)."""
+
+    def __init__(self, write=print, interval=2.0):
+        self.write = write
+        self.interval = interval
+        self._last = {}
+
+    def __call__(self, event):
+        now = time.time()
+        done = event.done >= event.total
+        if not done and now - self._last.get(event.label, 0.0) < self.interval:
+            return
+        if done and self._last.get(event.label) == -1:
+            return
+        self._last[event.label] = -1 if done else now
+        self.write(f"Progress {event}")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Cost- and priority-aware ordering of build jobs.
+
+- TimingHistory: per-job stage timings from earlier runs (exponential moving average), persisted in the
+  tool cache. Stages are kept as seconds per file (import, events, settings, each platform's generation,
+  and the unmeasured rest such as analysis), except the per-run ones (bank index, event index, package),
+  so a job is estimated for its current file count and platforms. Jobs never seen before are estimated
+  from the seconds per (file x platform) learned over all jobs, or from a fixed guess on the very first run.
+- plan(): priority first (higher runs earlier), then longest-processing-time-first inside a priority.
+  Submitting jobs in this order to a pool of N workers is LPT list scheduling; plan() simulates it to
+  predict every job's start and finish, so the report can compare predicted and actual completion.
+"""
+
+import heapq
+import fnmatch
+import argparse
+from pathlib import Path
+
+from wwise_cache import cache_root, JsonStore
+
+EWMA_ALPHA = 0.5
+DEFAULT_RATE = 0.5          # seconds per file x platform before anything was measured
+PLATFORM_OVERHEAD = 5.0     # seconds of fixed console cost per platform
+RATE_KEY = "__rate__"
+FIXED_STAGES = ("index", "event_index", "package")     # cost per run, not per file
+OTHER = "other"             # elapsed time outside the timed stages (analysis, trim, discovery...)
+
+
+def job_bank(job):
+    """Bank name of a manifest job, defaulting like the worker does (the input folder name)."""
+    return job.get("soundbank") or Path(job["input"]).name
+
+
+def _ewma(prev, value):
+    return value if prev is None else prev + EWMA_ALPHA * (value - prev)
+
+
+def _merge(old, new):
+    """EWMA-update the measured entries of `old` with `new`, keeping the unmeasured ones as they were."""
+    merged = dict(old or {})
+    for name, value in new.items():
+        merged[name] = _ewma(merged.get(name), value)
+    return merged
+
+
+class TimingHistory:
+    def __init__(self, path=None):
+        self.store = JsonStore(path or cache_root("timings") / "history.json")
+
+    @staticmethod
+    def key(job):
+        return f"{job['project']}::{job['name']}"
+
+    def estimate(self, job, files):
+        """Predicted seconds for a job with `files` WAVs."""
+        hit = self.store.get(self.key(job))
+        if hit and hit.get("rates"):
+            n = max(files, 1)
+            rates = hit["rates"]
+            generate = {s: r for s, r in rates.items() if s.startswith("generate:")}
+            total = sum(r * n for s, r in rates.items() if s not in generate) + sum(hit.get("fixed", {}).values())
+            if job.get("platforms"):
+                # a platform without history costs what the others cost on average
+                mean = sum(generate.values()) / len(generate) if generate else 0.0
+                total += sum(generate.get(f"generate:{p}", mean) * n for p in job["platforms"])
+            else:
+                total += sum(generate.values()) * n
+            return total
+        if hit:
+            # recorded before per-stage rates: scale the whole run with the file count
+            return hit["elapsed"] * max(files, 1) / max(hit.get("files") or 1, 1)
+        platforms = len(job.get("platforms") or [None])
+        rate = self.store.get(RATE_KEY)
+        if rate is None:
+            return platforms * (files * DEFAULT_RATE + PLATFORM_OVERHEAD)
+        return platforms * max(files, 1) * rate
+
+    def record(self, job, files, elapsed, stages=None):
+        key = self.key(job)
+        old = self.store.get(key) or {}
+        stages = dict(stages or {})
+        n = max(files, 1)
+        fixed = {s: t for s, t in stages.items() if s in FIXED_STAGES}
+        rates = {s: t / n for s, t in stages.items() if s not in FIXED_STAGES}
+        rates[OTHER] = max(0.0, elapsed - sum(stages.values())) / n
+        # stages not run this time (banks restored from the cache, resumed units) keep what was learned
+        entry = {"files": files, "runs": old.get("runs", 0) + 1,
+                 "elapsed": _ewma(old.get("elapsed"), elapsed),
+                 "stages": _merge(old.get("stages"), stages),
+                 "rates": _merge(old.get("rates"), rates),
+                 "fixed": _merge(old.get("fixed"), fixed)}
+        self.store.put(key, entry)
+        platforms = len(job.get("platforms") or [None])
+        if files:
+            rate = elapsed / (platforms * files)
+            prev = self.store.get(RATE_KEY)
+            self.store.put(RATE_KEY, rate if prev is None else prev + EWMA_ALPHA * (rate - prev))
+
+    def save(self):
+        self.store.save()
+
+
+def job_priority(job, rules=None):
+    """Explicit job "priority" wins; otherwise the highest matching {soundbank pattern: priority} rule."""
+    if job.get("priority") is not None:
+        return job["priority"]
+    bank = job_bank(job)
+    matches = [p for pattern, p in (rules or {}).items() if fnmatch.fnmatchcase(bank.lower(), pattern.lower())]
+    return max(matches) if matches else 0
+
+
+def order(tasks):
+    """tasks: list of dicts with "priority" and "cost". Higher priority first, then longest first."""
+    return sorted(tasks, key=lambda t: (-t["priority"], -t["cost"]))
+
+
+def plan(tasks, workers):
+    """Order the tasks and simulate them on `workers` slots. Sets predicted_start/finish; returns (order, makespan)."""
+    ordered = order(tasks)
+    slots = [0.0] * max(1, workers)
+    heapq.heapify(slots)
+    makespan = 0.0
+    for t in ordered:
+        start = heapq.heappop(slots)
+        t["predicted_start"] = round(start, 2)
+        t["predicted_finish"] = round(start + t["cost"], 2)
+        makespan = max(makespan, start + t["cost"])
+        heapq.heappush(slots, start + t["cost"])
+    return ordered, round(makespan, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the recorded job timings")
+    parser.add_argument("--history", default=None)
+    args = parser.parse_args()
+    history = TimingHistory(args.history)
+    for key, entry in sorted(history.store.data.items()):
+        if key == RATE_KEY:
+            print(f"learned rate: {entry:.3f}s per file x platform")
+        else:
+            print(f"{key}: {entry['elapsed']:.1f}s over {entry['runs']} run(s), {entry['files']} file(s)")
+
+
+if __name__ == "__main__":
+    main()
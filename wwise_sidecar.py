@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Per-sound settings from sidecar files, resolved during discovery.
+
+Two kinds of sidecar, JSON or YAML (YAML needs PyYAML):
+
+- wwise_settings.json in any folder: settings for every WAV in that folder and below, plus "rules" whose
+  "match" glob is tested against the file name (case-insensitive)
+
+      {"streaming": true, "conversion": "Vorbis Quality High",
+       "rules": [{"match": "*_loop.wav", "loop": true}, {"match": "ui_*", "streaming": false, "volume": -3}]}
+
+- <name>.wav.json next to a WAV: settings for that file only
+
+Precedence, lowest first: the folders from the input root down (each folder's settings, then its rules),
+then the file's own sidecar. Every folder is read and resolved once and inherited by its sub-folders in
+memory, so 100k files cost one directory listing per folder plus a few compiled glob matches per file.
+
+Settings are translated to Wwise Sound properties when a file is loaded:
+
+    streaming      IsStreamingEnabled            zero_latency   IsZeroLatency
+    loop           true/false, or a loop count   volume, pitch, lowpass, highpass
+    conversion     Conversion ShareSet (name, \\path or {GUID}), with OverrideConversion
+    "@Name"        any Wwise property, passed as-is
+
+    python wwise_sidecar.py Sounds
+"""
+
+import os
+import re
+import json
+import fnmatch
+import argparse
+
+try:
+    import yaml
+except Exception:
+    yaml = None
+
+RULES_FILES = ("wwise_settings.json", "wwise_settings.yaml", "wwise_settings.yml")
+SIDECAR_SUFFIXES = (".json", ".yaml", ".yml")
+PROPERTIES = {"streaming": "IsStreamingEnabled", "zero_latency": "IsZeroLatency", "volume": "Volume", "pitch": "Pitch",
+              "lowpass": "Lowpass", "highpass": "Highpass"}
+
+
+class SidecarError(Exception):
+    pass
+
+
+def load_file(path):
+    """Parsed content of a JSON or YAML sidecar (a mapping)."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            data = json.load(f)
+        elif yaml is None:
+            raise SidecarError(f"{path}: PyYAML is required for YAML sidecars (pip install pyyaml)")
+        else:
+            data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise SidecarError(f"{path}: expected a mapping of settings")
+    return data
+
+
+def wwise_properties(settings, source=""):
+    """{"@Property": value} for a mapping of settings (the "rules" / "match" keys are ignored)."""
+    props = {}
+    for key, value in settings.items():
+        if key in ("rules", "match"):
+            continue
+        if key.startswith("@"):
+            props[key] = value
+        elif key in PROPERTIES:
+            props["@" + PROPERTIES[key]] = value
+        elif key == "loop":
+            count = 0 if isinstance(value, bool) else int(value)
+            props["@IsLoopingEnabled"] = bool(value)
+            if value and count:
+                props.update({"@IsLoopingInfinite": False, "@LoopCount": count})
+            elif value:
+                props["@IsLoopingInfinite"] = True
+        elif key == "conversion":
+            value = str(value)
+            props["@OverrideConversion"] = True
+            props["@Conversion"] = value if value.startswith(("\\", "{")) else f"Conversion:{value}"
+        else:
+            raise SidecarError(f"{source}: unknown setting '{key}'")
+    return props
+
+
+class SidecarResolver:
+    """Resolve the settings of many WAVs under root; per-folder results are memoized and inherited."""
+
+    def __init__(self, root, logger=None):
+        self.root = os.path.abspath(root)
+        self.logger = logger
+        self.files_read = 0
+        self.errors = []
+        self._folders = {}
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _load(self, path):
+        self.files_read += 1
+        try:
+            return load_file(path)
+        except (OSError, ValueError, SidecarError) as e:
+            self.errors.append(str(e))
+            self._log(f"Sidecar skipped: {e}")
+            return None
+
+    def _properties(self, settings, path):
+        try:
+            return wwise_properties(settings, path)
+        except (SidecarError, TypeError, ValueError) as e:
+            self.errors.append(str(e))
+            self._log(f"Sidecar skipped: {e}")
+            return {}
+
+    def _folder(self, folder):
+        """([(properties, [(compiled match, properties)])] per folder from the root down, file names) of a folder."""
+        state = self._folders.get(folder)
+        if state is not None:
+            return state
+        try:
+            names = set(os.listdir(folder))
+        except OSError:
+            names = set()
+        parent = os.path.dirname(folder)
+        if folder == self.root or not folder.startswith(self.root + os.sep) or parent == folder:
+            levels = []
+        else:
+            levels = self._folder(parent)[0]
+        rules_file = next((n for n in RULES_FILES if n in names), None)
+        data = self._load(os.path.join(folder, rules_file)) if rules_file else None
+        if data:
+            path = os.path.join(folder, rules_file)
+            rules = []
+            for rule in data.get("rules") or []:
+                if isinstance(rule, dict) and rule.get("match"):
+                    rules.append((re.compile(fnmatch.translate(str(rule["match"]).lower())), self._properties(rule, path)))
+            levels = levels + [(self._properties(data, path), rules)]
+        state = self._folders[folder] = (levels, names)
+        return state
+
+    def resolve(self, wav):
+        """{"@Property": value} for one WAV (empty when no sidecar applies)."""
+        folder, name = os.path.split(os.path.abspath(wav))
+        levels, names = self._folder(folder)
+        lowered = name.lower()
+        props = {}
+        for settings, rules in levels:
+            # a folder's settings, then its rules, so a sub-folder overrides the rules of the folders above it
+            props.update(settings)
+            for pattern, p in rules:
+                if pattern.match(lowered):
+                    props.update(p)
+        sidecar = next((name + s for s in SIDECAR_SUFFIXES if name + s in names), None)
+        if sidecar:
+            data = self._load(os.path.join(folder, sidecar))
+            if data:
+                props.update(self._properties(data, os.path.join(folder, sidecar)))
+        return props
+
+    def resolve_all(self, wavs):
+        """{wav: properties} for the WAVs that have any."""
+        result = {}
+        for w in wavs:
+            props = self.resolve(w)
+            if props:
+                result[w] = props
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the sidecar settings resolved for the WAVs under a folder")
+    parser.add_argument("root")
+    parser.add_argument("--json", action="store_true", help="Print {wav: {property: value}} as JSON")
+    args = parser.parse_args()
+
+    wavs = sorted(os.path.join(r, f) for r, _, fs in os.walk(args.root) for f in fs if f.lower().endswith(".wav"))
+    resolver = SidecarResolver(args.root)
+    settings = resolver.resolve_all(wavs)
+    if args.json:
+        print(json.dumps(settings, indent=2))
+    else:
+        for w, props in settings.items():
+            print(f"{os.path.relpath(w, args.root)}: " + ", ".join(f"{k[1:]}={v}" for k, v in sorted(props.items())))
+        print(f"{len(settings)} of {len(wavs)} file(s) with settings, {resolver.files_read} sidecar file(s) read")
+    for error in resolver.errors:
+        print(f"error: {error}")
+    raise SystemExit(1 if resolver.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
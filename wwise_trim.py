@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Pre-import silence trimming of leading and trailing dead air.
+
+Silence boundaries are found with numpy on the memory-mapped data chunk, scanning blocks from the head
+and from the tail only, so the body of a long file is never touched. Trimmed copies are written into a
+content-addressed cache (key = source content hash + trim settings); the originals stay untouched and a
+file that was already processed with the same settings is never read again.
+"""
+
+import os
+import struct
+import hashlib
+import threading
+import argparse
+
+from wwise_cache import cache_root, JsonStore, DigestCache
+from wwise_wavio import read_info, map_raw, to_float, np
+
+TRIM_VERSION = 1
+SCAN_BLOCK = 1 << 15   # frames inspected per step from each end
+COPY_CHUNK = 1 << 20
+MIN_SAVING_MS = 10.0   # not worth a cached copy below this
+RIFF_MAX_DATA = 0xFFFFFFFF - 1024   # trimmed copies are plain RIFF; larger results (RF64 sources) stay untrimmed
+
+
+def _loud_frames(raw, info, threshold):
+    """Boolean array: True where any channel of the frame exceeds the linear threshold."""
+    return (np.abs(to_float(raw, info)) > threshold).any(axis=1)
+
+
+def find_bounds(info, threshold_db=-60.0):
+    """Return (first_loud_frame, last_loud_frame + 1), or (0, 0) for an all-silent file."""
+    raw = map_raw(info)
+    frames = len(raw)
+    threshold = 10.0 ** (threshold_db / 20.0)
+    start = None
+    for lo in range(0, frames, SCAN_BLOCK):
+        hits = np.flatnonzero(_loud_frames(raw[lo:lo + SCAN_BLOCK], info, threshold))
+        if len(hits):
+            start = lo + int(hits[0])
+            break
+    if start is None:
+        return 0, 0
+    end = start + 1
+    for hi in range(frames, start, -SCAN_BLOCK):
+        lo = max(start, hi - SCAN_BLOCK)
+        hits = np.flatnonzero(_loud_frames(raw[lo:hi], info, threshold))
+        if len(hits):
+            end = lo + int(hits[-1]) + 1
+            break
+    return start, end
+
+
+def write_trimmed(info, dest, start, end):
+    """Write frames [start, end) of info's file to dest, reusing the original fmt chunk byte for byte."""
+    with open(info.path, "rb") as src:
+        src.seek(info.fmt_offset)
+        fmt = src.read(info.fmt_size)
+        size = (end - start) * info.block_align
+        # two jobs can trim the same content into the same cache file at once
+        tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.part"
+        try:
+            with open(tmp, "wb") as out:
+                fmt_pad = b"\0" if len(fmt) & 1 else b""
+                riff_size = 4 + 8 + len(fmt) + len(fmt_pad) + 8 + size + (size & 1)
+                out.write(struct.pack("<4sI4s", b"RIFF", riff_size, b"WAVE"))
+                out.write(struct.pack("<4sI", b"fmt ", len(fmt)) + fmt + fmt_pad)
+                out.write(struct.pack("<4sI", b"data", size))
+                src.seek(info.data_offset + start * info.block_align)
+                left = size
+                while left > 0:
+                    chunk = src.read(min(COPY_CHUNK, left))
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    left -= len(chunk)
+                if size & 1:
+                    out.write(b"\0")
+            os.replace(tmp, dest)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+class SilenceTrimmer:
+    """Map each source WAV to the file that should be imported (a trimmed cached copy or the original)."""
+
+    def __init__(self, threshold_db=-60.0, min_tail_ms=50.0, min_head_ms=0.0, cache_dir=None, logger=None):
+        self.threshold_db = threshold_db
+        self.min_tail_ms = min_tail_ms
+        self.min_head_ms = min_head_ms
+        self.cache_dir = cache_dir or cache_root("trim")
+        self.index = JsonStore(os.path.join(self.cache_dir, "index.json"))
+        self.digests = DigestCache()
+        self.logger = logger
+        self.trimmed = 0
+        self.saved_bytes = 0
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _key(self, digest):
+        params = f"{TRIM_VERSION}:{self.threshold_db}:{self.min_tail_ms}:{self.min_head_ms}"
+        return hashlib.sha256(f"{digest}:{params}".encode()).hexdigest()
+
+    def trim(self, wav):
+        """Return the path to import for wav. Never modifies wav."""
+        key = self._key(self.digests.digest(wav))
+        dest = os.path.join(self.cache_dir, key[:2], key + ".wav")
+        entry = self.index.get(key)
+        if entry is not None:
+            if not entry["trimmed"]:
+                return wav
+            if os.path.exists(dest):
+                return dest
+
+        info = read_info(wav)
+        start, end = find_bounds(info, self.threshold_db)
+        if end == 0:
+            # all silent: keep the original rather than importing an empty sound
+            start, end = 0, info.frames
+        start = max(0, start - int(self.min_head_ms * info.sample_rate / 1000.0))
+        end = min(info.frames, end + int(self.min_tail_ms * info.sample_rate / 1000.0))
+        if (info.frames - (end - start)) * 1000.0 < MIN_SAVING_MS * info.sample_rate or \
+                (end - start) * info.block_align > RIFF_MAX_DATA:
+            self.index.put(key, {"trimmed": False})
+            return wav
+
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        write_trimmed(info, dest, start, end)
+        removed = (info.frames - (end - start)) * info.block_align
+        self.index.put(key, {"trimmed": True, "start": start, "end": end, "removed": removed})
+        self.trimmed += 1
+        self.saved_bytes += removed
+        return dest
+
+    def trim_many(self, wavs):
+        """Return {source_wav: path_to_import}. Files that cannot be parsed are imported as-is."""
+        mapping = {}
+        for w in wavs:
+            try:
+                mapping[w] = self.trim(w)
+            except Exception as e:
+                self._log(f"Trim skipped for {w}: {e}")
+                mapping[w] = w
+        self.index.save()
+        self.digests.save()
+        return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trim leading/trailing silence into the trim cache")
+    parser.add_argument("input", help="WAV file or folder")
+    parser.add_argument("--threshold-db", type=float, default=-60.0)
+    parser.add_argument("--min-tail-ms", type=float, default=50.0)
+    parser.add_argument("--min-head-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    if os.path.isdir(args.input):
+        wavs = [os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith(".wav")]
+    else:
+        wavs = [args.input]
+    trimmer = SilenceTrimmer(args.threshold_db, args.min_tail_ms, args.min_head_ms)
+    for src, dst in sorted(trimmer.trim_many(wavs).items()):
+        print(f"{src}\t{dst if dst != src else '(unchanged)'}")
+    print(f"Trimmed {trimmer.trimmed} file(s), {trimmer.saved_bytes / 1048576.0:.1f} MB of silence removed")
+
+
+if __name__ == "__main__":
+    main()
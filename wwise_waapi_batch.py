@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Pipelined WAAPI layer for bulk object operations.
+
+The vendored WaapiClient waits for every reply before sending the next call, so N calls cost N network
+round-trips. PipelinedWaapiClient reuses the vendored autobahn plumbing but dispatches calls without
+waiting, and WaapiBatch keeps a configurable window of requests in flight, collecting a result or an
+error per item plus throughput metrics.
+
+    with PipelinedWaapiClient(url) as client:
+        batch = WaapiBatch(client, window=64)
+        results = batch.run([("ak.wwise.core.object.create", {...}, tag), ...])
+        print(batch.metrics)
+
+WaapiBatch also accepts any object with a blocking call(uri, args) (e.g. a plain WaapiClient); calls are
+then spread over a thread pool of the window size.
+
+A batch never blocks forever: when no reply has arrived for `timeout` seconds (a dropped connection, a
+reply that never comes), the calls still pending fail with a TimeoutError and run() returns.
+"""
+
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from waapi.client.executor import SequentialThreadExecutor
+    from waapi.wamp.async_compatibility import asyncio
+    from waapi.wamp.async_decoupled_client import WampClientAutobahn
+    from waapi.wamp.ak_autobahn import AutobahnClientDecoupler, _WampClientThread
+    from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException, WaapiRequestFailed
+    from autobahn.asyncio.websocket import WampWebSocketClientFactory
+    from autobahn.websocket.util import parse_url as parse_ws_url
+    from autobahn.wamp import ApplicationError
+    import txaio
+except Exception:
+    WampClientAutobahn = None
+
+DEFAULT_WAAPI_URL = "ws://127.0.0.1:8080/waapi"
+DEFAULT_WINDOW = 32
+DEFAULT_TIMEOUT = 600.0     # seconds without any reply before a batch gives up on its pending calls
+
+
+if WampClientAutobahn is not None:
+    class _ClientThread(_WampClientThread):
+        """The vendored client thread, without setting the process-wide txaio.config.loop.
+
+        With the global loop left unset, txaio resolves each thread's own running loop, and the transport is
+        given its loop explicitly, so several connections (a server pool, health checks) can live in one process.
+        A vendored WaapiClient still sets the global loop: a stale one (its client is gone) is cleared, a live
+        one makes this connection fail so the caller can fall back to the blocking client.
+        """
+
+        def run(self):
+            try:
+                asyncio.set_event_loop(self._loop)
+                txaio.use_asyncio()
+                foreign = txaio.config.loop
+                if foreign is not None and foreign is not self._loop:
+                    if foreign.is_running():
+                        raise CannotConnectToWaapiException("a WaapiClient in this process owns the txaio loop")
+                    txaio.config.loop = None
+                factory = WampWebSocketClientFactory(
+                    lambda: self._akcomponent_factory(self._decoupler, self._callback_executor, self._allow_exception),
+                    url=self._url, loop=self._loop)
+                factory.setProtocolOptions(failByDrop=False, openHandshakeTimeout=5., closeHandshakeTimeout=1.)
+                secure, host, port = parse_ws_url(self._url)[:3]
+                transport, protocol = self._loop.run_until_complete(
+                    self._loop.create_connection(factory, host, port, ssl=secure))
+                self._loop.run_forever()
+                if not protocol.is_closed.done():
+                    transport.close()
+                    self._loop.run_until_complete(protocol.is_closed)
+                self._loop.close()
+            except Exception as e:
+                sys.stderr.write(f"{e!r}\n")
+                # wake the caller; the thread ends right after, which is how a failed connection is detected
+                self._decoupler.set_joined()
+            self._decoupler.unblock_caller()
+
+    class _PipelinedWampClient(WampClientAutobahn):
+        """Session that starts every CALL as its own task instead of awaiting it before the next request."""
+
+        async def _pipelined_call(self, request):
+            try:
+                await self.call_handler(request)
+            except ApplicationError as e:
+                if not request.future.done():
+                    request.future.set_exception(WaapiRequestFailed(e))
+            except Exception as e:
+                if not request.future.done():
+                    request.future.set_exception(e)
+
+        async def onJoin(self, details):
+            self._decoupler.set_joined()
+            self._callback_executor.start()
+            handlers = {
+                WampRequestType.STOP: self.stop_handler,
+                WampRequestType.SUBSCRIBE: self.subscribe_handler,
+                WampRequestType.UNSUBSCRIBE: self.unsubscribe_handler,
+            }
+            try:
+                while True:
+                    request = await self._decoupler.get_request()
+                    if request.request_type == WampRequestType.CALL:
+                        asyncio.ensure_future(self._pipelined_call(request))
+                        continue
+                    handler = handlers.get(request.request_type)
+                    if handler:
+                        await handler(request)
+                    if request.request_type == WampRequestType.STOP:
+                        break
+            except RuntimeError:
+                # The loop has been shut down by a disconnect
+                pass
+
+
+class PipelinedWaapiClient:
+    """WAAPI connection whose call_async() returns a concurrent.futures.Future immediately."""
+
+    def __init__(self, url=None):
+        if WampClientAutobahn is None:
+            raise RuntimeError("waapi-client is not installed (pip install waapi-client)")
+        self.url = url or DEFAULT_WAAPI_URL
+        if sys.platform == "win32":
+            self._loop = asyncio.ProactorEventLoop()
+        else:
+            self._loop = asyncio.new_event_loop()
+        self._decoupler = AutobahnClientDecoupler(queue_size=0)
+        self._thread = _ClientThread(self.url, self._loop, _PipelinedWampClient, SequentialThreadExecutor(), True, self._decoupler)
+        self._thread.start()
+        self._decoupler.wait_for_joined()
+        if not self._thread.is_alive():
+            raise CannotConnectToWaapiException("Could not connect to " + self.url)
+
+    def is_connected(self):
+        return self._decoupler.has_joined() and self._thread.is_alive()
+
+    def _submit(self, request_type, uri=None, kwargs=None):
+        async def _request():
+            future = self._loop.create_future()
+            await self._decoupler.put_request(WampRequest(request_type, uri, kwargs, None, None, future))
+            return await future
+        return asyncio.run_coroutine_threadsafe(_request(), self._loop)
+
+    def call_async(self, uri, args=None):
+        """Send a call without waiting. The future raises WaapiRequestFailed on a WAAPI error."""
+        if not self._thread.is_alive():
+            raise CannotConnectToWaapiException("Connection to " + self.url + " is closed")
+        return self._submit(WampRequestType.CALL, uri, dict(args or {}))
+
+    def call(self, uri, args=None, timeout=DEFAULT_TIMEOUT):
+        return self.call_async(uri, args).result(timeout)
+
+    def disconnect(self):
+        if not self._thread.is_alive():
+            return False
+        try:
+            self._submit(WampRequestType.STOP).result(timeout=5)
+        except Exception:
+            pass
+        self._thread.join(5)
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+
+
+class _BlockingCallAdapter:
+    """Give a blocking client (call(uri, args)) a call_async() backed by a thread pool."""
+
+    def __init__(self, client, workers):
+        self.client = client
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def call_async(self, uri, args=None):
+        return self.pool.submit(self.client.call, uri, args or {})
+
+    def close(self):
+        # a call abandoned by a timed-out batch may never return
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ItemResult:
+    __slots__ = ("tag", "uri", "result", "error", "latency")
+
+    def __init__(self, tag, uri, result=None, error=None, latency=0.0):
+        self.tag = tag
+        self.uri = uri
+        self.result = result
+        self.error = error
+        self.latency = latency
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f"ItemResult({self.tag!r}, ok={self.ok})"
+
+
+class BatchMetrics:
+    def __init__(self):
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.elapsed = 0.0
+        self.peak_in_flight = 0
+        self.total_latency = 0.0
+
+    @property
+    def throughput(self):
+        return self.submitted / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mean_latency(self):
+        done = self.succeeded + self.failed
+        return self.total_latency / done if done else 0.0
+
+    def __str__(self):
+        return (f"{self.submitted} call(s) in {self.elapsed:.2f}s ({self.throughput:.0f}/s), "
+                f"{self.failed} failed, peak in flight {self.peak_in_flight}, mean latency {self.mean_latency * 1000:.1f} ms")
+
+
+class WaapiBatch:
+    """Run many WAAPI calls with at most `window` of them in flight."""
+
+    def __init__(self, client, window=DEFAULT_WINDOW, logger=None, timeout=DEFAULT_TIMEOUT):
+        self.window = max(1, int(window))
+        self.logger = logger
+        self.timeout = timeout
+        self._adapter = None
+        if hasattr(client, "call_async"):
+            self.client = client
+        else:
+            self._adapter = _BlockingCallAdapter(client, self.window)
+            self.client = self._adapter
+        self.metrics = BatchMetrics()
+
+    def run(self, requests):
+        """requests: iterable of (uri, args, tag). Returns a list of ItemResult in request order."""
+        requests = list(requests)
+        results = [None] * len(requests)
+        slots = threading.BoundedSemaphore(self.window)
+        finished = threading.Condition()
+        state = {"in_flight": 0, "pending": len(requests)}
+        metrics = self.metrics
+        t_start = time.perf_counter()
+        state["last_reply"] = t_start
+        futures = {}
+
+        def settle(index, item):
+            """Record the outcome of request index once; False if it was already settled (timed out)."""
+            with finished:
+                if results[index] is not None:
+                    return False
+                results[index] = item
+                state["in_flight"] -= 1
+                state["pending"] -= 1
+                state["last_reply"] = time.perf_counter()
+                if item.ok:
+                    metrics.succeeded += 1
+                else:
+                    metrics.failed += 1
+                metrics.total_latency += item.latency
+                finished.notify_all()
+            return True
+
+        def on_done(index, uri, tag, t0, future):
+            latency = time.perf_counter() - t0
+            try:
+                item = ItemResult(tag, uri, future.result(), None, latency)
+            except Exception as e:
+                item = ItemResult(tag, uri, None, e, latency)
+            if settle(index, item):
+                slots.release()
+
+        def stalled():
+            return self.timeout is not None and time.perf_counter() - state["last_reply"] >= self.timeout
+
+        def give_up():
+            """Fail every request that has no result yet."""
+            error = TimeoutError(f"no WAAPI reply for {self.timeout:g}s")
+            now = time.perf_counter()
+            abandoned = []
+            with finished:
+                for i in range(len(requests)):
+                    if results[i] is None:
+                        results[i] = ItemResult(requests[i][2], requests[i][0], None, error, now - t_start)
+                        state["pending"] -= 1
+                        metrics.failed += 1
+                        if i in futures:
+                            state["in_flight"] -= 1
+                            abandoned.append(futures[i])
+            # settled first: a cancelled future's callback finds its result taken and does nothing
+            for future in abandoned:
+                future.cancel()
+            if self.logger:
+                self.logger.write(f"WAAPI batch: {error}; {sum(1 for r in results if r.error is error)} call(s) failed")
+
+        for index, (uri, args, tag) in enumerate(requests):
+            acquired = False
+            while not acquired and not stalled():
+                acquired = slots.acquire(timeout=1.0)
+            if not acquired:
+                give_up()
+                break
+            with finished:
+                state["in_flight"] += 1
+                metrics.peak_in_flight = max(metrics.peak_in_flight, state["in_flight"])
+            metrics.submitted += 1
+            t0 = time.perf_counter()
+            try:
+                future = self.client.call_async(uri, args)
+            except Exception as e:
+                if settle(index, ItemResult(tag, uri, None, e, 0.0)):
+                    slots.release()
+                continue
+            futures[index] = future
+            future.add_done_callback(lambda f, i=index, u=uri, t=tag, s=t0: on_done(i, u, t, s, f))
+
+        with finished:
+            while state["pending"] > 0 and not stalled():
+                finished.wait(1.0 if self.timeout is None else min(1.0, self.timeout))
+        if state["pending"] > 0:
+            give_up()
+        metrics.elapsed += time.perf_counter() - t_start
+        if self.logger:
+            self.logger.write(f"WAAPI batch: {metrics}")
+        return results
+
+    def close(self):
+        if self._adapter:
+            self._adapter.close()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Pool of warm headless WAAPI servers for concurrent builds.
+
+Each instance is a WaapiServer on its own port working on its own copy of a project (work units are copied,
+Originals are hard-linked, GeneratedSoundBanks/.cache are left out), so jobs never touch each other's files.
+Edits made through an instance stay in its copy and are lost when it is recycled; nothing is synced back
+to the source project.
+
+    pool = ServerPool(console, size=None, logger=logger)     # size=None: scaled to free RAM
+    with pool.lease(project) as server:                       # server.url, server.project, server.connect()
+        ...
+    pool.close()
+
+Leases prefer an idle instance already holding the requested project. If none is idle, a new instance is
+started while the pool is below its size; otherwise an idle instance of another project is recycled, or
+the caller waits. When a lease is returned the instance is health-checked (process alive, answers
+getInfo) and recycled after max_jobs leases or when its RSS exceeds max_rss_mb.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+
+from wwise_waapi_server import WaapiServer, console_command
+
+RAM_PER_INSTANCE_MB = 2048
+MAX_JOBS = 50
+MAX_RSS_MB = 4096
+COPY_IGNORE = shutil.ignore_patterns("GeneratedSoundBanks", ".cache", ".backup", "*.validationcache", "*.prof")
+LINK_DIRS = {"Originals"}
+
+
+def available_memory():
+    """Free physical memory in bytes, or None if it cannot be determined."""
+    if psutil is not None:
+        return psutil.virtual_memory().available
+    if sys.platform.startswith("win"):
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+        stat = MEMORYSTATUSEX()
+        stat.dwLength = ctypes.sizeof(stat)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+            return stat.ullAvailPhys
+        return None
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_pool_size(ram_per_instance_mb=RAM_PER_INSTANCE_MB):
+    free = available_memory()
+    cpus = os.cpu_count() or 1
+    if free is None:
+        return max(1, min(2, cpus))
+    return max(1, min(cpus, int(free // (ram_per_instance_mb * 1024 * 1024))))
+
+
+def process_rss(pid):
+    """Resident set size of a process in bytes, or None."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except Exception:
+            return None
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def copy_project(project, dest):
+    """Copy the project folder of a .wproj into dest, hard-linking Originals. Returns the copied .wproj path."""
+    src = Path(project).resolve().parent
+    dest = Path(dest)
+    if dest.exists():
+        shutil.rmtree(dest)
+
+    def link_or_copy(s, d):
+        try:
+            os.link(s, d)
+        except OSError:
+            shutil.copy2(s, d)
+
+    shutil.copytree(src, dest, ignore=lambda d, names: COPY_IGNORE(d, names) | (LINK_DIRS & set(names)))
+    for name in LINK_DIRS:
+        if (src / name).is_dir():
+            shutil.copytree(src / name, dest / name, copy_function=link_or_copy)
+    return dest / Path(project).name
+
+
+class PooledServer:
+    """A pool instance: a WaapiServer bound to an isolated project copy."""
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+        self.source = None
+        self.project = None
+        self.server = None
+        self.jobs = 0
+        self.started = 0.0
+
+    @property
+    def url(self):
+        return self.server.url
+
+    def start(self):
+        return self
+
+    def connect(self):
+        return self.server.connect()
+
+    def running(self):
+        return self.server is not None and self.server.running()
+
+    def open(self, source):
+        self.close()
+        workdir = Path(self.pool.workdir, f"instance{self.index}")
+        self.project = str(copy_project(source, workdir))
+        self.source = source
+        self.server = WaapiServer(command=self.pool.command(self.project), logger=self.pool.logger,
+                                  startup_timeout=self.pool.startup_timeout)
+        self.server.start()
+        self.jobs = 0
+        self.started = time.time()
+
+    def close(self):
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+
+    def rss(self):
+        proc = self.server.proc if self.server else None
+        return process_rss(proc.pid) if proc else None
+
+    def health(self):
+        """None if healthy, otherwise the reason to recycle."""
+        if not self.running():
+            return "process exited"
+        if self.jobs >= self.pool.max_jobs:
+            return f"{self.jobs} job(s) served"
+        rss = self.rss()
+        if rss is not None and rss > self.pool.max_rss_mb * 1024 * 1024:
+            return f"RSS {rss / 1048576.0:.0f} MB"
+        if not self.server.probe():
+            return "not answering"
+        return None
+
+
+class _Lease:
+    def __init__(self, pool, project, timeout):
+        self.pool = pool
+        self.project = project
+        self.timeout = timeout
+        self.instance = None
+
+    def __enter__(self):
+        self.instance = self.pool.acquire(self.project, self.timeout)
+        return self.instance
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.pool.release(self.instance, failed=exc_type is not None)
+
+
+class ServerPool:
+    """Keeps up to `size` warm WAAPI servers and leases them to jobs."""
+
+    def __init__(self, console=None, size=None, max_jobs=MAX_JOBS, max_rss_mb=MAX_RSS_MB, workdir=None,
+                 command=None, startup_timeout=120.0, logger=None):
+        # command(project) -> argv factory (port -> argv); default runs WwiseConsole waapi-server
+        self.command = command or (lambda project: console_command(console, project))
+        self.size = size or default_pool_size()
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.startup_timeout = startup_timeout
+        self.logger = logger
+        self._own_workdir = workdir is None
+        self.workdir = workdir or tempfile.mkdtemp(prefix="wwise_pool_")
+        self.instances = []
+        self.idle = []
+        self.recycled = 0
+        self._next_index = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def lease(self, project, timeout=None):
+        return _Lease(self, os.path.abspath(project), timeout)
+
+    def acquire(self, project, timeout=None):
+        project = os.path.abspath(project)
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("server pool is closed")
+                match = next((i for i in self.idle if i.source == project), None)
+                if match is not None:
+                    self.idle.remove(match)
+                    return match
+                if len(self.instances) < self.size:
+                    inst = PooledServer(self, self._next_index)
+                    self._next_index += 1
+                    self.instances.append(inst)
+                    break
+                if self.idle:
+                    # recycle the least recently started instance of another project
+                    inst = min(self.idle, key=lambda i: i.started)
+                    self.idle.remove(inst)
+                    break
+                wait = None if deadline is None else deadline - time.time()
+                if wait is not None and wait <= 0:
+                    raise TimeoutError("no WAAPI server available")
+                self._cond.wait(wait)
+        # start outside the lock so other leases are not blocked by a slow startup
+        try:
+            t0 = time.time()
+            inst.open(project)
+            self._log(f"Pool: instance {inst.index} serving {Path(project).name} on {inst.url} ({time.time() - t0:.1f}s)")
+        except Exception:
+            inst.close()
+            with self._cond:
+                self.instances.remove(inst)
+                self._cond.notify()
+            raise
+        return inst
+
+    def release(self, inst, failed=False):
+        inst.jobs += 1
+        reason = inst.health()
+        if reason is None and failed and not inst.server.probe():
+            reason = "failed job left it unresponsive"
+        if reason:
+            self._log(f"Pool: recycling instance {inst.index} ({reason})")
+            self.recycled += 1
+            source = inst.source
+            try:
+                inst.open(source)
+            except Exception as e:
+                self._log(f"Pool: restart of instance {inst.index} failed: {e}")
+                inst.close()
+                inst.source = None
+        with self._cond:
+            if self._closed:
+                inst.close()
+                return
+            self.idle.append(inst)
+            self._cond.notify()
+
+    def status(self):
+        with self._cond:
+            return [{"index": i.index, "project": i.source, "url": i.url if i.server else None, "jobs": i.jobs,
+                     "idle": i in self.idle, "rss_mb": (i.rss() or 0) / 1048576.0} for i in self.instances]
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            instances = list(self.instances)
+            self._cond.notify_all()
+        for inst in instances:
+            inst.close()
+        if self._own_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start a pool of headless WAAPI servers and print their status")
+    parser.add_argument("--console", required=True)
+    parser.add_argument("--project", required=True)
+    parser.add_argument("--size", type=int, default=None, help=f"Default: free RAM / {RAM_PER_INSTANCE_MB} MB")
+    args = parser.parse_args()
+
+    class _Print:
+        def write(self, msg):
+            print(msg)
+
+    with ServerPool(args.console, args.size, logger=_Print()) as pool:
+        leases = [pool.acquire(args.project) for _ in range(pool.size)]
+        for inst in leases:
+            pool.release(inst)
+        for s in pool.status():
+            print(s)
+
+
+if __name__ == "__main__":
+    main()
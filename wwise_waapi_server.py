@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Managed headless WAAPI server: WwiseConsole in waapi-server mode on a free port.
+
+    with WaapiServer(console, project, logger=logger) as server:
+        client = PipelinedWaapiClient(server.url)
+        ...
+
+The server is started once and reused by every WAAPI stage of a run. Readiness is a TCP probe followed by
+an ak.wwise.core.getInfo call. Shutdown is clean on normal exit, on exceptions, on SIGINT/SIGTERM and at
+interpreter exit (atexit), so no orphaned WwiseConsole is left behind by a crashed or cancelled run.
+"""
+
+import sys
+import time
+import atexit
+import signal
+import socket
+import argparse
+import threading
+import subprocess
+
+from wwise_waapi_batch import PipelinedWaapiClient
+
+STARTUP_TIMEOUT = 120.0
+STOP_TIMEOUT = 15.0
+
+_live = set()
+_live_lock = threading.Lock()
+_hooks_installed = False
+
+
+def free_port(host="127.0.0.1"):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+
+def console_command(console, project, allow_migration=True):
+    """argv factory for WwiseConsole: port -> command line."""
+    def build(port):
+        cmd = [console, "waapi-server", project, "--wamp-port", str(port)]
+        if allow_migration:
+            cmd.append("--allow-migration")
+        return cmd
+    return build
+
+
+def stop_all():
+    with _live_lock:
+        servers = list(_live)
+    for server in servers:
+        server.stop()
+
+
+def _install_hooks():
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+    atexit.register(stop_all)
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(sig)
+
+        def handler(signum, frame, previous=previous):
+            stop_all()
+            if callable(previous):
+                previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                raise SystemExit(128 + signum)
+        try:
+            signal.signal(sig, handler)
+        except (ValueError, OSError):
+            pass
+
+
+class WaapiServerError(Exception):
+    pass
+
+
+class WaapiServer:
+    """One headless WAAPI server process. command(port) builds its argv (see console_command)."""
+
+    def __init__(self, console=None, project=None, port=None, host="127.0.0.1", logger=None,
+                 startup_timeout=STARTUP_TIMEOUT, command=None):
+        if command is None:
+            if not console or not project:
+                raise ValueError("console and project are required without a custom command")
+            command = console_command(console, project)
+        self.command = command
+        self.host = host
+        self.port = port
+        self.logger = logger
+        self.startup_timeout = startup_timeout
+        self.proc = None
+        self._output = None
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}/waapi"
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def running(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def _pump_output(self):
+        for line in self.proc.stdout:
+            line = line.strip()
+            if line:
+                self._log(f"[waapi-server] {line}")
+
+    def start(self):
+        if self.running():
+            return self
+        _install_hooks()
+        self.port = self.port or free_port(self.host)
+        cmd = self.command(self.port)
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if sys.platform.startswith("win") else 0
+        t0 = time.time()
+        self._log(f"Starting WAAPI server on port {self.port}")
+        self.proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                     text=True, creationflags=creationflags)
+        with _live_lock:
+            _live.add(self)
+        self._output = threading.Thread(target=self._pump_output, daemon=True)
+        self._output.start()
+        try:
+            self._wait_ready()
+        except Exception:
+            self.stop()
+            raise
+        self._log(f"WAAPI server ready at {self.url} ({time.time() - t0:.1f}s)")
+        return self
+
+    def _wait_ready(self):
+        deadline = time.time() + self.startup_timeout
+        delay = 0.05
+        while time.time() < deadline:
+            if not self.running():
+                raise WaapiServerError(f"WAAPI server exited during startup (code {self.proc.returncode})")
+            if self.probe():
+                return
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        raise WaapiServerError(f"WAAPI server not ready after {self.startup_timeout:.0f}s")
+
+    def probe(self, timeout=1.0):
+        """True if the port accepts connections and answers ak.wwise.core.getInfo."""
+        try:
+            socket.create_connection((self.host, self.port), timeout=timeout).close()
+        except OSError:
+            return False
+        try:
+            with PipelinedWaapiClient(self.url) as client:
+                client.call_async("ak.wwise.core.getInfo").result(timeout=max(timeout, 5.0))
+            return True
+        except Exception:
+            return False
+
+    def connect(self):
+        """New pipelined client on this server (starting it if needed)."""
+        self.start()
+        return PipelinedWaapiClient(self.url)
+
+    def stop(self):
+        with _live_lock:
+            _live.discard(self)
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            self._log("Stopping WAAPI server")
+            proc.terminate()
+            try:
+                proc.wait(STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        if self._output:
+            self._output.join(2)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run WwiseConsole as a headless WAAPI server")
+    parser.add_argument("--console", required=True)
+    parser.add_argument("--project", required=True)
+    parser.add_argument("--port", type=int, default=None, help="Default: a free port")
+    args = parser.parse_args()
+
+    class _Print:
+        def write(self, msg):
+            print(msg)
+
+    with WaapiServer(args.console, args.project, args.port, logger=_Print()) as server:
+        print(f"WAAPI URL: {server.url}  (Ctrl+C to stop)")
+        try:
+            while server.running():
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Local WAAPI stand-in: a tiny WAMP-over-WebSocket server answering the handful of ak.wwise.* calls the
+batch tools use, with a configurable per-call latency.
+
+It speaks the real wire protocol (wamp.2.json), so the vendored waapi client, the pipelined client in
+wwise_waapi_batch.py and the server lifecycle code can be exercised without Wwise Authoring.
+
+  python wwise_waapi_standin.py --port 8080 --latency 0.005
+
+From Python:  with StandInProcess(latency=0.005) as server: ... server.url ...
+As a managed server:  WaapiServer(command=standin_command(latency=0.005))
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import threading
+import subprocess
+
+from wwise_waapi_server import free_port
+
+try:
+    import txaio
+    from autobahn.asyncio.websocket import WebSocketServerProtocol, WebSocketServerFactory
+except Exception:
+    WebSocketServerProtocol = WebSocketServerFactory = None
+
+HELLO, WELCOME, ABORT, GOODBYE, ERROR = 1, 2, 3, 6, 8
+CALL, RESULT = 48, 50
+SUBSCRIBE, SUBSCRIBED, UNSUBSCRIBE, UNSUBSCRIBED = 32, 33, 34, 35
+
+
+class StandInError(Exception):
+    def __init__(self, uri, message):
+        super().__init__(message)
+        self.uri = uri
+
+
+class StandInState:
+    """Objects 'created' through the stand-in, keyed by path, plus call counters."""
+
+    def __init__(self, fail_names=(), project=None):
+        self.project = project
+        self.objects = {}
+        self.calls = {}
+        self.fail_names = set(fail_names)
+        self.lock = threading.Lock()
+
+    def _make(self, parent, obj):
+        name = obj.get("name", "")
+        if name in self.fail_names:
+            raise StandInError("ak.wwise.invalid_arguments", f"Cannot create '{name}'")
+        path = f"{parent}\\{name}" if parent else name
+        with self.lock:
+            existing = self.objects.get(path)
+            oid = existing["id"] if existing else "{%s}" % str(uuid.uuid4()).upper()
+            # like onNameConflict "merge": properties that are not given keep their value
+            props = dict(existing["props"]) if existing else {}
+            props.update({k: v for k, v in obj.items() if k.startswith("@")})
+            self.objects[path] = {"id": oid, "name": name, "type": obj.get("type"), "path": path, "props": props}
+        created = {"id": oid, "name": name}
+        children = [self._make(path, c) for c in obj.get("children", [])]
+        if children:
+            created["children"] = children
+        return created
+
+    def _set(self, entry):
+        path = entry.get("object", "")
+        with self.lock:
+            target = self.objects.setdefault(path, {"id": "{%s}" % str(uuid.uuid4()).upper(), "name": path.rsplit("\\", 1)[-1],
+                                                    "type": None, "path": path, "props": {}})
+            target["props"].update({k: v for k, v in entry.items() if k.startswith("@")})
+        result = {"id": target["id"], "name": target["name"]}
+        children = [self._make(path, c) for c in entry.get("children", [])]
+        if children:
+            result["children"] = children
+        return result
+
+    def handle(self, uri, kwargs):
+        with self.lock:
+            self.calls[uri] = self.calls.get(uri, 0) + 1
+        if uri == "ak.wwise.core.getInfo":
+            return {"displayName": "Wwise (stand-in)", "processId": os.getpid(),
+                    "version": {"displayName": "v2024.1.0 stand-in", "year": 2024, "major": 1}}
+        if uri == "ak.wwise.core.object.create":
+            return self._make(kwargs.get("parent", ""), kwargs)
+        if uri == "ak.wwise.core.object.set":
+            return {"objects": [self._set(o) for o in kwargs.get("objects", [])]}
+        if uri == "ak.wwise.core.audio.import":
+            for entry in kwargs.get("imports", []):
+                parent, _, name = entry.get("objectPath", "").rpartition("\\")
+                self._make(parent, {"name": name, "type": "Sound", **{k: v for k, v in entry.items() if k.startswith("@")}})
+            return {"objects": []}
+        if uri == "ak.wwise.core.soundbank.generate":
+            if self.project and kwargs.get("writeToDisk"):
+                # placeholder banks where Wwise writes them: GeneratedSoundBanks/<platform>/<bank>.bnk
+                for plat in kwargs.get("platforms") or []:
+                    folder = os.path.join(os.path.dirname(os.path.abspath(self.project)), "GeneratedSoundBanks", plat)
+                    os.makedirs(folder, exist_ok=True)
+                    for bank in kwargs.get("soundbanks") or []:
+                        with open(os.path.join(folder, bank["name"] + ".bnk"), "wb") as f:
+                            f.write(b"BKHD" + uuid.uuid4().bytes)
+            return {"logs": []}
+        if uri in ("ak.wwise.core.object.setProperty", "ak.wwise.core.project.save"):
+            return {}
+        if uri == "standin.state":
+            with self.lock:
+                return {"calls": dict(self.calls), "objects": list(self.objects.values())}
+        if uri == "ak.wwise.core.object.get":
+            paths = (kwargs.get("from") or {}).get("path")
+            returns = [r for r in (kwargs.get("options") or {}).get("return", []) if r.startswith("@")]
+            with self.lock:
+                found = [self.objects[p] for p in paths if p in self.objects] if paths else list(self.objects.values())
+                return {"return": [dict({r: o["props"][r] for r in returns if r in o["props"]},
+                                        id=o["id"], name=o["name"], path=o["path"]) for o in found]}
+        raise StandInError("ak.wwise.invalid_procedure_uri", f"Unknown procedure {uri}")
+
+
+if WebSocketServerProtocol is not None:
+    class _StandInProtocol(WebSocketServerProtocol):
+        def onConnect(self, request):
+            if "wamp.2.json" not in request.protocols:
+                raise Exception("stand-in only speaks wamp.2.json")
+            return "wamp.2.json"
+
+        def _send(self, msg):
+            self.sendMessage(json.dumps(msg).encode("utf-8"), isBinary=False)
+
+        async def _call(self, req_id, uri, kwargs):
+            latency = self.factory.latency
+            if latency:
+                await asyncio.sleep(latency)
+            try:
+                result = self.factory.state.handle(uri, kwargs)
+                self._send([RESULT, req_id, {}, [], result])
+            except StandInError as e:
+                self._send([ERROR, CALL, req_id, {}, e.uri, [], {"message": str(e)}])
+
+        def onMessage(self, payload, isBinary):
+            msg = json.loads(payload.decode("utf-8"))
+            code = msg[0]
+            if code == HELLO:
+                self._send([WELCOME, random.randint(1, 2 ** 53), {"roles": {"dealer": {}, "broker": {}}}])
+            elif code == CALL:
+                kwargs = dict(msg[5]) if len(msg) > 5 else {}
+                if msg[2]:
+                    # waapi-client sends the WAAPI "options" in the WAMP options slot
+                    kwargs["options"] = msg[2]
+                asyncio.ensure_future(self._call(msg[1], msg[3], kwargs))
+            elif code == SUBSCRIBE:
+                self._send([SUBSCRIBED, msg[1], random.randint(1, 2 ** 53)])
+            elif code == UNSUBSCRIBE:
+                self._send([UNSUBSCRIBED, msg[1]])
+            elif code == GOODBYE:
+                self._send([GOODBYE, {}, "wamp.error.goodbye_and_out"])
+                self.sendClose()
+
+
+def serve(host="127.0.0.1", port=8080, latency=0.0, fail_names=(), on_ready=None, project=None):
+    """Run the stand-in on the current thread until interrupted."""
+    if WebSocketServerFactory is None:
+        raise RuntimeError("autobahn is required for the WAAPI stand-in (pip install waapi-client)")
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    txaio.use_asyncio()
+    txaio.config.loop = loop
+    factory = WebSocketServerFactory(protocols=["wamp.2.json"], loop=loop)
+    factory.protocol = _StandInProtocol
+    factory.latency = latency
+    factory.state = StandInState(fail_names, project)
+    server = loop.run_until_complete(loop.create_server(factory, host, port))
+    if on_ready:
+        on_ready(server.sockets[0].getsockname()[1])
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.close()
+
+
+def standin_command(host="127.0.0.1", latency=0.0, fail_names=()):
+    """argv factory (port -> command line) for running the stand-in as a WaapiServer."""
+    def build(port):
+        cmd = [sys.executable, os.path.abspath(__file__), "--host", host, "--port", str(port), "--latency", str(latency)]
+        for name in fail_names:
+            cmd += ["--fail-name", name]
+        return cmd
+    return build
+
+
+class StandInProcess:
+    """Run the stand-in as a child process, like a real WAAPI server. Its state is available through the
+    'standin.state' call."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, fail_names=()):
+        self.host = host
+        self.port = port or free_port(host)
+        self.latency = latency
+        self.fail_names = list(fail_names)
+        self.proc = None
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}/waapi"
+
+    def command(self):
+        return standin_command(self.host, self.latency, self.fail_names)(self.port)
+
+    def start(self, timeout=15.0):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        self.proc = subprocess.Popen(self.command(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            line = self.proc.stdout.readline()
+            if not line and self.proc.poll() is not None:
+                break
+            if line.startswith("WAAPI stand-in listening"):
+                return self
+        self.stop()
+        raise RuntimeError("WAAPI stand-in did not start")
+
+    def stop(self):
+        if self.proc and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        if self.proc and self.proc.stdout:
+            self.proc.stdout.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local WAAPI stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every call")
+    parser.add_argument("--fail-name", action="append", default=[], help="Object name whose creation fails")
+    parser.add_argument("--project", default=None, help="Write placeholder banks next to this project on soundbank.generate")
+    args, _ = parser.parse_known_args()
+
+    def ready(port):
+        print(f"WAAPI stand-in listening on ws://{args.host}:{port}/waapi")
+        sys.stdout.flush()
+
+    serve(args.host, args.port, args.latency, args.fail_name, ready, args.project)
+
+
+if __name__ == "__main__":
+    main()
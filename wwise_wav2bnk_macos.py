@@ -11,6 +11,10 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog
 
+from wwise_journal import RunJournal, journal_key, inputs_digest
+from wwise_progress import ProgressTracker, ProgressPrinter
+from wwise_diagnostics import ConsoleDiagnostics
+
 CONFIG_PATH = Path.home() / "Library/Application Support/WwiseBatchTool/config.json"
 
 
@@ -91,7 +95,7 @@ class Logger:
 
 # --------------------- WORKER ---------------------
 class Worker:
-    def __init__(self, console, project, wav_dir, output_dir, platforms, logger, dry_run=False, force_wine=False):
+    def __init__(self, console, project, wav_dir, output_dir, platforms, logger, dry_run=False, force_wine=False, resume=False, progress=None, raw_console=False):
         self.console = console
         self.project = project
         self.wav_dir = wav_dir
@@ -100,6 +104,11 @@ class Worker:
         self.logger = logger
         self.dry_run = dry_run
         self.force_wine = force_wine
+        self.resume = resume
+        self.journal = None
+        self.progress = progress
+        self.raw_console = raw_console
+        self.diagnostics = None
 
     def generate_import_json(self):
         tmp_json = Path("/tmp/import_wwise.json")
@@ -124,7 +133,7 @@ class Worker:
         self.logger.write(f"📁 Import JSON created: {tmp_json}")
         return str(tmp_json)
 
-    def run_cli(self, args, desc):
+    def run_cli(self, args, desc, tracker=None):
         self.logger.write(f"▶️ {desc}")
         try:
             # Resolve which console to execute: prefer native MacOS binary over a shell wrapper that calls Wine
@@ -143,7 +152,7 @@ class Worker:
             if self.dry_run:
                 self.logger.write(f"(dry-run) Skipping execution of: {' '.join(full_args)}")
                 self.logger.write(f"✅ Done: {desc} (dry-run)\n")
-                return
+                return None
 
             process = subprocess.Popen(
                 full_args,
@@ -153,14 +162,54 @@ class Worker:
                 bufsize=1,
                 universal_newlines=True
             )
+            if self.diagnostics is None:
+                # warnings/errors go to the log, everything to a compressed file next to it
+                raw_path = str(self.logger.log_file.with_suffix("")) + "_console.log.gz"
+                self.diagnostics = ConsoleDiagnostics(raw_path, self.logger, verbose=self.raw_console)
+            self.diagnostics.begin(full_args)
             for line in iter(process.stdout.readline, ''):
                 if line:
-                    self.logger.write(line.strip())
+                    self.diagnostics.feed(line)
+                    if tracker:
+                        tracker.feed(line)
             process.stdout.close()
             process.wait()
+            self.diagnostics.end(process.returncode)
+            if tracker and process.returncode == 0:
+                tracker.finish()
             self.logger.write(f"✅ Done: {desc} (Exit code: {process.returncode})\n")
+            return process.returncode
         except Exception as e:
             self.logger.write(f"❌ Error running {desc}: {e}")
+            return None
+
+    def _open_journal(self):
+        # inputs = planned imports + WAV size/mtime; a changed folder invalidates the checkpoints
+        stamps = []
+        for imp in self.imports:
+            st = os.stat(imp["audioFile"])
+            stamps.append([imp["audioFile"], imp["objectPath"], st.st_size, st.st_mtime_ns])
+        key = journal_key(os.path.abspath(self.project), os.path.abspath(self.wav_dir), self.output_dir or "")
+        return RunJournal(key, inputs_digest(sorted(stamps)), self.resume, logger=self.logger)
+
+    def run_unit(self, unit, args, desc, tracker=None):
+        """run_cli once per journal unit: skipped when already done, recorded when it exits with 0."""
+        if self.journal is not None and self.journal.done(unit):
+            if tracker:
+                tracker.finish()
+            return 0
+        rc = self.run_cli(args, desc, tracker)
+        if rc == 0 and self.journal is not None:
+            self.journal.mark(unit)
+        return rc
+
+    def _finish_diagnostics(self):
+        d = self.diagnostics
+        d.close()
+        report = d.write_report(str(self.logger.log_file.parent / "DiagnosticsReport.json"))
+        errors = d.severity.get("fatal", 0) + d.severity.get("error", 0)
+        self.logger.write(f"{'⚠️' if errors else '🧾'} WwiseConsole: {errors} error(s), {d.severity.get('warning', 0)} warning(s) "
+                          f"in {d.lines} line(s); report {report}, full output {d.raw_path}")
 
     def _resolve_console(self, path):
         """Return a path to an executable console. If the provided path is a shell wrapper that calls Wine
@@ -278,28 +327,51 @@ class Worker:
         except Exception:
             pass
 
-        # Import
-        self.run_cli(
-            [self.project, "tab-delimited-import", "-import-file", json_path],
-            "Running Wwise Console import..."
-        )
+        # Checkpoint journal (not for dry runs, nothing is executed)
+        if not self.dry_run:
+            self.journal = self._open_journal()
 
-        # Create Events
-        for imp in self.imports:
-            obj_path = imp["objectPath"]
-            event_name = f"Play_{Path(obj_path).name}"
-            self.run_cli(
-                [self.project, "create-new", "Event", "--name", event_name, "--parent", "\\Events\\Default Work Unit", "--action", "Play", "--target", obj_path],
-                f"Creating Event {event_name}..."
+        try:
+            # Import
+            self.run_unit(
+                "import",
+                [self.project, "tab-delimited-import", "-import-file", json_path],
+                "Running Wwise Console import...",
+                ProgressTracker("import", len(self.imports), None, self.progress)
             )
 
-        # Generate SoundBanks
-        for plat in self.platforms:
-            args = [self.project, "generate-soundbank", "-platform", plat]
-            if self.output_dir:
-                args += ["-outdir", self.output_dir]
-            self.run_cli(args, f"Generating SoundBank for {plat}...")
-
+            # Create Events
+            events = ProgressTracker("events", len(self.imports), None, self.progress)
+            for imp in self.imports:
+                obj_path = imp["objectPath"]
+                event_name = f"Play_{Path(obj_path).name}"
+                self.run_unit(
+                    f"event:{obj_path}",
+                    [self.project, "create-new", "Event", "--name", event_name, "--parent", "\\Events\\Default Work Unit", "--action", "Play", "--target", obj_path],
+                    f"Creating Event {event_name}..."
+                )
+                events.advance(item=event_name)
+
+            # Generate SoundBanks
+            for plat in self.platforms:
+                args = [self.project, "generate-soundbank", "-platform", plat]
+                if self.output_dir:
+                    args += ["-outdir", self.output_dir]
+                self.run_unit(f"generate:{plat}", args, f"Generating SoundBank for {plat}...",
+                              ProgressTracker("generate", len(self.imports), plat, self.progress))
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+            if self.diagnostics is not None:
+                self._finish_diagnostics()
+
+        if self.journal is not None:
+            pending = [u for u in ["import"] + [f"event:{i['objectPath']}" for i in self.imports] + [f"generate:{p}" for p in self.platforms]
+                       if not self.journal.done(u)]
+            if pending:
+                self.logger.write(f"⚠️ {len(pending)} step(s) did not complete; run again with --resume to retry only those.")
+                return
+            self.journal.finish()
         self.logger.write("🎉 All tasks completed successfully.")
 
 
@@ -416,6 +488,11 @@ class App(tk.Tk):
         self.log = tk.Text(main, height=15, bg="#111", fg="#0f0", insertbackground="#0f0")
         self.log.pack(fill=tk.BOTH, expand=True, pady=6)
 
+        self.progress_value = tk.DoubleVar()
+        self.progress_text = tk.StringVar()
+        ttk.Progressbar(main, variable=self.progress_value, maximum=100).pack(fill=tk.X)
+        ttk.Label(main, textvariable=self.progress_text).pack(anchor="w")
+
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ---------- HANDLERS ----------
@@ -462,7 +539,8 @@ class App(tk.Tk):
             self.wav_dir.get(),
             self.output_dir.get(),
             plats,
-            logger
+            logger,
+            progress=self._show_progress
         )
         # Log resolved console and configured .app for clarity
         logger.write(f"🔧 Resolved console path: {worker.console}")
@@ -470,6 +548,13 @@ class App(tk.Tk):
         self._save_config()
         threading.Thread(target=worker.run, daemon=True).start()
 
+    def _show_progress(self, event):
+        # called from the worker thread; widgets are only touched on the Tk thread
+        def update():
+            self.progress_value.set(event.fraction * 100)
+            self.progress_text.set(str(event))
+        self.after(0, update)
+
     def _on_close(self):
         self._save_config()
         self.destroy()
@@ -478,9 +563,9 @@ class App(tk.Tk):
 # --------------------- ENTRY POINT ---------------------
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        # CLI mode: python script.py <project> <wav_dir> <output_dir> <platforms>
+        # CLI mode: python script.py <project> <wav_dir> <output_dir> <platforms> [--dry-run] [--resume] [--raw-console]
         if len(sys.argv) < 5:
-            print("Usage: python wwise_wav2bnk_macos.py <project> <wav_dir> <output_dir> <platforms>")
+            print("Usage: python wwise_wav2bnk_macos.py <project> <wav_dir> <output_dir> <platforms> [--dry-run] [--resume] [--raw-console]")
             sys.exit(1)
         project = sys.argv[1]
         wav_dir = sys.argv[2]
@@ -522,8 +607,11 @@ if __name__ == "__main__":
         force_wine = False
         if '--force-wine' in sys.argv:
             force_wine = True
+        resume = '--resume' in sys.argv
+        raw_console = '--raw-console' in sys.argv
         logger = Logger(None, output_dir)
-        worker = Worker(console, project, wav_dir, output_dir, platforms, logger, dry_run=dry_run, force_wine=force_wine)
+        worker = Worker(console, project, wav_dir, output_dir, platforms, logger, dry_run=dry_run, force_wine=force_wine, resume=resume,
+                        progress=ProgressPrinter(logger.write), raw_console=raw_console)
         worker.run()
     else:
         App().mainloop()
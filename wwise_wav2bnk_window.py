@@ -10,11 +10,32 @@ New Upgrades:
 ✅ CI/CD mode: log .txt + exit code
 ✅ Auto-naming SoundBank = input folder name (optional)
 ✅ Save/Load profile JSON for team reuse
+✅ Loudness normalization as a Volume offset on import (--normalize-lufs)
+✅ Leading/trailing silence trim into a content-addressed cache (--trim-silence)
+✅ Exact-duplicate WAV detection: report or merge onto one Sound (--dedupe)
+✅ Near-duplicate detection via spectral fingerprints + LSH (--near-dupes)
+✅ Content-addressed SoundBank cache: identical inputs restore banks without WwiseConsole (--bank-cache)
+✅ Shared team bank cache over HTTP (--bank-cache-url, server: wwise_bankcache_server.py)
+✅ Pipelined WAAPI event creation with a window of in-flight calls (--waapi-window)
+✅ Events + Play actions (+ Sounds) built in a few ak.wwise.core.object.set payloads (--events-with-sounds)
+✅ Managed headless WwiseConsole waapi-server reused by import, events and generation (--waapi-server)
+✅ Multi-project batch manifest with concurrent jobs and a combined report (--manifest, wwise_manifest.py)
+✅ Per-platform packages: SHA-256 manifest + streamed tar.zst/tar.xz/zip, skipped when unchanged (--package)
+✅ Section-level diff of each rebuilt bank against the previous build (--bnk-diff, wwise_bnkdiff.py)
+✅ SQLite index of SoundbanksInfo: event -> bank -> media -> source WAV, updated incrementally (--bank-index)
+✅ Pre-flight of Wwise short IDs: duplicate names and FNV hash collisions before import; ID header (--id-preflight, --id-header)
+✅ Binary per-platform event index (sorted IDs -> bank, media bytes) for the game client, rebuilt on change (--event-index)
+✅ Checkpoint journal after every import chunk, event batch and platform; pick up an interrupted run (--resume)
+✅ Live progress + ETA per stage and platform parsed from WwiseConsole output (progress bar in the GUI, progress lines in CI)
+✅ WwiseConsole warnings/errors classified (severity, code, object, file) with per-code counts; info lines collapsed, full output gzipped (--raw-console)
+✅ Persistent SQLite WAV library (header metadata, hashes, last import + bank), incremental discovery and query selection (--library, --select)
+✅ Per-sound settings (streaming, loop, conversion ShareSet, volume...) from folder rules and name.wav.json sidecars, set in batched object.set calls (--sidecars)
 """
 
 import os
 import sys
 import json
+import shutil
 import threading
 import queue
 import subprocess
@@ -31,16 +52,39 @@ try:
 except Exception:
     WaapiClient = None
 
+from wwise_loudness import LoudnessAnalyzer
+from wwise_trim import SilenceTrimmer
+from wwise_dedupe import find_duplicates, alias_map, write_report
+from wwise_fingerprint import FingerprintIndex, merge_plan, write_report as write_near_dupe_report
+from wwise_bankcache import BankCache, RemoteBankCache, cache_key, console_version, snapshot, changed_files, work_unit_digests
+from wwise_cache import DigestCache, file_digest
+from wwise_waapi_batch import PipelinedWaapiClient, WaapiBatch, DEFAULT_WINDOW, DEFAULT_WAAPI_URL
+from wwise_events import EventBuilder, EventSpec, MAX_PAYLOAD_BYTES, chunk_objects, write_report as write_event_report
+from wwise_waapi_server import WaapiServer
+from wwise_package import Packager
+from wwise_bnkdiff import diff_dirs, summary as diff_summary
+from wwise_bankinfo import SoundbanksIndex, INDEX_NAME
+from wwise_ids import planned_names, preflight, write_header as write_id_header
+from wwise_eventindex import build_index as build_event_index
+from wwise_journal import RunJournal, journal_key, inputs_digest
+from wwise_progress import ProgressTracker, ProgressPrinter
+from wwise_diagnostics import ConsoleDiagnostics
+from wwise_library import AudioLibrary, QueryError, discover as discover_library
+from wwise_sidecar import SidecarResolver
+
 DEFAULT_PLATFORMS = ["Windows", "Android", "iOS", "macOS"]
 DEFAULT_LANGUAGE = "SFX"
 DEFAULT_OBJECT_ROOT = r"\\Actor-Mixer Hierarchy\\Auto"
 DEFAULT_EVENT_PATTERN = "Play_{name}"
+EVENT_BATCH = 500       # events per checkpointed EventBuilder batch
+WAAPI_GENERATE_TIMEOUT = 4 * 3600.0     # seconds to wait for soundbank.generate over WAAPI
 APP_TITLE = "Wwise Batch WAV→BNK Converter (Pro Edition)"
 
 # --- Logger ---
 class Logger:
     def __init__(self, gui_append=None, log_file_path=None):
         self.gui_append = gui_append
+        self.path = log_file_path
         self._fh = open(log_file_path, "a", encoding="utf-8") if log_file_path else None
         self._lock = threading.Lock()
 
@@ -81,7 +125,14 @@ def discover_windows_console():
 
 # --- Worker ---
 class WwiseBatchWorker:
-    def __init__(self, console, project, language, soundbank, object_root, wavs, platforms, output_dir, create_events, event_pattern, auto_bankname, ci_mode, logger):
+    def __init__(self, console, project, language, soundbank, object_root, wavs, platforms, output_dir, create_events, event_pattern, auto_bankname, ci_mode, logger,
+                 normalize_lufs=None, peak_ceiling=-1.0, trim_silence=False, trim_threshold_db=-60.0, trim_tail_ms=50.0,
+                 dedupe=None, near_dupes=None, bank_cache=None, waapi_window=DEFAULT_WINDOW,
+                 events_with_sounds=False, waapi_max_payload=MAX_PAYLOAD_BYTES, waapi_url=None, waapi_server=False,
+                 package_dir=None, package_format='auto', bnk_diff=False, bank_index=False,
+                 id_preflight=False, id_header=None, event_index=False, resume=False,
+                 progress=None, raw_console=False, library=False, library_db=None,
+                 sidecars=False, source_project=None, input_root=None):
         self.console = console
         self.project = project
         self.language = language
@@ -95,6 +146,47 @@ class WwiseBatchWorker:
         self.auto_bankname = auto_bankname
         self.ci_mode = ci_mode
         self.logger = logger
+        self.normalize_lufs = normalize_lufs
+        self.peak_ceiling = peak_ceiling
+        self.gains = {}
+        self.trim_silence = trim_silence
+        self.trim_threshold_db = trim_threshold_db
+        self.trim_tail_ms = trim_tail_ms
+        self.sources = {}
+        self.dedupe = dedupe
+        self.aliases = {}
+        self.near_dupes = near_dupes
+        self.bank_cache = bank_cache
+        self.cache_keys = {}
+        self.saved_keys = {}
+        self.waapi_window = waapi_window
+        self.events_with_sounds = events_with_sounds
+        self.waapi_max_payload = waapi_max_payload
+        self.waapi_url = waapi_url
+        self.waapi_server = waapi_server
+        self._server = None
+        self._client = None
+        self.package_dir = package_dir
+        self.package_format = package_format
+        self.bnk_diff = bnk_diff
+        self.bank_index = bank_index
+        self.id_preflight = id_preflight
+        self.id_header = id_header
+        self.event_index = event_index
+        self.resume = resume
+        self.journal = None
+        self.progress = progress
+        self.raw_console = raw_console
+        self.diagnostics = None
+        self.library = library
+        self.library_db = library_db
+        self.sidecars = sidecars
+        # folder the WAVs were discovered under: sidecar settings are inherited from here down
+        self.input_root = input_root
+        # project is a working copy (WAAPI pool): cache keys and the resume journal follow the user's project
+        self.source_project = source_project or project
+        self.settings = {}
+        self.timings = {}
         self.cancel_flag = threading.Event()
 
     def run(self):
@@ -103,61 +195,580 @@ class WwiseBatchWorker:
                 self.soundbank = Path(self.wavs[0]).parent.name
                 self.logger.write(f"Auto Bank Name set: {self.soundbank}")
 
-            tmp_dir = tempfile.mkdtemp(prefix="wwise_batch_")
-            import_path = os.path.join(tmp_dir, "import.json")
-            with open(import_path, 'w', encoding='utf-8') as f:
-                json.dump(self._build_import_json(), f, indent=4)
-            self.logger.write(f"Import JSON created: {import_path}")
+            if self.dedupe:
+                self._find_duplicates()
+
+            if self.near_dupes:
+                self._find_near_duplicates()
 
-            rc = self._run([self.console, self.project, 'import', '-import-file', import_path])
-            if rc != 0:
-                self.logger.write("ERROR: import failed")
+            if (self.id_preflight or self.id_header) and not self._check_ids():
                 return False
 
+            if self.normalize_lufs is not None:
+                self._analyze_loudness()
+
+            if self.trim_silence:
+                self._trim_silence()
+
+            if self.sidecars:
+                self._resolve_sidecars()
+
+            restored, unrestorable = set(), set()
+            if self.bank_cache:
+                self.cache_keys = self._bank_cache_keys()
+                if all(self.bank_cache.contains(k) for k in self.cache_keys.values()):
+                    for plat in self.platforms:
+                        (restored if self._restore_cached_bank(plat) else unrestorable).add(plat)
+                if unrestorable:
+                    # contains() can answer from a remote HEAD and the fetch or integrity check still fail
+                    self.logger.write(f"Bank cache: restore failed for {', '.join(sorted(unrestorable))}; falling back to local generation")
+                elif restored:
+                    self.logger.write("All banks restored from cache; import and generation skipped.")
+                    if self.bank_index:
+                        self._index_banks()
+                    if self.event_index:
+                        self._build_event_index()
+                    if self.package_dir:
+                        self._package()
+                    return True
+
+            self.journal = self._open_journal()
+
+            t0 = time.time()
+            if self.waapi_server:
+                self._import_waapi(self._build_import_json())
+            elif self.journal.done('import'):
+                self.logger.write("Import already done (resumed)")
+            else:
+                tmp_dir = tempfile.mkdtemp(prefix="wwise_batch_")
+                import_path = os.path.join(tmp_dir, "import.json")
+                with open(import_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._build_import_json(), f, indent=4)
+                self.logger.write(f"Import JSON created: {import_path}")
+
+                rc = self._run([self.console, self.project, 'import', '-import-file', import_path],
+                               self._tracker('import', len(self._import_wavs())))
+                if rc != 0:
+                    self.logger.write("ERROR: import failed")
+                    return False
+                self._checkpoint('import')
+
+            self.timings['import'] = round(time.time() - t0, 2)
+            if self.library:
+                with AudioLibrary(self.library_db, self.logger) as library:
+                    library.mark_imported(self._import_wavs(), self.soundbank)
+
+            if self.settings and not self.journal.done('settings'):
+                if not self._apply_settings():
+                    return False
+                self._checkpoint('settings')
+
             if self.create_events:
+                t0 = time.time()
                 self._create_events()
+                self.timings['events'] = round(time.time() - t0, 2)
+
+            if self.settings and self.create_events and self.events_with_sounds:
+                # events with sounds set the Sounds a second time; make sure the sidecar values survived
+                if not self._verify_settings():
+                    return False
+
+            if self.waapi_server:
+                # keep the project on disk in step with the server before its banks are built
+                self._waapi().call('ak.wwise.core.project.save', {})
+
+            if self.bank_cache:
+                # import and event creation rewrote the work units hashed into the key; the next identical run
+                # starts from this state, so banks are looked up and stored under this key as well
+                self.saved_keys = self._bank_cache_keys()
 
             for plat in self.platforms:
-                args = [self.console, self.project, 'generate-soundbank', '-platform', plat, '-soundbank', self.soundbank]
-                if self.output_dir:
-                    args += ['-outdir', self.output_dir]
-                rc = self._run(args)
+                if self.journal.done(f'generate:{plat}'):
+                    self.logger.write(f"✔ {plat} already built (resumed)")
+                    continue
+                if plat in restored:
+                    continue
+                if self.bank_cache and plat not in unrestorable and self._restore_cached_bank(plat):
+                    continue
+                before = snapshot(self._bank_dir()) if self.bank_cache else None
+                previous = self._keep_previous_banks(plat) if self.bnk_diff else None
+                t0 = time.time()
+                if self.waapi_server:
+                    # the server holds the project open: generate there, never with a second console process
+                    rc = self._generate_waapi(plat)
+                else:
+                    args = [self.console, self.project, 'generate-soundbank', '-platform', plat, '-soundbank', self.soundbank]
+                    if self.output_dir:
+                        args += ['-outdir', self.output_dir]
+                    rc = self._run(args, self._tracker('generate', len(self._import_wavs()), plat))
                 if rc != 0:
                     self.logger.write(f"ERROR: generation failed for {plat}")
+                    if previous:
+                        shutil.rmtree(previous, ignore_errors=True)
                     return False
+                self.timings[f'generate:{plat}'] = round(time.time() - t0, 2)
                 self.logger.write(f"✔ Built {plat}")
+                if self.bank_cache:
+                    produced = changed_files(before, snapshot(self._bank_dir()))
+                    for key in self._plat_cache_keys(plat):
+                        self.bank_cache.store(key, self._bank_dir(), produced)
+                    self.logger.write(f"Bank cache: stored {len(produced)} file(s) for {plat}")
+                if previous:
+                    self._diff_previous_banks(plat, previous)
+                self._checkpoint(f'generate:{plat}')
+
+            if self.bank_index:
+                self._index_banks()
+
+            if self.event_index:
+                self._build_event_index()
 
+            if self.package_dir:
+                self._package()
+
+            self.journal.finish()
             self.logger.write("All done successfully.")
             return True
         except Exception as e:
             self.logger.write(f"Exception: {e}")
             return False
         finally:
+            if self.journal:
+                self.journal.close()
+            self._close_waapi()
+            if self.diagnostics:
+                self._finish_diagnostics()
+            if self.bank_cache:
+                self.bank_cache.save()
+                self.logger.write(f"Bank cache: {self.bank_cache.summary()}")
             self.logger.close()
 
+    def _find_duplicates(self):
+        t0 = time.time()
+        groups = find_duplicates(self.wavs, logger=self.logger)
+        report = write_report(groups, os.path.join(self._report_dir(), 'DuplicateReport.json'))
+        self.logger.write(f"Dedupe: {report['duplicate_files']} duplicate file(s) in {len(groups)} group(s), "
+                          f"{report['wasted_bytes'] / 1048576.0:.1f} MB ({time.time() - t0:.1f}s)")
+        if self.dedupe == 'merge':
+            # duplicates are not imported; their events target the canonical Sound instead
+            self.aliases = alias_map(groups)
+
+    def _find_near_duplicates(self):
+        t0 = time.time()
+        clusters = FingerprintIndex(logger=self.logger).clusters(self._import_wavs())
+        path = os.path.join(self._report_dir(), 'NearDuplicateReport.json')
+        report = write_near_dupe_report(clusters, path, include_plan=True)
+        self.logger.write(f"Near-duplicates: {report['near_duplicate_files']} file(s) in {len(clusters)} cluster(s) -> {path} ({time.time() - t0:.1f}s)")
+        if self.near_dupes == 'merge':
+            self.aliases.update(merge_plan(clusters))
+            self.aliases = self._resolve_aliases(self.aliases)
+            assert set(self.aliases.values()) <= set(self._import_wavs()), "every alias must target an imported file"
+
+    @staticmethod
+    def _resolve_aliases(aliases):
+        """Point every alias at its final canonical file (an exact duplicate's canonical may itself be a near-duplicate)."""
+        resolved = {}
+        for dup in aliases:
+            target, seen = aliases[dup], {dup}
+            while target in aliases and target not in seen:
+                seen.add(target)
+                target = aliases[target]
+            resolved[dup] = target
+        return resolved
+
+    def _open_journal(self):
+        """Checkpoint journal of this run; with --resume, completed units are skipped if the inputs are unchanged."""
+        digests = DigestCache()
+        files = sorted([self._object_path(w), digests.digest(self.sources.get(w, w)), self.gains.get(w, 0)] for w in self._import_wavs())
+        digests.save()
+        inputs = inputs_digest({'files': files, 'events': self.event_pattern if self.create_events else None,
+                                'with_sounds': self.events_with_sounds, 'soundbank': self.soundbank, 'language': self.language,
+                                'waapi_server': bool(self.waapi_server), 'max_payload': self.waapi_max_payload,
+                                **({'settings': self._settings_key()} if self.settings else {})})
+        key = journal_key(os.path.abspath(self.source_project), self.soundbank, self.output_dir or '')
+        return RunJournal(key, inputs, self.resume, logger=self.logger)
+
+    def _checkpoint(self, unit, **info):
+        if self.waapi_server and not unit.startswith('generate:'):
+            # the managed server holds the project in memory; save before recording the unit as done
+            self._waapi().call('ak.wwise.core.project.save', {})
+        self.journal.mark(unit, **info)
+
+    def _check_ids(self):
+        """Short-ID pre-flight. False when --id-preflight finds a hash collision."""
+        t0 = time.time()
+        planned = planned_names(self.wavs, self.event_pattern if self.create_events else None, self.soundbank, aliases=self.aliases)
+        index_path = os.path.join(self._report_dir(), INDEX_NAME)
+        known = {}
+        if os.path.isfile(index_path):
+            with SoundbanksIndex(index_path) as index:
+                known = index.known_names()
+        result = preflight(planned, known)
+        with open(os.path.join(self._report_dir(), 'IdReport.json'), 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        for d in result['duplicates']:
+            self.logger.write(f"WARNING: {d['kind']} {d['name']} planned {len(d['sources'])} times: {', '.join(Path(s).name for s in d['sources'])}")
+        for c in result['collisions']:
+            self.logger.write(f"{'ERROR' if self.id_preflight else 'WARNING'}: short ID {c['id']} shared by "
+                              + ", ".join(f"{n['kind']} {n['name']}" for n in c['names']))
+        if self.id_header:
+            write_id_header(result, self.id_header)
+            self.logger.write(f"ID header written: {self.id_header}")
+        self.logger.write(f"ID pre-flight: {len(result['ids'])} name(s), {len(result['duplicates'])} duplicate(s), "
+                          f"{len(result['collisions'])} collision(s) ({time.time() - t0:.2f}s)")
+        return not (self.id_preflight and result['collisions'])
+
+    def _report_dir(self):
+        d = self.output_dir or os.path.join(Path(self.project).parent, 'GeneratedSoundBanks')
+        os.makedirs(d, exist_ok=True)
+        return d
+
+    def _import_wavs(self):
+        return [w for w in self.wavs if w not in self.aliases]
+
+    def _object_path(self, w):
+        return f"{self.object_root}\\{Path(self.aliases.get(w, w)).stem}"
+
+    def _bank_dir(self):
+        return self.output_dir or os.path.join(Path(self.project).parent, 'GeneratedSoundBanks')
+
+    def _bank_cache_keys(self):
+        digests = DigestCache()
+        files = sorted([self._object_path(w), digests.digest(self.sources.get(w, w)), self.gains.get(w, 0)] for w in self._import_wavs())
+        units = work_unit_digests(self.source_project, digests.digest)
+        digests.save()
+        events = sorted(self.event_pattern.replace('{name}', Path(w).stem) for w in self.wavs) if self.create_events else []
+        common = {'files': files, 'events': events, 'project': file_digest(self.source_project), 'work_units': units, 'soundbank': self.soundbank,
+                  'language': self.language, 'console': console_version(self.console), 'outdir': bool(self.output_dir)}
+        if self.settings:
+            # streaming, conversion etc. change the banks
+            common['settings'] = self._settings_key()
+        return {plat: cache_key(dict(common, platform=plat)) for plat in self.platforms}
+
+    def _plat_cache_keys(self, plat):
+        """The platform's key from before the import, then the one from after it when they differ."""
+        keys = [self.cache_keys[plat]]
+        if self.saved_keys.get(plat, keys[0]) != keys[0]:
+            keys.append(self.saved_keys[plat])
+        return keys
+
+    def _restore_cached_bank(self, plat):
+        keys = self._plat_cache_keys(plat)
+        key = next((k for k in keys[1:] if self.bank_cache.contains(k)), keys[0])
+        restored = self.bank_cache.restore(key, self._bank_dir())
+        if restored is None:
+            return False
+        self.logger.write(f"✔ Restored {plat} from bank cache ({len(restored)} file(s))")
+        return True
+
+    def _keep_previous_banks(self, plat):
+        """Copy the platform's current .bnk files aside before generation overwrites them; None on a first build."""
+        root = Path(self._bank_dir()) / plat
+        banks = list(root.rglob('*.bnk')) if root.is_dir() else []
+        if not banks:
+            return None
+        keep = tempfile.mkdtemp(prefix="wwise_bnkdiff_")
+        for b in banks:
+            dest = Path(keep) / b.relative_to(root)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(b, dest)
+        return keep
+
+    def _diff_previous_banks(self, plat, previous):
+        t0 = time.time()
+        try:
+            reports = diff_dirs(previous, os.path.join(self._bank_dir(), plat))
+            changed = {rel: r for rel, r in reports.items() if not r.get('identical')}
+            for rel, r in changed.items():
+                self.logger.write(f"Bank diff {plat}/{rel}: {diff_summary(r)}")
+            path = os.path.join(self._report_dir(), f'{plat}_BankDiffReport.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(reports, f, indent=2)
+            self.logger.write(f"Bank diff {plat}: {len(changed)} of {len(reports)} bank(s) changed -> {path} ({time.time() - t0:.2f}s)")
+        except Exception as e:
+            self.logger.write(f"Bank diff {plat} failed: {e}")
+        finally:
+            shutil.rmtree(previous, ignore_errors=True)
+
+    def _index_banks(self):
+        t0 = time.time()
+        path = os.path.join(self._report_dir(), INDEX_NAME)
+        try:
+            with SoundbanksIndex(path, self.logger) as index:
+                results = index.update(self._bank_dir(), self.platforms)
+        except Exception as e:
+            self.logger.write(f"Bank index failed: {e}")
+            return
+        for plat, r in results.items():
+            if r is not None:
+                self.logger.write(f"Bank index {plat}: {r['banks']} bank(s), {r['updated']} re-indexed, {r['removed']} removed")
+        self.timings['index'] = round(time.time() - t0, 2)
+        self.logger.write(f"Bank index -> {path} ({time.time() - t0:.2f}s)")
+
+    def _build_event_index(self):
+        t0 = time.time()
+        events = None
+        if self.create_events:
+            # only the events this run created, each with the file its Sound was imported from
+            events = {self.event_pattern.replace('{name}', Path(w).stem): Path(self.sources.get(self.aliases.get(w, w), self.aliases.get(w, w))).name
+                      for w in self.wavs}
+        for plat in self.platforms:
+            try:
+                path, rebuilt = build_event_index(os.path.join(self._bank_dir(), plat), events=events)
+            except Exception as e:
+                self.logger.write(f"Event index {plat} failed: {e}")
+                continue
+            self.logger.write(f"Event index {plat}: {'written' if rebuilt else 'unchanged'} {path}")
+        self.timings['event_index'] = round(time.time() - t0, 2)
+
+    def _package(self):
+        t0 = time.time()
+        Packager(self.package_dir, self.package_format, logger=self.logger).package_all(self._bank_dir(), self.platforms)
+        self.timings['package'] = round(time.time() - t0, 2)
+
+    def _analyze_loudness(self):
+        t0 = time.time()
+        self.gains = LoudnessAnalyzer(logger=self.logger).gains(self._import_wavs(), self.normalize_lufs, self.peak_ceiling)
+        self.logger.write(f"Loudness normalization to {self.normalize_lufs} LUFS computed for {len(self.gains)} file(s) in {time.time() - t0:.1f}s")
+
+    def _trim_silence(self):
+        t0 = time.time()
+        trimmer = SilenceTrimmer(self.trim_threshold_db, self.trim_tail_ms, logger=self.logger)
+        self.sources = trimmer.trim_many(self._import_wavs())
+        self.logger.write(f"Silence trim: {trimmer.trimmed} new trimmed file(s), {trimmer.saved_bytes / 1048576.0:.1f} MB removed in {time.time() - t0:.1f}s")
+
     def _build_import_json(self):
-        files = [{"AudioFile": os.path.abspath(w), "ObjectPath": f"{self.object_root}\\{Path(w).stem}"} for w in self.wavs]
+        files = []
+        for w in self._import_wavs():
+            # object names always come from the original file, the audio may come from the trim cache
+            entry = {"AudioFile": os.path.abspath(self.sources.get(w, w)), "ObjectPath": self._object_path(w)}
+            if self.gains.get(w):
+                # normalization is a Volume offset on the Sound object, the WAV is left untouched
+                entry["@Volume"] = self.gains[w]
+            files.append(entry)
         return {"ImportOperation": {"ImportLocation": "Actor-Mixer Hierarchy", "ImportLanguage": self.language, "AudioFiles": files}}
 
-    def _create_events(self):
-        if WaapiClient is None:
-            self.logger.write("WAAPI not available; skip event creation.")
-            return
+    def _resolve_sidecars(self):
+        t0 = time.time()
+        root = self.input_root
+        if not root:
+            roots = {os.path.dirname(os.path.abspath(w)) for w in self._import_wavs()}
+            root = os.path.commonpath(list(roots)) if roots else '.'
+        resolver = SidecarResolver(root, logger=self.logger)
+        self.settings = resolver.resolve_all(self._import_wavs())
+        for w, props in self.settings.items():
+            if '@Volume' in props and self.gains.get(w):
+                # a sidecar volume is a trim on top of the loudness normalization
+                props['@Volume'] = round(props['@Volume'] + self.gains[w], 2)
+        self.logger.write(f"Sidecars: settings for {len(self.settings)} of {len(self._import_wavs())} file(s), "
+                          f"{resolver.files_read} sidecar file(s) read ({time.time() - t0:.2f}s)")
+
+    def _settings_key(self):
+        return sorted([self._object_path(w), sorted(props.items())] for w, props in self.settings.items())
+
+    def _apply_settings(self):
+        """Set the sidecar properties on the imported Sounds in size-capped object.set payloads."""
+        t0 = time.time()
         try:
-            with WaapiClient() as client:
-                for w in self.wavs:
-                    name = Path(w).stem
-                    evt_name = self.event_pattern.replace('{name}', name)
-                    obj_path = f"{self.object_root}\\{name}"
-                    try:
-                        client.call('ak.wwise.core.object.create', {'parent': 'Events', 'type': 'Event', 'name': evt_name, 'onNameConflict': 'merge'})
-                        self.logger.write(f"Event created: {evt_name}")
-                    except Exception as e:
-                        self.logger.write(f"Event failed: {evt_name} -> {e}")
+            client = self._waapi()
         except Exception as e:
-            self.logger.write(f"WAAPI connection failed: {e}")
+            self.logger.write(f"ERROR: WAAPI connection failed: {e}; cannot apply sidecar settings")
+            return False
+        builder = EventBuilder(client, max_bytes=self.waapi_max_payload, window=self.waapi_window, logger=self.logger)
+        props = {}
+        for w, values in self.settings.items():
+            props.setdefault(self._object_path(w), {}).update(values)
+        failed = {path: error for path, error in builder.set_properties(props).items() if error}
+        for path, error in sorted(failed.items()):
+            self.logger.write(f"Settings failed: {path} -> {error}")
+        self.logger.write(f"Sidecars: {len(props) - len(failed)} object(s) updated, {len(failed)} failed ({time.time() - t0:.1f}s)")
+        self.timings['settings'] = round(time.time() - t0, 2)
+        return not failed
+
+    def _verify_settings(self):
+        """Read the scalar sidecar properties back and log the Sounds whose values differ (e.g. @Volume != gain + sidecar)."""
+        expected = {}
+        for w, values in self.settings.items():
+            scalars = {k: v for k, v in values.items() if isinstance(v, (bool, int, float))}
+            if scalars:
+                expected.setdefault(self._object_path(w), {}).update(scalars)
+        if not expected:
+            return True
+        names = sorted({k for values in expected.values() for k in values})
+        try:
+            builder = EventBuilder(self._waapi(), window=self.waapi_window, logger=self.logger)
+            actual = builder.get_properties(expected, names)
+        except Exception as e:
+            self.logger.write(f"Settings check skipped: {e}")
+            return True
+        wrong = {}
+        for path, values in expected.items():
+            if path not in actual:
+                continue
+            got = actual[path]
+            for k, v in values.items():
+                if got.get(k) is None or (abs(got[k] - v) > 0.01 if isinstance(v, float) else got[k] != v):
+                    wrong.setdefault(path, []).append(f"{k}={got.get(k)} (expected {v})")
+        for path, problems in sorted(wrong.items()):
+            self.logger.write(f"Settings check: {path}: {', '.join(problems)}")
+        if wrong:
+            self.logger.write(f"ERROR: {len(wrong)} of {len(expected)} Sound(s) do not have their sidecar settings")
+        else:
+            self.logger.write(f"Settings check: {len(expected)} Sound(s) as configured")
+        return not wrong
+
+    def _connect_waapi(self, url):
+        try:
+            return PipelinedWaapiClient(url)
+        except Exception as e:
+            if WaapiClient is None:
+                raise
+            # fall back to the blocking client; WaapiBatch spreads its calls over a thread pool
+            self.logger.write(f"Pipelined WAAPI client unavailable ({e}); using the blocking client")
+        return WaapiClient(url)
+
+    def _waapi(self):
+        """WAAPI connection shared by every stage of the run; starts the managed server on first use."""
+        if self._client is None:
+            url = self.waapi_url or DEFAULT_WAAPI_URL
+            if self.waapi_server:
+                if self._server is None:
+                    # True: a server owned by this run; otherwise an already running one (e.g. a pool lease)
+                    self._server = WaapiServer(self.console, self.project, logger=self.logger) if self.waapi_server is True else self.waapi_server
+                url = self._server.start().url
+            self._client = self._connect_waapi(url)
+        return self._client
+
+    def _close_waapi(self):
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.disconnect()
+            except Exception:
+                pass
+        if self._server is not None and self.waapi_server is True:
+            self._server.stop()
+        self._server = None
+
+    def _import_waapi(self, data):
+        t0 = time.time()
+        imports = []
+        for e in data["ImportOperation"]["AudioFiles"]:
+            entry = {"audioFile": e["AudioFile"], "objectPath": e["ObjectPath"]}
+            entry.update({k: v for k, v in e.items() if k.startswith('@')})
+            imports.append((e["ObjectPath"], entry))
+        requests = [('ak.wwise.core.audio.import', {"importOperation": "useExisting", "default": {"importLanguage": self.language},
+                                                    "imports": [i for _, i in chunk]}, f'import:{n}')
+                    for n, chunk in enumerate(chunk_objects(imports, self.waapi_max_payload))]
+        pending = [r for r in requests if not self.journal.done(r[2])]
+        if len(pending) < len(requests):
+            self.logger.write(f"Import: {len(requests) - len(pending)} of {len(requests)} chunk(s) already done (resumed)")
+        # imports into one project are applied one payload at a time, each checkpointed once it landed
+        batch = WaapiBatch(self._waapi(), 1, self.logger)
+        tracker = self._tracker('import', sum(len(r[1]["imports"]) for r in pending))
+        try:
+            for request in pending:
+                item = batch.run([request])[0]
+                if not item.ok:
+                    raise RuntimeError(f"WAAPI import failed: {item.error}")
+                self._checkpoint(item.tag)
+                tracker.advance(len(request[1]["imports"]))
+        finally:
+            batch.close()
+        self.logger.write(f"Imported {len(imports)} file(s) over WAAPI in {len(pending)} call(s) ({time.time() - t0:.1f}s)")
 
-    def _run(self, cmd):
+    def _generate_waapi(self, plat):
+        tracker = self._tracker('generate', 1, plat)
+        try:
+            # one long call: a large bank can take far longer than the default reply timeout
+            batch = WaapiBatch(self._waapi(), 1, timeout=WAAPI_GENERATE_TIMEOUT)
+            try:
+                item = batch.run([('ak.wwise.core.soundbank.generate', {"soundbanks": [{"name": self.soundbank}], "platforms": [plat],
+                                                                        "writeToDisk": True}, plat)])[0]
+            finally:
+                batch.close()
+            if not item.ok:
+                raise item.error
+            if self.output_dir:
+                self._copy_waapi_banks(plat)
+        except Exception as e:
+            self.logger.write(f"WAAPI generation error: {e}")
+            return 1
+        tracker.finish()
+        return 0
+
+    def _copy_waapi_banks(self, plat):
+        """WAAPI writes to the served project's GeneratedSoundBanks; bring the platform's new or changed files to the output folder."""
+        src = os.path.join(Path(self.project).parent, 'GeneratedSoundBanks', plat)
+        dst = os.path.join(self.output_dir, plat)
+        if os.path.abspath(src) == os.path.abspath(dst):
+            return
+        if not os.path.isdir(src):
+            raise RuntimeError(f"no banks written to {src}")
+        # copy2 keeps the mtime, so files copied by an earlier run compare equal and are skipped
+        changed = changed_files(snapshot(dst), snapshot(src))
+        for rel in changed:
+            os.makedirs(os.path.dirname(os.path.join(dst, rel)), exist_ok=True)
+            shutil.copy2(os.path.join(src, rel), os.path.join(dst, rel))
+        self.logger.write(f"Copied {len(changed)} bank file(s) for {plat} to {dst}")
+
+    def _create_events(self):
+        try:
+            client = self._waapi()
+        except Exception as e:
+            self.logger.write(f"WAAPI connection failed: {e}; skip event creation.")
+            return
+        t0 = time.time()
+        specs = []
+        for w in self.wavs:
+            source = self.aliases.get(w, w)
+            gain = self.gains.get(source)
+            # the sidecar settings were already applied; object.set merges, so a bare gain would undo a sidecar
+            # @Volume (which includes the gain) - send the same values again
+            props = dict({"@Volume": gain} if gain else {}, **self.settings.get(source, {}))
+            specs.append(EventSpec(w, self.event_pattern.replace('{name}', Path(w).stem), self._object_path(w), props))
+        builder = EventBuilder(client, max_bytes=self.waapi_max_payload, window=self.waapi_window, logger=self.logger)
+        results = {}
+        batches = [specs[i:i + EVENT_BATCH] for i in range(0, len(specs), EVENT_BATCH)]
+        tracker = self._tracker('events', len(specs))
+        for n, batch in enumerate(batches):
+            if self.journal.done(f'events:{n}'):
+                tracker.advance(len(batch))
+                continue
+            batch_results = builder.create(batch, include_sounds=self.events_with_sounds)
+            results.update(batch_results)
+            self._checkpoint(f'events:{n}', failed=sum(1 for r in batch_results.values() if r['error']))
+            tracker.advance(len(batch))
+        if len(results) < len(specs):
+            self.logger.write(f"Events: {len(specs) - len(results)} file(s) in earlier batches already done (resumed)")
+            if not results:
+                return
+        for w, r in results.items():
+            if r['error']:
+                self.logger.write(f"Event failed: {r['event']} ({Path(w).name}) -> {r['error']}")
+        report = write_event_report(results, os.path.join(self._report_dir(), 'EventReport.json'))
+        self.logger.write(f"Events: {len(results) - len(report['failed'])} ok, {len(report['failed'])} failed ({time.time() - t0:.1f}s)")
+
+    def _tracker(self, stage, total, platform=None):
+        return ProgressTracker(stage, total, platform, self.progress)
+
+    def _diagnostics(self):
+        if self.diagnostics is None:
+            base = self.logger.path[:-4] if self.logger.path and self.logger.path.endswith('.txt') else \
+                os.path.join(self._report_dir(), f'WwiseBatchLog_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}')
+            self.diagnostics = ConsoleDiagnostics(base + '_console.log.gz', self.logger, verbose=self.raw_console)
+        return self.diagnostics
+
+    def _finish_diagnostics(self):
+        d = self.diagnostics
+        d.close()
+        path = d.write_report(os.path.join(self._report_dir(), 'DiagnosticsReport.json'))
+        counts = ", ".join(f"{n} {code}" for code, n in list(d.summary()['codes'].items())[:5])
+        self.logger.write(f"WwiseConsole diagnostics: {d.severity.get('fatal', 0) + d.severity.get('error', 0)} error(s), "
+                          f"{d.severity.get('warning', 0)} warning(s) in {d.lines} line(s)" + (f" ({counts})" if counts else "") +
+                          f"; report {path}, full output {d.raw_path}")
+
+    def _run(self, cmd, tracker=None):
         # On Windows, hide console windows when running WwiseConsole
         creationflags = 0
         if sys.platform.startswith('win'):
@@ -166,9 +777,17 @@ class WwiseBatchWorker:
             except Exception:
                 creationflags = 0
         proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, creationflags=creationflags)
+        diagnostics = self._diagnostics()
+        diagnostics.begin(cmd)
         for line in proc.stdout:
-            self.logger.write(line.strip())
-        return proc.wait()
+            diagnostics.feed(line)
+            if tracker:
+                tracker.feed(line)
+        rc = proc.wait()
+        diagnostics.end(rc)
+        if tracker and rc == 0:
+            tracker.finish()
+        return rc
 
 # --- GUI ---
 class GUI(tk.Tk):
@@ -222,6 +841,9 @@ class GUI(tk.Tk):
         ttk.Button(e, text='Load Profile', command=self._load_profile).pack(side='right')
 
         self.log = tk.Text(f, height=15); self.log.pack(fill='both', expand=True, pady=6)
+        self.progress_value = tk.DoubleVar(); self.progress_text = tk.StringVar()
+        ttk.Progressbar(f, variable=self.progress_value, maximum=100).pack(fill='x')
+        ttk.Label(f, textvariable=self.progress_text).pack(anchor='w')
         ttk.Button(f, text='Run', command=self._run).pack()
 
     def _browse_console(self):
@@ -240,6 +862,10 @@ class GUI(tk.Tk):
     def _append_log(self, text):
         self.log.insert('end', text+'\n'); self.log.see('end')
 
+    def _show_progress(self, event):
+        # called from the worker thread; widgets are only touched on the Tk thread
+        self.after(0, lambda: [self.progress_value.set(event.fraction * 100), self.progress_text.set(str(event))])
+
     def _save_profile(self):
         d = {
             'console': self.console.get(), 'project': self.project.get(), 'input_dir': self.input_dir.get(), 'output_dir': self.output_dir.get(),
@@ -274,7 +900,7 @@ class GUI(tk.Tk):
             os.makedirs(out,exist_ok=True)
             logpath=os.path.join(out,f'WwiseBatchLog_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.txt')
         logger=Logger(self._append_log,logpath)
-        w=WwiseBatchWorker(self.console.get(),self.project.get(),self.language.get(),self.soundbank.get(),self.object_root.get(),wavs,plats,outdir,self.create_events.get(),self.event_pattern.get(),self.auto_bankname.get(),self.ci_mode.get(),logger)
+        w=WwiseBatchWorker(self.console.get(),self.project.get(),self.language.get(),self.soundbank.get(),self.object_root.get(),wavs,plats,outdir,self.create_events.get(),self.event_pattern.get(),self.auto_bankname.get(),self.ci_mode.get(),logger,progress=self._show_progress)
         threading.Thread(target=lambda:[w.run(),messagebox.showinfo('Done','Process finished')]).start()
 
 # --- Entry ---
@@ -282,18 +908,55 @@ def main():
     if len(sys.argv)>1 and '--ci' in sys.argv:
         parser = argparse.ArgumentParser()
         parser.add_argument('--ci', action='store_true')
+        parser.add_argument('--manifest', default=None, help='Build every job of a batch manifest (see wwise_manifest.py)')
+        parser.add_argument('--max-parallel', type=int, default=None, help='Concurrent manifest jobs')
         parser.add_argument('--console')
         parser.add_argument('--project')
         parser.add_argument('--input')
         parser.add_argument('--output')
         parser.add_argument('--platforms', nargs='+', default=DEFAULT_PLATFORMS)
-        parser.add_argument('--soundbank', default='AutoBank')
+        parser.add_argument('--soundbank', default=None, help='Bank name (default: input folder name)')
         parser.add_argument('--language', default=DEFAULT_LANGUAGE)
         parser.add_argument('--object-root', default=DEFAULT_OBJECT_ROOT)
         parser.add_argument('--event-pattern', default=DEFAULT_EVENT_PATTERN)
         parser.add_argument('--create-events', action='store_true')
+        parser.add_argument('--normalize-lufs', type=float, default=None, help='Write a Volume offset reaching this integrated loudness')
+        parser.add_argument('--peak-ceiling', type=float, default=-1.0, help='Max true peak (dBTP) after normalization')
+        parser.add_argument('--trim-silence', action='store_true', help='Import copies with leading/trailing silence removed')
+        parser.add_argument('--trim-threshold-db', type=float, default=-60.0)
+        parser.add_argument('--trim-tail-ms', type=float, default=50.0)
+        parser.add_argument('--dedupe', choices=['report', 'merge'], default=None, help='Detect identical WAVs; merge imports them once')
+        parser.add_argument('--near-dupes', choices=['report', 'merge'], default=None, help='Detect near-identical sounds; merge applies the merge plan')
+        parser.add_argument('--bank-cache', action='store_true', help='Restore banks from the local cache when inputs are unchanged')
+        parser.add_argument('--bank-cache-dir', default=None)
+        parser.add_argument('--bank-cache-gb', type=float, default=10.0, help='Cache size limit before LRU eviction')
+        parser.add_argument('--bank-cache-url', default=None, help='Shared cache server, e.g. http://cache-host:8765')
+        parser.add_argument('--bank-cache-timeout', type=float, default=5.0, help='Seconds before falling back to local generation')
+        parser.add_argument('--waapi-window', type=int, default=DEFAULT_WINDOW, help='WAAPI calls kept in flight while creating events')
+        parser.add_argument('--waapi-max-payload-kb', type=int, default=MAX_PAYLOAD_BYTES // 1024, help='Size cap of one object.set payload')
+        parser.add_argument('--package', default=None, help='Write per-platform archives + checksum manifests to this folder')
+        parser.add_argument('--package-format', choices=['auto', 'zst', 'xz', 'zip'], default='auto', help='auto: zstd if installed, else xz')
+        parser.add_argument('--bnk-diff', action='store_true', help='Diff every rebuilt bank against the previous build (HIRC/media/names)')
+        parser.add_argument('--bank-index', action='store_true', help=f'Index SoundbanksInfo into <output>/{INDEX_NAME} (query with wwise_bankinfo.py)')
+        parser.add_argument('--id-preflight', action='store_true', help='Stop before import when planned names collide on their Wwise short ID')
+        parser.add_argument('--id-header', default=None, help='Write the event/bank short IDs as a C++ header (or JSON for .json)')
+        parser.add_argument('--event-index', action='store_true', help='Write <output>/<platform>/EventIndex.bin for the game client (wwise_eventindex.py)')
+        parser.add_argument('--resume', action='store_true', help='Continue an interrupted run from its checkpoint journal (inputs must be unchanged)')
+        parser.add_argument('--raw-console', action='store_true', help='Write every WwiseConsole line to the log (default: warnings/errors only, full output in *_console.log.gz)')
+        parser.add_argument('--library', action='store_true', help='Discover WAVs through the incremental SQLite library index and record imports in it')
+        parser.add_argument('--library-db', default=None, help='Library database (default: library.db in the tool cache)')
+        parser.add_argument('--select', default=None, help='Library query, e.g. "channels=2 duration>10 under=ambience" (implies --library)')
+        parser.add_argument('--sidecars', action='store_true', help='Apply per-sound settings from wwise_settings.json folder rules and <name>.wav.json sidecars (needs WAAPI)')
+        parser.add_argument('--progress-interval', type=float, default=5.0, help='Seconds between progress lines per stage')
+        parser.add_argument('--waapi-url', default=None, help=f'WAAPI endpoint of a running Wwise (default {DEFAULT_WAAPI_URL})')
+        parser.add_argument('--waapi-server', action='store_true', help='Start a headless WwiseConsole waapi-server for this run and use it for all stages')
+        parser.add_argument('--events-with-sounds', action='store_true', help='Also create/update the Sound objects (with their Volume) in the object.set payloads')
         args = parser.parse_args()
 
+        if args.manifest:
+            from wwise_manifest import run_manifest
+            sys.exit(run_manifest(args.manifest, args.max_parallel))
+
         # Console autodiscovery on Windows if not provided
         console = args.console
         if not console and sys.platform.startswith('win'):
@@ -303,14 +966,36 @@ def main():
             print('ERROR: Cannot find valid WwiseConsole.exe. Please provide --console or install Wwise.')
             sys.exit(2)
 
-        wavs = [os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith('.wav')]
+        args.library = args.library or args.select is not None
+        if args.library:
+            try:
+                wavs = discover_library(args.input, args.select, args.library_db, Logger(None))
+            except QueryError as e:
+                print(f'ERROR: --select: {e}')
+                sys.exit(2)
+        else:
+            wavs = [os.path.join(r, f) for r, _, fs in os.walk(args.input) for f in fs if f.lower().endswith('.wav')]
         if not wavs:
-            print('ERROR: No WAV files found in input')
+            print('ERROR: No WAV files found in input' + (' matching --select' if args.select else ''))
             sys.exit(3)
 
         logpath = os.path.join(args.output or Path(args.project).parent, 'WwiseBatchLog_CI.txt')
         logger = Logger(None, logpath)
-        w = WwiseBatchWorker(console, args.project, args.language, args.soundbank, args.object_root, wavs, args.platforms, args.output, args.create_events, args.event_pattern, True, logger)
+        bank_cache = None
+        if args.bank_cache or args.bank_cache_url:
+            remote = RemoteBankCache(args.bank_cache_url, args.bank_cache_timeout) if args.bank_cache_url else None
+            bank_cache = BankCache(args.bank_cache_dir, int(args.bank_cache_gb * 1024 ** 3), logger, remote)
+        w = WwiseBatchWorker(console, args.project, args.language, args.soundbank or 'AutoBank', args.object_root, wavs, args.platforms, args.output, args.create_events, args.event_pattern, args.soundbank is None, True, logger,
+                             normalize_lufs=args.normalize_lufs, peak_ceiling=args.peak_ceiling,
+                             trim_silence=args.trim_silence, trim_threshold_db=args.trim_threshold_db, trim_tail_ms=args.trim_tail_ms,
+                             dedupe=args.dedupe, near_dupes=args.near_dupes, bank_cache=bank_cache,
+                             waapi_window=args.waapi_window, events_with_sounds=args.events_with_sounds,
+                             waapi_max_payload=args.waapi_max_payload_kb * 1024, waapi_url=args.waapi_url, waapi_server=args.waapi_server,
+                             package_dir=args.package, package_format=args.package_format, bnk_diff=args.bnk_diff, bank_index=args.bank_index,
+                             id_preflight=args.id_preflight, id_header=args.id_header, event_index=args.event_index,
+                             resume=args.resume, progress=ProgressPrinter(logger.write, args.progress_interval),
+                             raw_console=args.raw_console, library=args.library, library_db=args.library_db,
+                             sidecars=args.sidecars, input_root=args.input)
         ok = w.run()
         sys.exit(0 if ok else 1)
     else:
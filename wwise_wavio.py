@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Minimal WAV reader for the analysis stages.
+
+Parses the RIFF chunk layout (fmt / data) from the header only and maps the sample data with
+numpy.memmap so analysis never copies a whole file into memory.
+Supported: PCM 16/24/32-bit, IEEE float 32/64-bit, WAVE_FORMAT_EXTENSIBLE; RIFF, and RF64 / BW64 (files
+over 4 GB, 64-bit sizes from the ds64 chunk).
+
+- map_raw(): the data chunk in the file's own sample type, no conversion
+- iter_blocks(): float32 blocks of a bounded number of frames, converted on demand (24-bit PCM is
+  unpacked a block at a time), for files too long to convert at once
+- data_view(): the data chunk bytes as a memoryview over mmap (hashing, copying)
+"""
+
+import mmap
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+SIZE_IN_DS64 = 0xFFFFFFFF   # RF64/BW64: the real size is in the ds64 chunk
+BLOCK_FRAMES = 1 << 18
+
+
+class WavFormatError(Exception):
+    pass
+
+
+class WavInfo:
+    def __init__(self, path, format_tag, channels, sample_rate, bits, data_offset, data_size, fmt_offset=None, fmt_size=0,
+                 container="RIFF"):
+        self.path = str(path)
+        self.format_tag = format_tag
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.bits = bits
+        self.data_offset = data_offset
+        self.data_size = data_size
+        self.fmt_offset = fmt_offset
+        self.fmt_size = fmt_size
+        self.container = container
+
+    @property
+    def block_align(self):
+        return self.channels * self.bits // 8
+
+    @property
+    def frames(self):
+        return self.data_size // self.block_align if self.block_align else 0
+
+    @property
+    def duration(self):
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def is_float(self):
+        return self.format_tag == WAVE_FORMAT_IEEE_FLOAT
+
+    def fmt_key(self):
+        """Tuple identifying the sample format (two files with equal keys have comparable data chunks)."""
+        return (self.format_tag, self.channels, self.sample_rate, self.bits)
+
+
+def read_info(path):
+    """Parse the RIFF header of a WAV file and return a WavInfo. Raises WavFormatError."""
+    path = Path(path)
+    fmt = None
+    sizes64 = {}
+    with path.open("rb") as f:
+        head = f.read(12)
+        if len(head) < 12 or head[:4] not in (b"RIFF", b"RF64", b"BW64") or head[8:12] != b"WAVE":
+            raise WavFormatError(f"Not a RIFF/WAVE file: {path}")
+        container = head[:4].decode("ascii")
+        pos = 12
+        while True:
+            f.seek(pos)
+            hdr = f.read(8)
+            if len(hdr) < 8:
+                break
+            cid, size = struct.unpack("<4sI", hdr)
+            if size == SIZE_IN_DS64 and container != "RIFF":
+                size = sizes64.get(cid, size)
+            if cid == b"ds64":
+                raw = f.read(size)
+                if len(raw) < 28:
+                    raise WavFormatError(f"Truncated ds64 chunk: {path}")
+                _, sizes64[b"data"], _, table = struct.unpack("<QQQI", raw[:28])
+                for i in range(min(table, (len(raw) - 28) // 12)):
+                    tid, tsize = struct.unpack_from("<4sQ", raw, 28 + 12 * i)
+                    sizes64[tid] = tsize
+            elif cid == b"fmt ":
+                raw = f.read(min(size, 40))
+                tag, ch, sr, _, _, bits = struct.unpack("<HHIIHH", raw[:16])
+                if tag == WAVE_FORMAT_EXTENSIBLE and len(raw) >= 26:
+                    tag = struct.unpack("<H", raw[24:26])[0]
+                fmt = (tag, ch, sr, bits, pos + 8, size)
+            elif cid == b"data":
+                if fmt is None:
+                    raise WavFormatError(f"data chunk before fmt chunk: {path}")
+                file_size = path.stat().st_size
+                size = min(size, file_size - pos - 8)
+                return WavInfo(path, fmt[0], fmt[1], fmt[2], fmt[3], pos + 8, size, fmt[4], fmt[5], container)
+            pos += 8 + size + (size & 1)
+    raise WavFormatError(f"No data chunk found: {path}")
+
+
+def _dtype(info):
+    if info.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        if info.bits == 32:
+            return np.dtype("<f4")
+        if info.bits == 64:
+            return np.dtype("<f8")
+    elif info.format_tag == WAVE_FORMAT_PCM:
+        if info.bits == 16:
+            return np.dtype("<i2")
+        if info.bits == 32:
+            return np.dtype("<i4")
+        if info.bits == 24:
+            return np.dtype("u1")
+        if info.bits == 8:
+            return np.dtype("u1")
+    raise WavFormatError(f"Unsupported sample format (tag={info.format_tag}, bits={info.bits}): {info.path}")
+
+
+def map_raw(info):
+    """Memory-map the data chunk without converting it.
+
+    Returns an array shaped (frames, channels) in the file's own dtype, or (frames, channels, 3) bytes for 24-bit PCM.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for audio analysis (pip install numpy)")
+    dt = _dtype(info)
+    if info.frames == 0:
+        return np.zeros((0, info.channels, 3) if info.bits == 24 else (0, info.channels), dtype=dt)
+    count = info.frames * info.block_align // dt.itemsize
+    raw = np.memmap(info.path, dtype=dt, mode="r", offset=info.data_offset, shape=(count,))
+    if info.bits == 24 and not info.is_float:
+        return raw.reshape(-1, info.channels, 3)
+    return raw.reshape(-1, info.channels)
+
+
+def _int24(raw):
+    """(..., 3) little-endian bytes -> int32 holding sample << 8 (the bytes land in the top of each word)."""
+    words = np.zeros(raw.shape[:-1] + (4,), dtype=np.uint8)
+    words[..., 1:] = raw
+    return words.view("<i4")[..., 0]
+
+
+def to_float(raw, info):
+    """Convert a slice of map_raw() output to float32 samples in [-1, 1] shaped (frames, channels)."""
+    if info.bits == 24 and not info.is_float:
+        samples = _int24(raw).astype(np.float32)
+        samples *= 1.0 / float(1 << 31)
+        return samples
+    if info.bits == 8 and not info.is_float:
+        return (raw.astype(np.float32) - 128.0) / 128.0
+    if info.is_float:
+        return raw.astype(np.float32, copy=False)
+    return raw.astype(np.float32) / float(1 << (info.bits - 1))
+
+
+def read_samples(path, info=None):
+    """Return (info, samples) with samples a float32 array shaped (frames, channels) in [-1, 1]."""
+    info = info or read_info(path)
+    return info, to_float(map_raw(info), info)
+
+
+def iter_blocks(info, frames=BLOCK_FRAMES, raw=None):
+    """Yield (first_frame, float32 samples shaped (n, channels)) over the data chunk, at most `frames` at a time."""
+    raw = map_raw(info) if raw is None else raw
+    for start in range(0, len(raw), frames):
+        yield start, to_float(raw[start:start + frames], info)
+
+
+@contextmanager
+def data_view(info):
+    """The data chunk bytes as a read-only memoryview over mmap; valid inside the with block only."""
+    if info.data_size == 0:
+        yield memoryview(b"")
+        return
+    with open(info.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)[info.data_offset:info.data_offset + info.data_size]
+        try:
+            yield view
+        finally:
+            view.release()
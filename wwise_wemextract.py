@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+WEM media extraction from generated SoundBanks.
+
+Every DIDX entry of a bank is written to <out>/<bank path without .bnk>/<media id>.wem straight from the
+bank file: os.copy_file_range (kernel-side, reflinks on CoW filesystems) or os.sendfile where available,
+otherwise a single write of the memory-mapped DATA slice. Banks are extracted in parallel.
+
+An entry whose .wem already exists with the same size and SHA-256 is skipped. Media hashes are memoized
+per bank by (size, mtime) and .wem hashes through DigestCache, so re-running on unchanged banks reads
+neither the banks nor the extracted files.
+
+    python wwise_wemextract.py GeneratedSoundBanks/Windows --out Wem
+"""
+
+import os
+import sys
+import errno
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from wwise_bnk import Bank, is_bank
+from wwise_cache import cache_root, DigestCache, JsonStore
+
+# errors meaning "this kernel/filesystem can't do it", not "the copy failed"
+_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def _kernel_copy(src_fd, dst_fd, offset, size):
+    """Copy size bytes at offset with copy_file_range/sendfile. Returns the bytes copied (0 if unsupported)."""
+    done = 0
+    for name in ("copy_file_range", "sendfile"):
+        if not hasattr(os, name) or (name == "sendfile" and not sys.platform.startswith("linux")):
+            continue
+        try:
+            while done < size:
+                if name == "copy_file_range":
+                    n = os.copy_file_range(src_fd, dst_fd, size - done, offset + done)
+                else:
+                    n = os.sendfile(dst_fd, src_fd, offset + done, size - done)
+                if n == 0:
+                    break
+                done += n
+            return done
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            if done:
+                return done
+    return done
+
+
+def write_media(bank, entry, dest):
+    """Write one media entry to dest through a .part file. Returns the copy method used."""
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = str(dest) + ".part"
+    try:
+        with open(tmp, "wb") as f:
+            done = _kernel_copy(bank.fileno(), f.fileno(), entry.offset, entry.size)
+            method = "kernel" if done == entry.size else "mmap"
+            if done < entry.size:
+                f.seek(done)
+                with bank.view(entry.offset + done, entry.size - done) as rest:
+                    f.write(rest)
+        os.replace(tmp, dest)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return method
+
+
+class WemExtractor:
+    def __init__(self, out_dir, workers=None, logger=None, index_path=None):
+        self.out_dir = str(out_dir)
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.logger = logger
+        self.digests = DigestCache()
+        # {bank abspath: {"stamp": [size, mtime_ns], "media": {id: sha256}}}
+        self.index = JsonStore(index_path or cache_root("wem") / "media.json")
+
+    def _log(self, msg):
+        if self.logger:
+            self.logger.write(msg)
+
+    def _media_hashes(self, bank):
+        path = os.path.abspath(bank.path)
+        st = os.stat(path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        hit = self.index.get(path)
+        if hit and hit["stamp"] == stamp:
+            return hit["media"], False
+        media = {}
+        for mid, entry in bank.media.items():
+            with bank.view(entry.offset, entry.size) as v:
+                media[str(mid)] = hashlib.sha256(v).hexdigest()
+        return media, stamp
+
+    def extract_bank(self, path, rel):
+        """Extract one bank to out_dir/rel. Returns {"extracted", "skipped", "bytes", "kernel"}."""
+        stats = {"extracted": 0, "skipped": 0, "bytes": 0, "kernel": 0}
+        target = Path(self.out_dir) / rel
+        with Bank(path) as bank:
+            media, stamp = self._media_hashes(bank)
+            for mid, entry in bank.media.items():
+                dest = target / f"{mid}.wem"
+                if dest.is_file() and dest.stat().st_size == entry.size \
+                        and self.digests.digest(dest) == media.get(str(mid)):
+                    stats["skipped"] += 1
+                    continue
+                if write_media(bank, entry, dest) == "kernel":
+                    stats["kernel"] += 1
+                stats["extracted"] += 1
+                stats["bytes"] += entry.size
+            if stamp:
+                self.index.put(os.path.abspath(path), {"stamp": stamp, "media": media})
+        return stats
+
+    def extract(self, source):
+        """Extract a bank file or every bank under a folder. Returns {bank rel path: stats}."""
+        source = Path(source)
+        if source.is_file():
+            banks = {source.stem: source}
+        else:
+            banks = {p.relative_to(source).with_suffix("").as_posix(): p for p in sorted(source.rglob("*.bnk")) if is_bank(p)}
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {rel: pool.submit(self.extract_bank, path, rel) for rel, path in banks.items()}
+                for rel, fut in futures.items():
+                    try:
+                        results[rel] = fut.result()
+                    except Exception as e:
+                        self._log(f"WEM extract {rel} failed: {e}")
+        finally:
+            self.index.save()
+            self.digests.save()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract the .wem media of SoundBanks")
+    parser.add_argument("source", help="A .bnk file or a folder of banks")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    class _Print:
+        def write(self, msg):
+            print(msg)
+
+    results = WemExtractor(args.out, args.workers, logger=_Print()).extract(args.source)
+    for rel, s in results.items():
+        print(f"{rel}: {s['extracted']} extracted ({s['bytes'] / 1048576.0:.1f} MB, {s['kernel']} in-kernel), {s['skipped']} unchanged")
+
+
+if __name__ == "__main__":
+    main()